@@ -0,0 +1,126 @@
+import datetime
+import io
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import odio  # noqa: E402
+
+
+def timed(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def content_size(buf):
+    with zipfile.ZipFile(io.BytesIO(buf)) as z:
+        return z.getinfo("content.xml").file_size
+
+
+def make_text(paragraphs):
+    f = io.BytesIO()
+    with odio.create_text(f) as txt:
+        for i in range(paragraphs):
+            txt.append(
+                odio.P(
+                    f"Paragraph {i} of the benchmark, with ",
+                    odio.Span("some emphasis", text_style_name="Emphasis"),
+                    " and a little more text after it.",
+                )
+            )
+    return f.getvalue()
+
+
+def bench_extract_text():
+    # Target: extract_text() reads content.xml at 15 MB/s or more, and at least
+    # three times faster than going through parse_text().
+    buf = make_text(20_000)
+    size = content_size(buf)
+    fast, _ = timed(lambda: odio.extract_text(io.BytesIO(buf)))
+    slow, _ = timed(lambda: odio.parse_text(io.BytesIO(buf)))
+    return [
+        ("extract_text", f"{size / fast / 1e6:.1f} MB/s", "15 MB/s"),
+        ("parse_text", f"{size / slow / 1e6:.1f} MB/s", ""),
+        ("extract_text speed-up", f"{slow / fast:.1f}x", "3x"),
+    ]
+
+
+def make_rows(count):
+    return [
+        [
+            i * 0.5,
+            f"Item {i % 100}",
+            datetime.datetime(2015, 6, 30, i % 24),
+            i,
+            i % 3 == 0,
+            0.0,
+            "",
+            "",
+        ]
+        for i in range(count)
+    ]
+
+
+def bench_append_table_schema():
+    # Target: declaring the column types makes append_table() at least 2.5 times
+    # faster, and writes exactly the same content.xml. Both ways pay the same cost
+    # of compressing content.xml, which keeps the speed-up to between 2.6x and 4.4x
+    # in the runs measured so far, against about 5x uncompressed.
+    rows = make_rows(50_000)
+    schema = [float, str, datetime.datetime, int, bool, float, str, str]
+
+    def write(table_schema):
+        f = io.BytesIO()
+        with odio.create_spreadsheet(f) as sheet:
+            sheet.append_table("Bench", rows, table_schema)
+        return f.getvalue()
+
+    slow, slow_buf = timed(lambda: write(None))
+    fast, fast_buf = timed(lambda: write(schema))
+    with zipfile.ZipFile(io.BytesIO(slow_buf)) as z:
+        slow_content = z.read("content.xml")
+    with zipfile.ZipFile(io.BytesIO(fast_buf)) as z:
+        fast_content = z.read("content.xml")
+    return [
+        ("append_table with schema", f"{len(rows) / fast:,.0f} rows/s", ""),
+        ("append_table", f"{len(rows) / slow:,.0f} rows/s", ""),
+        ("append_table schema speed-up", f"{slow / fast:.1f}x", "2.5x"),
+        ("identical content.xml", str(slow_content == fast_content), "True"),
+    ]
+
+
+def bench_small_spreadsheets():
+    # Target: creating a spreadsheet with a single short row takes 3 ms or less,
+    # as the parts that are the same for every package are compressed only once.
+    count = 2_000
+
+    def write():
+        for i in range(count):
+            with odio.create_spreadsheet(io.BytesIO()) as sheet:
+                sheet.append_table("Plan", [["veni", 1.5, i]])
+
+    elapsed, _ = timed(write)
+    return [("small spreadsheets", f"{elapsed / count * 1000:.2f} ms", "3 ms")]
+
+
+BENCHMARKS = [bench_extract_text, bench_append_table_schema, bench_small_spreadsheets]
+
+
+def main():
+    for bench in BENCHMARKS:
+        print(bench.__name__)
+        for name, result, target in bench():
+            print(f"  {name:<30} {result:>14} {target:>14}")
+
+
+if __name__ == "__main__":
+    main()
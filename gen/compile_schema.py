@@ -0,0 +1,380 @@
+# Compiles the RelaxNG schema into the lookup tables of odio/v1_2/schema.py, which
+# are used to validate documents as they're written or read, and into the element
+# classes of odio/text.py. Run it from the root of the repository with:
+#
+#     python gen/compile_schema.py
+#
+# For each element the tables give the child elements and attributes that are
+# allowed, the attributes that are required, whether it can contain text, and the
+# values allowed for attributes that are an enumeration. Where an element is defined
+# more than once, the definitions are merged, so the tables are never stricter than
+# the schema.
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+RNG = "{http://relaxng.org/ns/structure/1.0}"
+
+SCHEMA = Path(__file__).parent / "OpenDocument-schema-v1.2-cd04.rng"
+
+SRC = Path(__file__).parent.parent / "src" / "odio"
+
+SCHEMA_OUTPUT = SRC / "v1_2" / "schema.py"
+
+TEXT_OUTPUT = SRC / "text.py"
+
+LINE_BREAKS_OUTPUT = SRC / "v1_2" / "line_breaks.py"
+
+# The namespaces whose elements are checked. Elements in other namespaces are
+# checked to see if they're allowed where they appear, but their contents aren't.
+CHECKED_PREFIXES = ("meta", "number", "office", "style", "table", "text")
+
+# Marks a set of names that includes anything
+ANY = "*"
+
+# The default attributes of text elements, where they have any
+TEXT_DEFAULTS = {
+    "text:h": {"text_style_name": "Heading 1", "text_outline_level": "1"},
+    "text:p": {"text_style_name": "Text Body"},
+    "text:span": {"text_style_name": "Text Body"},
+}
+
+
+class Pattern:
+    # What a pattern contributes to the element it's in
+    def __init__(self):
+        self.children = set()
+        self.attributes = {}
+        self.required = set()
+        self.text = False
+
+    def add(self, other, required=True):
+        self.children |= other.children
+        for name, values in other.attributes.items():
+            self.add_attribute(name, values)
+        if required:
+            self.required |= other.required
+        self.text = self.text or other.text
+
+    def add_attribute(self, name, values):
+        if name in self.attributes:
+            old = self.attributes[name]
+            if old is None or values is None:
+                self.attributes[name] = None
+            else:
+                self.attributes[name] = old | values
+        else:
+            self.attributes[name] = values
+
+
+class Compiler:
+    def __init__(self, grammar):
+        self.defines = {}
+        for define in grammar.iter(RNG + "define"):
+            self.defines.setdefault(define.get("name"), []).append(define)
+        self.start = grammar.find(RNG + "start")
+        self.patterns = {}
+        self.elements = {}
+
+    def names(self, elem):
+        if elem.get("name") is not None:
+            return [elem.get("name")]
+        names = []
+        for child in elem:
+            if child.tag == RNG + "name":
+                names.append(child.text.strip())
+            elif child.tag in (RNG + "anyName", RNG + "nsName"):
+                names.append(ANY)
+            elif child.tag == RNG + "choice":
+                names.extend(self.names(child))
+        return names
+
+    def define(self, name):
+        # Defines that refer to themselves without an element in between add
+        # nothing more the second time round.
+        try:
+            return self.patterns[name]
+        except KeyError:
+            pass
+        pattern = self.patterns[name] = Pattern()
+        defines = self.defines[name]
+        if any(d.get("combine") == "choice" for d in defines):
+            result = self.choice(defines)
+        else:
+            result = Pattern()
+            for define in defines:
+                result.add(self.group(define))
+        pattern.add(result)
+        return pattern
+
+    def group(self, elem):
+        pattern = Pattern()
+        for child in elem:
+            pattern.add(self.pattern(child))
+        return pattern
+
+    def choice(self, branches):
+        pattern = Pattern()
+        required = None
+        for branch in branches:
+            if branch.tag == RNG + "define":
+                result = self.group(branch)
+            else:
+                result = self.pattern(branch)
+            pattern.add(result, required=False)
+            if required is None:
+                required = set(result.required)
+            else:
+                required &= result.required
+        pattern.required = required or set()
+        return pattern
+
+    def pattern(self, elem):
+        tag = elem.tag[len(RNG) :]
+        if tag in ("group", "interleave", "oneOrMore", "mixed", "list"):
+            pattern = self.group(elem)
+            if tag == "mixed":
+                pattern.text = True
+            return pattern
+        elif tag in ("optional", "zeroOrMore"):
+            pattern = Pattern()
+            pattern.add(self.group(elem), required=False)
+            return pattern
+        elif tag == "choice":
+            return self.choice(list(elem))
+        elif tag == "ref":
+            return self.define(elem.get("name"))
+        elif tag in ("text", "data", "value"):
+            pattern = Pattern()
+            pattern.text = True
+            return pattern
+        elif tag == "element":
+            pattern = Pattern()
+            for name in self.names(elem):
+                pattern.children.add(name)
+                if name != ANY:
+                    self.elements.setdefault(name, []).append(elem)
+            return pattern
+        elif tag == "attribute":
+            pattern = Pattern()
+            values = self.attribute_values(elem)
+            names = self.names(elem)
+            for name in names:
+                pattern.add_attribute(name, values)
+            if len(names) == 1 and names[0] != ANY:
+                pattern.required.add(names[0])
+            return pattern
+        else:
+            return Pattern()
+
+    def attribute_values(self, elem):
+        # The set of values if the attribute is an enumeration, otherwise None
+        values = set()
+        stack = [child for child in elem if child.tag != RNG + "name"]
+        if len(stack) == 0:
+            return None
+        while len(stack) > 0:
+            child = stack.pop()
+            tag = child.tag[len(RNG) :]
+            if tag == "value":
+                values.add(child.text or "")
+            elif tag == "choice":
+                stack.extend(child)
+            elif tag == "ref":
+                for define in self.defines[child.get("name")]:
+                    stack.extend(define)
+            else:
+                return None
+        return frozenset(values)
+
+    def compile(self):
+        roots = sorted(self.pattern(self.start[0]).children)
+        rules = {}
+        done = set()
+        while True:
+            todo = [name for name in self.elements if name not in done]
+            if len(todo) == 0:
+                break
+            for name in todo:
+                done.add(name)
+                content = Pattern()
+                required = None
+                for elem in self.elements[name]:
+                    pattern = self.group(elem)
+                    content.add(pattern, required=False)
+                    if required is None:
+                        required = set(pattern.required)
+                    else:
+                        required &= pattern.required
+                content.required = required
+                if name.split(":")[0] in CHECKED_PREFIXES:
+                    rules[name] = content
+        return roots, rules
+
+
+def _names(names):
+    if ANY in names:
+        return "None"
+    return f"_SETS[{_set_index(names)}]"
+
+
+SETS = {}
+
+
+def _set_index(names):
+    key = tuple(sorted(names))
+    try:
+        return SETS[key]
+    except KeyError:
+        index = SETS[key] = len(SETS)
+        return index
+
+
+def write_schema(roots, rules, prefixes):
+    lines = []
+    for name in sorted(rules):
+        rule = rules[name]
+        values = {k: v for k, v in rule.attributes.items() if v is not None}
+        if len(values) == 0:
+            values_str = "_NO_VALUES"
+        else:
+            values_str = (
+                "{"
+                + ", ".join(
+                    f"{k!r}: _SETS[{_set_index(v)}]" for k, v in sorted(values.items())
+                )
+                + "}"
+            )
+        lines.append(f"    {name!r}: (")
+        lines.append(f"        {_names(rule.children)},")
+        lines.append(f"        {_names(rule.attributes)},")
+        lines.append(f"        _SETS[{_set_index(rule.required)}],")
+        lines.append(f"        {rule.text},")
+        lines.append(f"        {values_str},")
+        lines.append("    ),")
+
+    with open(SCHEMA_OUTPUT, "w", encoding="utf8") as f:
+        f.write(
+            "# Generated from gen/OpenDocument-schema-v1.2-cd04.rng by "
+            "gen/compile_schema.py.\n# Don't edit.\n\n"
+        )
+        f.write("# flake8: noqa\n# fmt: off\n\n")
+        f.write(f"ROOTS = frozenset({tuple(roots)!r})\n\n")
+        f.write(f"PREFIXES = frozenset({tuple(sorted(prefixes))!r})\n\n")
+        f.write(f"CHECKED_PREFIXES = frozenset({CHECKED_PREFIXES!r})\n\n")
+        f.write("_SETS = [\n")
+        for key in SETS:
+            f.write(f"    frozenset({key!r}),\n")
+        f.write("]\n\n")
+        f.write("_NO_VALUES = {}\n\n")
+        f.write(
+            "# Element name: (child elements, attributes, required attributes, text "
+            "allowed,\n# attribute values). A set of names that's None allows any "
+            "name.\n"
+        )
+        f.write("ELEMENTS = {\n")
+        f.write("\n".join(lines))
+        f.write("\n}\n")
+
+
+def _mapping(items):
+    if len(items) == 0:
+        return "MappingProxyType({})"
+    lines = ["MappingProxyType(", "        {"]
+    for k, v in items:
+        line = f'            "{k}": "{v}",'
+        if len(line) > 88:
+            line += "  # noqa: E501"
+        lines.append(line)
+    lines.append("        }")
+    lines.append("    )")
+    return "\n".join(lines)
+
+
+def write_text_classes(rules):
+    names = sorted(name for name in rules if name.startswith("text:"))
+    class_names = {}
+    with open(TEXT_OUTPUT, "w", encoding="utf8") as f:
+        f.write(
+            "# Generated from gen/OpenDocument-schema-v1.2-cd04.rng by "
+            "gen/compile_schema.py.\n# Don't edit.\n\n"
+            "from types import MappingProxyType\n\n"
+            "from odio.common import Element\n"
+        )
+        for name in names:
+            rule = rules[name]
+            local = name.split(":")[1]
+            class_name = "".join(part.capitalize() for part in local.split("-"))
+            class_names[name] = class_name
+            attributes = sorted(
+                (k.replace(":", "_").replace("-", "_"), k)
+                for k in rule.attributes
+                if k != ANY
+            )
+            # Required attributes that can only have one value get it by default
+            defaults = dict(TEXT_DEFAULTS.get(name, {}))
+            for k in sorted(rule.required):
+                values = rule.attributes[k]
+                if values is not None and len(values) == 1:
+                    defaults[k.replace(":", "_").replace("-", "_")] = min(values)
+            qnames = dict(attributes)
+            default_tag = f"<{name}" + "".join(
+                f' {qnames[k]}="{v}"' for k, v in defaults.items()
+            )
+            f.write(f"\n\nclass {class_name}(Element):\n")
+            f.write("    __slots__ = ()\n\n")
+            f.write(f'    NAME = "{name}"\n')
+            f.write(f"    ATTRIBUTES = {_mapping(attributes)}\n")
+            f.write(f"    DEFAULT_ATTRS = {_mapping(defaults.items())}\n")
+            f.write(f'    START_TAG = "<{name}"\n')
+            if '"' in default_tag:
+                f.write(f"    DEFAULT_START_TAG = '{default_tag}'\n")
+            else:
+                f.write(f'    DEFAULT_START_TAG = "{default_tag}"\n')
+            f.write(f'    END_TAG = "</{name}>"\n')
+
+        f.write("\n\n# The classes by the qualified names of their elements\n")
+        f.write("ELEMENTS = {\n")
+        for name in names:
+            f.write(f'    "{name}": {class_names[name]},\n')
+        f.write("}\n")
+
+
+# The line break elements get a module of their own, so that the writer can use
+# them without importing the element classes.
+def write_line_break_elements(rules):
+    names = sorted(name for name in rules if name.startswith("text:"))
+    with open(LINE_BREAKS_OUTPUT, "w", encoding="utf8") as f:
+        f.write(
+            "# Generated from gen/OpenDocument-schema-v1.2-cd04.rng by "
+            "gen/compile_schema.py.\n# Don't edit.\n\n"
+        )
+        f.write("# The elements that can contain a text:line-break\n")
+        f.write("LINE_BREAK_ELEMENTS = frozenset(\n    (\n")
+        for name in names:
+            children = rules[name].children
+            if ANY in children or "text:line-break" in children:
+                f.write(f'        "{name}",\n')
+        f.write("    )\n)\n")
+
+
+def main():
+    grammar = ET.parse(SCHEMA).getroot()
+    compiler = Compiler(grammar)
+    roots, rules = compiler.compile()
+
+    prefixes = set()
+    for name in compiler.elements:
+        prefixes.add(name.split(":")[0])
+    for rule in rules.values():
+        for name in rule.attributes:
+            if name != ANY:
+                prefixes.add(name.split(":")[0])
+
+    write_schema(roots, rules, prefixes)
+    write_text_classes(rules)
+    write_line_break_elements(rules)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,43 @@
-import xml.dom.minidom
-import zipfile
+# The version modules, and the XML and zip machinery they need, are only imported
+# when they're first used, so that 'import odio' stays cheap. So are the other
+# submodules, such as odio.batch, and the text element classes, such as odio.P and
+# odio.List, which are in odio.text.
+def __getattr__(name):
+    if name in ("LimitExceeded", "Limits", "ValidationError"):
+        import odio.v1_2
 
-import odio.v1_1
-import odio.v1_2
-from odio.common import H, P, Span
+        return getattr(odio.v1_2, name)
+    elif name[:1].islower():
+        import importlib
 
+        try:
+            return importlib.import_module(f"odio.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"odio.{name}":
+                raise
+    elif name[:1].isupper():
+        import odio.text
 
-def create_spreadsheet(f, version="1.2", compressed=True):
+        cls = getattr(odio.text, name, None)
+        if isinstance(cls, type) and issubclass(cls, odio.text.Element):
+            return cls
+    raise AttributeError(f"module 'odio' has no attribute '{name}'")
+
+
+def create_spreadsheet(f, version="1.2", compressed=True, flat=False, validate=False):
     if version == "1.1":
+        import odio.v1_1
+
+        if flat or validate:
+            raise Exception(
+                "Flat documents and validation are only available for version '1.2'."
+            )
+
         return odio.v1_1.SpreadsheetWriter(f, compressed)
     elif version == "1.2":
-        return odio.v1_2.SpreadsheetWriter(f, compressed)
+        import odio.v1_2
+
+        return odio.v1_2.SpreadsheetWriter(f, compressed, flat, validate)
     else:
         raise Exception(
             f"The version '{version}' isn't recognized. The valid version strings "
@@ -18,17 +45,24 @@ def create_spreadsheet(f, version="1.2", compressed=True):
         )
 
 
-def parse_spreadsheet(f):
-    with zipfile.ZipFile(f, "r") as z:
-        content = z.read("content.xml")
-    dom = xml.dom.minidom.parseString(content)
+def parse_spreadsheet(f, limits=None):
+    import odio.v1_2
+
+    # Flat documents are read the same way as the content.xml of a package
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    styles = odio.v1_2.StyleIndex()
+    with odio.v1_2.open_content(f, styles, budget) as content:
+        dom = odio.v1_2.parse_dom(content, budget)
     version = dom.documentElement.getAttribute("office:version")
     spreadsheet_elem = dom.getElementsByTagName("office:spreadsheet")[0]
 
     if version == "1.1":
+        import odio.v1_1
+
         return odio.v1_1.SpreadsheetReader(spreadsheet_elem)
     elif version == "1.2":
-        return odio.v1_2.SpreadsheetReader(spreadsheet_elem)
+        styles.read_dom(dom)
+        return odio.v1_2.SpreadsheetReader(spreadsheet_elem, styles, budget)
     else:
         raise Exception(
             "The version '{version}' isn't recognized. The valid version strings "
@@ -49,12 +83,93 @@ class Formula:
     def __eq__(self, other):
         return isinstance(other, Formula) and self.formula == other.formula
 
+    def __hash__(self):
+        return hash(self.formula)
+
+
+class Style:
+    FIELDS = (
+        ("bold", False),
+        ("italic", False),
+        ("color", None),
+        ("background_color", None),
+        ("decimal_places", None),
+        ("grouping", False),
+        ("percentage", False),
+        ("currency", None),
+        ("currency_symbol", None),
+    )
+
+    __slots__ = tuple(k for k, _ in FIELDS) + ("_key",)
+
+    def __init__(
+        self,
+        bold=False,
+        italic=False,
+        color=None,
+        background_color=None,
+        decimal_places=None,
+        grouping=False,
+        percentage=False,
+        currency=None,
+        currency_symbol=None,
+    ):
+        self.bold = bold
+        self.italic = italic
+        self.color = color
+        self.background_color = background_color
+        self.decimal_places = decimal_places
+        self.grouping = grouping
+        self.percentage = percentage
+        self.currency = currency
+        self.currency_symbol = currency_symbol
+        self._key = tuple(getattr(self, k) for k, _ in Style.FIELDS)
+
+    def __repr__(self):
+        arg_str = ", ".join(
+            f"{k}={getattr(self, k)!r}"
+            for k, default in Style.FIELDS
+            if getattr(self, k) != default
+        )
+        return f"odio.Style({arg_str})"
+
+    def __eq__(self, other):
+        return isinstance(other, Style) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
 
-def create_text(f, version="1.2"):
+
+class Cell:
+    def __init__(self, value, style=None):
+        self.value = value
+        self.style = style
+
+    def __repr__(self):
+        return f"odio.Cell({self.value!r}, {self.style!r})"
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Cell)
+            and self.value == other.value
+            and self.style == other.style
+        )
+
+
+def create_text(f, version="1.2", flat=False, validate=False):
     if version == "1.1":
+        import odio.v1_1
+
+        if flat or validate:
+            raise Exception(
+                "Flat documents and validation are only available for version '1.2'."
+            )
+
         return odio.v1_1.TextWriter(f)
     elif version == "1.2":
-        return odio.v1_2.TextWriter(f)
+        import odio.v1_2
+
+        return odio.v1_2.TextWriter(f, flat, validate)
     else:
         raise Exception(
             f"The version '{version}' isn't recognized. The valid version strings "
@@ -62,15 +177,19 @@ def create_text(f, version="1.2"):
         )
 
 
-def parse_text(f):
-    with zipfile.ZipFile(f, "r") as z:
-        content = z.read("content.xml")
+def parse_text(f, limits=None):
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    with odio.v1_2.open_content(f, budget=budget) as content:
+        dom = odio.v1_2.parse_dom(content, budget)
     f.close()
-    dom = xml.dom.minidom.parseString(content)
     version = dom.documentElement.getAttribute("office:version")
     text_elem = dom.getElementsByTagName("office:text")[0]
 
     if version == "1.1":
+        import odio.v1_1
+
         return odio.v1_1.TextReader(text_elem)
     elif version == "1.2":
         return odio.v1_2.TextReader(text_elem)
@@ -81,4 +200,132 @@ def parse_text(f):
         )
 
 
+def iter_text(f, validate=False, limits=None):
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    max_depth = None if limits is None else limits.max_depth
+    with odio.v1_2.open_content(f, budget=budget) as content:
+        yield from odio.v1_2.iter_text_nodes(content, validate, max_depth)
+
+
+def iter_text_chunks(f, limits=None):
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    max_depth = None if limits is None else limits.max_depth
+    with odio.v1_2.open_content(f, budget=budget) as content:
+        yield from odio.v1_2.iter_plain_text(content, max_depth=max_depth)
+
+
+def extract_text(f, limits=None):
+    return "".join(iter_text_chunks(f, limits))
+
+
+def iter_spreadsheet(f, validate=False, limits=None):
+    # With limits, an odio.LimitExceeded is raised as soon as one is exceeded
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    styles = odio.v1_2.StyleIndex()
+    with odio.v1_2.open_content(f, styles, budget) as content:
+        yield from odio.v1_2.iter_tables(content, validate, styles, budget)
+
+
+def iter_batches(
+    f, table, size=10_000, columns=False, prefetch=0, validate=False, limits=None
+):
+    # Yields the rows of the named table in lists of up to size rows, or as lists
+    # of columns. With prefetch, up to that many batches are read ahead in a
+    # thread while the caller works on the current one.
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    styles = odio.v1_2.StyleIndex()
+    with odio.v1_2.open_content(f, styles, budget) as content:
+        for name, rows in odio.v1_2.iter_tables(content, validate, styles, budget):
+            if name == table:
+                batches = odio.v1_2.iter_batches(rows, size, columns)
+                if prefetch > 0:
+                    batches = odio.v1_2.prefetch(batches, prefetch)
+                yield from batches
+                return
+    raise Exception(f"There isn't a table called '{table}'.")
+
+
+def aggregate_spreadsheet(f, specs, validate=False, limits=None):
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    styles = odio.v1_2.StyleIndex()
+    with odio.v1_2.open_content(f, styles, budget) as content:
+        return odio.v1_2.aggregate_tables(content, specs, validate, styles, budget)
+
+
+def inspect_spreadsheet(f, limits=None):
+    # With limits, the content.xml and meta.xml of a package are both read through
+    # the same budget.
+    import zipfile
+
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    max_depth = None if limits is None else limits.max_depth
+    flat, f = odio.v1_2.sniff_flat(f)
+    if flat:
+        if budget is not None:
+            f = odio.v1_2.LimitedReader(f, budget)
+        version, tables, fields, user_defined = odio.v1_2.inspect_content(
+            f, flat, budget
+        )
+    else:
+        with zipfile.ZipFile(f, "r") as z:
+            with z.open("content.xml") as content:
+                if budget is not None:
+                    content = odio.v1_2.LimitedReader(content, budget)
+                version, tables, fields, user_defined = odio.v1_2.inspect_content(
+                    content, budget=budget
+                )
+            if "meta.xml" in z.namelist():
+                with z.open("meta.xml") as meta:
+                    if budget is not None:
+                        meta = odio.v1_2.LimitedReader(meta, budget)
+                    fields, user_defined = odio.v1_2.inspect_meta(meta, max_depth)
+    return odio.v1_2.SpreadsheetInfo(version, tables, fields, user_defined)
+
+
+def hash_spreadsheet(f, limits=None):
+    import odio.v1_2
+
+    budget = None if limits is None else odio.v1_2.Budget(limits)
+    with odio.v1_2.open_content(f, budget=budget) as content:
+        return odio.v1_2.hash_tables(content, budget)
+
+
+def load_row_hashes(f):
+    import odio.v1_2
+
+    return odio.v1_2.load_row_hashes(f)
+
+
+def diff_spreadsheets(old, new, limits=None):
+    # Either spreadsheet can be given as a file or as the RowHashes from an earlier
+    # call to hash_spreadsheet().
+    import odio.v1_2
+
+    if not isinstance(old, odio.v1_2.RowHashes):
+        old = hash_spreadsheet(old, limits)
+    if not isinstance(new, odio.v1_2.RowHashes):
+        new = hash_spreadsheet(new, limits)
+    return odio.v1_2.diff_row_hashes(old, new)
+
+
+def parse_many(
+    sources, kind="spreadsheet", workers=None, chunk_size=1, ordered=True, limits=None
+):
+    import odio.batch
+
+    return odio.batch.parse_many(sources, kind, workers, chunk_size, ordered, limits)
+
+
 __all__ = ["H", "P", "Span"]
@@ -0,0 +1,6 @@
+import sys
+
+from odio.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,142 @@
+import io
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import odio
+
+
+def _parse_spreadsheet(f, limits):
+    return [
+        (name, list(rows)) for name, rows in odio.iter_spreadsheet(f, limits=limits)
+    ]
+
+
+def _parse_text(f, limits):
+    return list(odio.iter_text(f, limits=limits))
+
+
+# The results are made of tuples, strings, numbers and text nodes, rather than
+# minidom-based readers, so that they're cheap to send back from the workers.
+PARSERS = {"spreadsheet": _parse_spreadsheet, "text": _parse_text}
+
+
+class ParseResult:
+    # Exactly one of value and error is None
+    def __init__(self, index, source, value, error):
+        self.index = index
+        self.source = source
+        self.value = value
+        self.error = error
+
+    def __repr__(self):
+        if self.error is None:
+            return f"odio.batch.ParseResult({self.index}, value=...)"
+        else:
+            return f"odio.batch.ParseResult({self.index}, error={self.error!r})"
+
+
+def parse_chunk(kind, chunk, limits=None):
+    # Runs in a worker process. Each document is parsed on its own, so that a
+    # failure only affects its own result, and gets its own Budget of the limits.
+    parse = PARSERS[kind]
+    results = []
+    for index, source in chunk:
+        try:
+            if isinstance(source, bytes):
+                f = io.BytesIO(source)
+            else:
+                f = open(source, "rb")
+            with f:
+                results.append((index, parse(f, limits), None))
+        except Exception as e:
+            results.append((index, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _chunk_results(chunk, future):
+    try:
+        return future.result()
+    except Exception as e:
+        # The worker itself failed, for example because it was killed
+        error = f"{type(e).__name__}: {e}"
+        return [(index, None, error) for index, _ in chunk]
+
+
+def _run_chunks(kind, chunks, workers, limits):
+    # Yields (index, value, error) triples as the chunks finish. No more chunks are
+    # submitted than there are workers, so when a worker dies and breaks the pool,
+    # the chunks that were running are known. They're marked as failed, and the
+    # chunks that hadn't started are carried on with in a new pool.
+    todo = deque(chunks)
+    while len(todo) > 0:
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as executor:
+            running = {}
+            broken = False
+            while len(running) > 0 or (len(todo) > 0 and not broken):
+                while len(todo) > 0 and len(running) < workers and not broken:
+                    chunk = todo.popleft()
+                    try:
+                        future = executor.submit(parse_chunk, kind, chunk, limits)
+                    except BrokenProcessPool:
+                        todo.appendleft(chunk)
+                        broken = True
+                    else:
+                        running[future] = chunk
+                if len(running) == 0:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = running.pop(future)
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        broken = True
+                    yield from _chunk_results(chunk, future)
+
+
+def parse_many(
+    sources, kind="spreadsheet", workers=None, chunk_size=1, ordered=True, limits=None
+):
+    # Sources are paths, which are opened by the workers, or bytes or binary files,
+    # which are read here and sent to the workers. Results are yielded in the
+    # order of the sources, or if ordered is False, as soon as they're ready.
+    if kind not in PARSERS:
+        raise Exception(
+            f"The kind '{kind}' isn't recognized. The valid kinds are "
+            f"'spreadsheet' and 'text'."
+        )
+
+    sources = list(sources)
+    items = []
+    for index, source in enumerate(sources):
+        if isinstance(source, (str, os.PathLike)):
+            items.append((index, os.fspath(source)))
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            items.append((index, bytes(source)))
+        else:
+            items.append((index, source.read()))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    if workers is None:
+        workers = os.cpu_count()
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            for index, value, error in parse_chunk(kind, chunk, limits):
+                yield ParseResult(index, sources[index], value, error)
+        return
+
+    results = _run_chunks(kind, chunks, workers, limits)
+    if not ordered:
+        for index, value, error in results:
+            yield ParseResult(index, sources[index], value, error)
+        return
+
+    # Results that are ready before those of earlier sources wait here
+    ready = {}
+    next_index = 0
+    for index, value, error in results:
+        ready[index] = (value, error)
+        while next_index in ready:
+            value, error = ready.pop(next_index)
+            yield ParseResult(next_index, sources[next_index], value, error)
+            next_index += 1
@@ -0,0 +1,184 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime as Datetime
+from pathlib import Path
+
+import odio
+
+
+def _csv_value(val):
+    if isinstance(val, odio.Cell):
+        val = val.value
+    if val is None:
+        return ""
+    elif isinstance(val, bool):
+        return "true" if val else "false"
+    elif isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    elif isinstance(val, Datetime):
+        return val.isoformat()
+    else:
+        return str(val)
+
+
+def _ods_value(val, numbers):
+    if len(val) == 0:
+        return None
+    elif numbers:
+        try:
+            return float(val)
+        except ValueError:
+            return val
+    else:
+        return val
+
+
+def csv_to_ods(src, dst, numbers=False):
+    rows = 0
+
+    def iter_rows(reader):
+        nonlocal rows
+        for row in reader:
+            rows += 1
+            yield [_ods_value(v, numbers) for v in row]
+
+    with open(src, newline="", encoding="utf8") as f_in, open(dst, "wb") as f_out:
+        with odio.create_spreadsheet(f_out) as sheet:
+            sheet.append_table(Path(src).stem, iter_rows(csv.reader(f_in)))
+    return rows
+
+
+def ods_to_csv(src, dst, table=None):
+    rows = 0
+    with open(src, "rb") as f_in:
+        for name, table_rows in odio.iter_spreadsheet(f_in):
+            if table is None or name == table:
+                with open(dst, "w", newline="", encoding="utf8") as f_out:
+                    writer = csv.writer(f_out)
+                    for row in table_rows:
+                        writer.writerow([_csv_value(v) for v in row])
+                        rows += 1
+                return rows
+    raise Exception(f"The table '{table}' can't be found.")
+
+
+def convert(mode, src, dst, options):
+    # Runs in a worker process, so that a failure only affects its own file. The
+    # output is written to a temporary file next to dst, which only replaces dst
+    # once the conversion has succeeded, so a file that's already there is kept if
+    # it fails. The name has the process ID in it, so another run converting the
+    # same file doesn't use the same temporary file.
+    tmp = str(Path(dst).with_name(f".{Path(dst).name}.{os.getpid()}.tmp"))
+    try:
+        if mode == "csv2ods":
+            rows = csv_to_ods(src, tmp, numbers=options.numbers)
+        else:
+            rows = ods_to_csv(src, tmp, table=options.table)
+        os.replace(tmp, dst)
+        return src, rows, os.path.getsize(src), os.path.getsize(dst), None
+    except Exception as e:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return src, 0, 0, 0, f"{type(e).__name__}: {e}"
+
+
+def _job_result(src, future):
+    try:
+        return future.result()
+    except Exception as e:
+        # The worker itself failed, for example because one was killed and broke the
+        # pool. The file gets the error, rather than main() raising it.
+        return src, 0, 0, 0, f"{type(e).__name__}: {e}"
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="python -m odio",
+        description="Convert files between CSV and ODS.",
+    )
+    parser.add_argument("mode", choices=("csv2ods", "ods2csv"))
+    parser.add_argument("files", nargs="+", metavar="FILE")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes. The default is the number of CPUs.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="Directory for the converted files. The default is the directory of "
+        "each input file.",
+    )
+    parser.add_argument(
+        "--numbers",
+        action="store_true",
+        help="csv2ods: Write fields that look like numbers as numbers.",
+    )
+    parser.add_argument(
+        "--table",
+        help="ods2csv: Name of the table to convert. The default is the first table.",
+    )
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    options = _parse_args(args)
+    suffix = ".ods" if options.mode == "csv2ods" else ".csv"
+    jobs = []
+    for src in options.files:
+        out_dir = Path(src).parent if options.output_dir is None else options.output_dir
+        jobs.append((options.mode, src, str(Path(out_dir, Path(src).stem + suffix))))
+
+    # Inputs with the same stem would overwrite each other's output in the same
+    # directory, so none of them are converted
+    outputs = Counter(os.path.abspath(dst) for _, _, dst in jobs)
+    clashes = [job for job in jobs if outputs[os.path.abspath(job[2])] > 1]
+    jobs = [job for job in jobs if outputs[os.path.abspath(job[2])] == 1]
+
+    start = time.perf_counter()
+    if options.jobs <= 1 or len(jobs) <= 1:
+        results = [convert(*job, options) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=options.jobs) as executor:
+            futures = []
+            for job in jobs:
+                try:
+                    future = executor.submit(convert, *job, options)
+                except Exception as e:
+                    future = Future()
+                    future.set_exception(e)
+                futures.append(future)
+            results = [
+                _job_result(src, future) for (_, src, _), future in zip(jobs, futures)
+            ]
+    elapsed = time.perf_counter() - start
+    results = [
+        (src, 0, 0, 0, f"The output file '{dst}' is also that of another input.")
+        for _, src, dst in clashes
+    ] + results
+
+    failures = 0
+    total_rows = total_in = total_out = 0
+    for src, rows, bytes_in, bytes_out, error in results:
+        if error is None:
+            total_rows += rows
+            total_in += bytes_in
+            total_out += bytes_out
+        else:
+            failures += 1
+            print(f"{src}: {error}", file=sys.stderr)
+
+    print(
+        f"Converted {len(results) - failures} of {len(results)} files, "
+        f"{total_rows} rows, {total_in} bytes in, {total_out} bytes out in "
+        f"{elapsed:.2f}s ({total_rows / elapsed:.0f} rows/s, "
+        f"{total_in / elapsed / 1e6:.1f} MB/s)"
+    )
+    return 1 if failures > 0 else 0
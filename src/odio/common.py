@@ -1,24 +1,86 @@
+from functools import lru_cache
 from itertools import chain
+from types import MappingProxyType
+
+
+# The names are cached, but only up to a bound, as a document can have any number of
+# attribute names.
+NAMES_CACHE_SIZE = 1024
+
+
+def escape(data):
+    return data.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+
+
+def quoteattr(data):
+    data = escape(data)
+
+    if '"' in data:
+        if "'" in data:
+            data = '"%s"' % data.replace('"', "&quot;")
+        else:
+            data = "'%s'" % data
+    else:
+        data = '"%s"' % data
+    return data
+
+
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def qualified_name(attr_name):
+    try:
+        i = attr_name.index("_")
+    except ValueError:
+        raise Exception(
+            f"Problem with the attribute '{attr_name}'. Attributes must have a "
+            f"namespace prefix, eg. 'text_'."
+        )
+    return attr_name[:i] + ":" + attr_name[i + 1 :].replace("_", "-")
+
+
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def python_name(qname):
+    return qname.replace(":", "_").replace("-", "_")
 
 
 class Node:
+    __slots__ = ("name", "default_attrs", "nodes", "_attrs")
+
     def __init__(self, name, default_attrs, *nodes, **attributes):
+        self.name = name
         self.default_attrs = default_attrs
         self.nodes = list(nodes)
-        real_attrs = default_attrs.copy()
-        real_attrs.update(attributes)
-        self.attributes = real_attrs
-        self.name = name
+
+        # Nodes share their default attributes until an attribute is set
+        if len(attributes) == 0:
+            self._attrs = default_attrs
+        else:
+            real_attrs = dict(default_attrs)
+            real_attrs.update(attributes)
+            self._attrs = real_attrs
+
+    @property
+    def attributes(self):
+        # The caller may change the returned dict, so it has to be a copy
+        if self._attrs is self.default_attrs:
+            self._attrs = dict(self.default_attrs)
+        return self._attrs
+
+    def set_attribute(self, k, v):
+        if self._attrs is self.default_attrs:
+            self._attrs = dict(self.default_attrs)
+        self._attrs[k] = v
 
     def __repr__(self):
-        attrs = self.attributes.copy()
-        for k, v in self.default_attrs.items():
-            if k in attrs and attrs[k] == v:
-                del attrs[k]
+        default_attrs = self.default_attrs
+        attrs = (
+            (k, v)
+            for k, v in self._attrs.items()
+            if k not in default_attrs or default_attrs[k] != v
+        )
         arg_str = ", ".join(
             chain(
                 (repr(node) for node in self.nodes),
-                (k + "=" + repr(v) for k, v in attrs.items()),
+                (k + "=" + repr(v) for k, v in attrs),
             )
         )
         return f"odio.{self.__class__.__name__}({arg_str})"
@@ -28,42 +90,81 @@ class Node:
             isinstance(other, Node)
             and self.name == other.name
             and self.nodes == other.nodes
-            and self.attrs == other.attrs
+            and self._attrs == other._attrs
+        )
+
+    def start_tag(self):
+        attr_str = "".join(
+            f" {qualified_name(k)}={quoteattr(v)}" for k, v in self._attrs.items()
         )
+        return f"<{self.name}{attr_str}"
 
-    def attach(self, doc, parent_elem):
-        node_elem = doc.createElement(self.name)
-        parent_elem.appendChild(node_elem)
-        for k, v in self.attributes.items():
-            try:
-                i = k.index("_")
-            except ValueError:
-                raise Exception(
-                    f"Problem with the attribute '{k}'. Attributes must have a "
-                    f"namespace prefix, eg. 'text_'."
-                )
-            node_elem.setAttribute(k[:i] + ":" + k[i + 1 :], v)
-        if isinstance(self, H):
-            node_elem.setAttribute("text:outline-level", self.name[-1])
-        for node in self.nodes:
-            if isinstance(node, str):
-                node_elem.appendChild(doc.createTextNode(node))
+    def end_tag(self):
+        return f"</{self.name}>"
+
+    def to_xml(self):
+        parts = []
+        append = parts.append
+        stack = [self]
+        pop = stack.pop
+        push = stack.append
+        while len(stack) > 0:
+            item = pop()
+            if isinstance(item, str):
+                append(escape(item))
+            elif isinstance(item, tuple):
+                append(item[0])
+            elif len(item.nodes) == 0:
+                append(item.start_tag() + "/>")
             else:
-                node.attach(doc, node_elem)
+                append(item.start_tag() + ">")
+                push((item.end_tag(),))
+                stack.extend(reversed(item.nodes))
+        return "".join(parts)
 
 
-class H(Node):
-    def __init__(self, *nodes, **attrs):
-        Node.__init__(self, "text:h", {"text_style_name": "Heading 1"}, *nodes, **attrs)
+def new_element(cls, nodes, attrs):
+    return cls(*nodes, **attrs)
 
 
-class P(Node):
-    def __init__(self, *nodes, **attrs):
-        Node.__init__(self, "text:p", {"text_style_name": "Text Body"}, *nodes, **attrs)
+class Element(Node):
+    # The base of the element classes in odio.text, which are generated from the
+    # ODF schema. The qualified names of their attributes and their tags are worked
+    # out when the classes are generated, rather than as they're written.
+    __slots__ = ()
 
+    NAME = None
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = None
+    DEFAULT_START_TAG = None
+    END_TAG = None
 
-class Span(Node):
     def __init__(self, *nodes, **attrs):
-        Node.__init__(
-            self, "text:span", {"text_style_name": "Text Body"}, *nodes, **attrs
+        Node.__init__(self, self.NAME, self.DEFAULT_ATTRS, *nodes, **attrs)
+
+    def start_tag(self):
+        attrs = self._attrs
+        if attrs is self.DEFAULT_ATTRS:
+            return self.DEFAULT_START_TAG
+
+        names = self.ATTRIBUTES
+        attr_str = "".join(
+            f" {names.get(k) or qualified_name(k)}={quoteattr(v)}"
+            for k, v in attrs.items()
         )
+        return self.START_TAG + attr_str
+
+    def end_tag(self):
+        return self.END_TAG
+
+    def __reduce__(self):
+        # The default attributes are shared, and can't be pickled, so only the
+        # attributes that differ from them are.
+        default_attrs = self.DEFAULT_ATTRS
+        attrs = {
+            k: v
+            for k, v in self._attrs.items()
+            if k not in default_attrs or default_attrs[k] != v
+        }
+        return new_element, (type(self), self.nodes, attrs)
@@ -0,0 +1,3241 @@
+# Generated from gen/OpenDocument-schema-v1.2-cd04.rng by gen/compile_schema.py.
+# Don't edit.
+
+from types import MappingProxyType
+
+from odio.common import Element
+
+
+class A(Element):
+    __slots__ = ()
+
+    NAME = "text:a"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_name": "office:name",
+            "office_target_frame_name": "office:target-frame-name",
+            "office_title": "office:title",
+            "text_style_name": "text:style-name",
+            "text_visited_style_name": "text:visited-style-name",
+            "xlink_actuate": "xlink:actuate",
+            "xlink_href": "xlink:href",
+            "xlink_show": "xlink:show",
+            "xlink_type": "xlink:type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType(
+        {
+            "xlink_type": "simple",
+        }
+    )
+    START_TAG = "<text:a"
+    DEFAULT_START_TAG = '<text:a xlink:type="simple"'
+    END_TAG = "</text:a>"
+
+
+class AlphabeticalIndex(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:alphabetical-index"
+    DEFAULT_START_TAG = "<text:alphabetical-index"
+    END_TAG = "</text:alphabetical-index>"
+
+
+class AlphabeticalIndexAutoMarkFile(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index-auto-mark-file"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "xlink_href": "xlink:href",
+            "xlink_type": "xlink:type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType(
+        {
+            "xlink_type": "simple",
+        }
+    )
+    START_TAG = "<text:alphabetical-index-auto-mark-file"
+    DEFAULT_START_TAG = '<text:alphabetical-index-auto-mark-file xlink:type="simple"'
+    END_TAG = "</text:alphabetical-index-auto-mark-file>"
+
+
+class AlphabeticalIndexEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_outline_level": "text:outline-level",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:alphabetical-index-entry-template"
+    DEFAULT_START_TAG = "<text:alphabetical-index-entry-template"
+    END_TAG = "</text:alphabetical-index-entry-template>"
+
+
+class AlphabeticalIndexMark(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index-mark"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_key1": "text:key1",
+            "text_key1_phonetic": "text:key1-phonetic",
+            "text_key2": "text:key2",
+            "text_key2_phonetic": "text:key2-phonetic",
+            "text_main_entry": "text:main-entry",
+            "text_string_value": "text:string-value",
+            "text_string_value_phonetic": "text:string-value-phonetic",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:alphabetical-index-mark"
+    DEFAULT_START_TAG = "<text:alphabetical-index-mark"
+    END_TAG = "</text:alphabetical-index-mark>"
+
+
+class AlphabeticalIndexMarkEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index-mark-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:alphabetical-index-mark-end"
+    DEFAULT_START_TAG = "<text:alphabetical-index-mark-end"
+    END_TAG = "</text:alphabetical-index-mark-end>"
+
+
+class AlphabeticalIndexMarkStart(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index-mark-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+            "text_key1": "text:key1",
+            "text_key1_phonetic": "text:key1-phonetic",
+            "text_key2": "text:key2",
+            "text_key2_phonetic": "text:key2-phonetic",
+            "text_main_entry": "text:main-entry",
+            "text_string_value_phonetic": "text:string-value-phonetic",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:alphabetical-index-mark-start"
+    DEFAULT_START_TAG = "<text:alphabetical-index-mark-start"
+    END_TAG = "</text:alphabetical-index-mark-start>"
+
+
+class AlphabeticalIndexSource(Element):
+    __slots__ = ()
+
+    NAME = "text:alphabetical-index-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "fo_country": "fo:country",
+            "fo_language": "fo:language",
+            "fo_script": "fo:script",
+            "style_rfc_language_tag": "style:rfc-language-tag",
+            "text_alphabetical_separators": "text:alphabetical-separators",
+            "text_capitalize_entries": "text:capitalize-entries",
+            "text_combine_entries": "text:combine-entries",
+            "text_combine_entries_with_dash": "text:combine-entries-with-dash",
+            "text_combine_entries_with_pp": "text:combine-entries-with-pp",
+            "text_comma_separated": "text:comma-separated",
+            "text_ignore_case": "text:ignore-case",
+            "text_index_scope": "text:index-scope",
+            "text_main_entry_style_name": "text:main-entry-style-name",
+            "text_relative_tab_stop_position": "text:relative-tab-stop-position",
+            "text_sort_algorithm": "text:sort-algorithm",
+            "text_use_keys_as_entries": "text:use-keys-as-entries",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:alphabetical-index-source"
+    DEFAULT_START_TAG = "<text:alphabetical-index-source"
+    END_TAG = "</text:alphabetical-index-source>"
+
+
+class AuthorInitials(Element):
+    __slots__ = ()
+
+    NAME = "text:author-initials"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:author-initials"
+    DEFAULT_START_TAG = "<text:author-initials"
+    END_TAG = "</text:author-initials>"
+
+
+class AuthorName(Element):
+    __slots__ = ()
+
+    NAME = "text:author-name"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:author-name"
+    DEFAULT_START_TAG = "<text:author-name"
+    END_TAG = "</text:author-name>"
+
+
+class Bibliography(Element):
+    __slots__ = ()
+
+    NAME = "text:bibliography"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bibliography"
+    DEFAULT_START_TAG = "<text:bibliography"
+    END_TAG = "</text:bibliography>"
+
+
+class BibliographyConfiguration(Element):
+    __slots__ = ()
+
+    NAME = "text:bibliography-configuration"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "fo_country": "fo:country",
+            "fo_language": "fo:language",
+            "fo_script": "fo:script",
+            "style_rfc_language_tag": "style:rfc-language-tag",
+            "text_numbered_entries": "text:numbered-entries",
+            "text_prefix": "text:prefix",
+            "text_sort_algorithm": "text:sort-algorithm",
+            "text_sort_by_position": "text:sort-by-position",
+            "text_suffix": "text:suffix",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bibliography-configuration"
+    DEFAULT_START_TAG = "<text:bibliography-configuration"
+    END_TAG = "</text:bibliography-configuration>"
+
+
+class BibliographyEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:bibliography-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_bibliography_type": "text:bibliography-type",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bibliography-entry-template"
+    DEFAULT_START_TAG = "<text:bibliography-entry-template"
+    END_TAG = "</text:bibliography-entry-template>"
+
+
+class BibliographyMark(Element):
+    __slots__ = ()
+
+    NAME = "text:bibliography-mark"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_address": "text:address",
+            "text_annote": "text:annote",
+            "text_author": "text:author",
+            "text_bibliography_type": "text:bibliography-type",
+            "text_booktitle": "text:booktitle",
+            "text_chapter": "text:chapter",
+            "text_custom1": "text:custom1",
+            "text_custom2": "text:custom2",
+            "text_custom3": "text:custom3",
+            "text_custom4": "text:custom4",
+            "text_custom5": "text:custom5",
+            "text_edition": "text:edition",
+            "text_editor": "text:editor",
+            "text_howpublished": "text:howpublished",
+            "text_identifier": "text:identifier",
+            "text_institution": "text:institution",
+            "text_isbn": "text:isbn",
+            "text_issn": "text:issn",
+            "text_journal": "text:journal",
+            "text_month": "text:month",
+            "text_note": "text:note",
+            "text_number": "text:number",
+            "text_organizations": "text:organizations",
+            "text_pages": "text:pages",
+            "text_publisher": "text:publisher",
+            "text_report_type": "text:report-type",
+            "text_school": "text:school",
+            "text_series": "text:series",
+            "text_title": "text:title",
+            "text_url": "text:url",
+            "text_volume": "text:volume",
+            "text_year": "text:year",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bibliography-mark"
+    DEFAULT_START_TAG = "<text:bibliography-mark"
+    END_TAG = "</text:bibliography-mark>"
+
+
+class BibliographySource(Element):
+    __slots__ = ()
+
+    NAME = "text:bibliography-source"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bibliography-source"
+    DEFAULT_START_TAG = "<text:bibliography-source"
+    END_TAG = "</text:bibliography-source>"
+
+
+class Bookmark(Element):
+    __slots__ = ()
+
+    NAME = "text:bookmark"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bookmark"
+    DEFAULT_START_TAG = "<text:bookmark"
+    END_TAG = "</text:bookmark>"
+
+
+class BookmarkEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:bookmark-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bookmark-end"
+    DEFAULT_START_TAG = "<text:bookmark-end"
+    END_TAG = "</text:bookmark-end>"
+
+
+class BookmarkRef(Element):
+    __slots__ = ()
+
+    NAME = "text:bookmark-ref"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_ref_name": "text:ref-name",
+            "text_reference_format": "text:reference-format",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bookmark-ref"
+    DEFAULT_START_TAG = "<text:bookmark-ref"
+    END_TAG = "</text:bookmark-ref>"
+
+
+class BookmarkStart(Element):
+    __slots__ = ()
+
+    NAME = "text:bookmark-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "xhtml_about": "xhtml:about",
+            "xhtml_content": "xhtml:content",
+            "xhtml_datatype": "xhtml:datatype",
+            "xhtml_property": "xhtml:property",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:bookmark-start"
+    DEFAULT_START_TAG = "<text:bookmark-start"
+    END_TAG = "</text:bookmark-start>"
+
+
+class Change(Element):
+    __slots__ = ()
+
+    NAME = "text:change"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_change_id": "text:change-id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:change"
+    DEFAULT_START_TAG = "<text:change"
+    END_TAG = "</text:change>"
+
+
+class ChangeEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:change-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_change_id": "text:change-id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:change-end"
+    DEFAULT_START_TAG = "<text:change-end"
+    END_TAG = "</text:change-end>"
+
+
+class ChangeStart(Element):
+    __slots__ = ()
+
+    NAME = "text:change-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_change_id": "text:change-id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:change-start"
+    DEFAULT_START_TAG = "<text:change-start"
+    END_TAG = "</text:change-start>"
+
+
+class ChangedRegion(Element):
+    __slots__ = ()
+
+    NAME = "text:changed-region"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:changed-region"
+    DEFAULT_START_TAG = "<text:changed-region"
+    END_TAG = "</text:changed-region>"
+
+
+class Chapter(Element):
+    __slots__ = ()
+
+    NAME = "text:chapter"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_display": "text:display",
+            "text_outline_level": "text:outline-level",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:chapter"
+    DEFAULT_START_TAG = "<text:chapter"
+    END_TAG = "</text:chapter>"
+
+
+class CharacterCount(Element):
+    __slots__ = ()
+
+    NAME = "text:character-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:character-count"
+    DEFAULT_START_TAG = "<text:character-count"
+    END_TAG = "</text:character-count>"
+
+
+class ConditionalText(Element):
+    __slots__ = ()
+
+    NAME = "text:conditional-text"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_condition": "text:condition",
+            "text_current_value": "text:current-value",
+            "text_string_value_if_false": "text:string-value-if-false",
+            "text_string_value_if_true": "text:string-value-if-true",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:conditional-text"
+    DEFAULT_START_TAG = "<text:conditional-text"
+    END_TAG = "</text:conditional-text>"
+
+
+class CreationDate(Element):
+    __slots__ = ()
+
+    NAME = "text:creation-date"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_date_value": "text:date-value",
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:creation-date"
+    DEFAULT_START_TAG = "<text:creation-date"
+    END_TAG = "</text:creation-date>"
+
+
+class CreationTime(Element):
+    __slots__ = ()
+
+    NAME = "text:creation-time"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_fixed": "text:fixed",
+            "text_time_value": "text:time-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:creation-time"
+    DEFAULT_START_TAG = "<text:creation-time"
+    END_TAG = "</text:creation-time>"
+
+
+class Creator(Element):
+    __slots__ = ()
+
+    NAME = "text:creator"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:creator"
+    DEFAULT_START_TAG = "<text:creator"
+    END_TAG = "</text:creator>"
+
+
+class DatabaseDisplay(Element):
+    __slots__ = ()
+
+    NAME = "text:database-display"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_column_name": "text:column-name",
+            "text_database_name": "text:database-name",
+            "text_table_name": "text:table-name",
+            "text_table_type": "text:table-type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:database-display"
+    DEFAULT_START_TAG = "<text:database-display"
+    END_TAG = "</text:database-display>"
+
+
+class DatabaseName(Element):
+    __slots__ = ()
+
+    NAME = "text:database-name"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_database_name": "text:database-name",
+            "text_table_name": "text:table-name",
+            "text_table_type": "text:table-type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:database-name"
+    DEFAULT_START_TAG = "<text:database-name"
+    END_TAG = "</text:database-name>"
+
+
+class DatabaseNext(Element):
+    __slots__ = ()
+
+    NAME = "text:database-next"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_condition": "text:condition",
+            "text_database_name": "text:database-name",
+            "text_table_name": "text:table-name",
+            "text_table_type": "text:table-type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:database-next"
+    DEFAULT_START_TAG = "<text:database-next"
+    END_TAG = "</text:database-next>"
+
+
+class DatabaseRowNumber(Element):
+    __slots__ = ()
+
+    NAME = "text:database-row-number"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "text_database_name": "text:database-name",
+            "text_table_name": "text:table-name",
+            "text_table_type": "text:table-type",
+            "text_value": "text:value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:database-row-number"
+    DEFAULT_START_TAG = "<text:database-row-number"
+    END_TAG = "</text:database-row-number>"
+
+
+class DatabaseRowSelect(Element):
+    __slots__ = ()
+
+    NAME = "text:database-row-select"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_condition": "text:condition",
+            "text_database_name": "text:database-name",
+            "text_row_number": "text:row-number",
+            "text_table_name": "text:table-name",
+            "text_table_type": "text:table-type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:database-row-select"
+    DEFAULT_START_TAG = "<text:database-row-select"
+    END_TAG = "</text:database-row-select>"
+
+
+class Date(Element):
+    __slots__ = ()
+
+    NAME = "text:date"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_date_adjust": "text:date-adjust",
+            "text_date_value": "text:date-value",
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:date"
+    DEFAULT_START_TAG = "<text:date"
+    END_TAG = "</text:date>"
+
+
+class DdeConnection(Element):
+    __slots__ = ()
+
+    NAME = "text:dde-connection"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_connection_name": "text:connection-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:dde-connection"
+    DEFAULT_START_TAG = "<text:dde-connection"
+    END_TAG = "</text:dde-connection>"
+
+
+class DdeConnectionDecl(Element):
+    __slots__ = ()
+
+    NAME = "text:dde-connection-decl"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_automatic_update": "office:automatic-update",
+            "office_dde_application": "office:dde-application",
+            "office_dde_item": "office:dde-item",
+            "office_dde_topic": "office:dde-topic",
+            "office_name": "office:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:dde-connection-decl"
+    DEFAULT_START_TAG = "<text:dde-connection-decl"
+    END_TAG = "</text:dde-connection-decl>"
+
+
+class DdeConnectionDecls(Element):
+    __slots__ = ()
+
+    NAME = "text:dde-connection-decls"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:dde-connection-decls"
+    DEFAULT_START_TAG = "<text:dde-connection-decls"
+    END_TAG = "</text:dde-connection-decls>"
+
+
+class Deletion(Element):
+    __slots__ = ()
+
+    NAME = "text:deletion"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:deletion"
+    DEFAULT_START_TAG = "<text:deletion"
+    END_TAG = "</text:deletion>"
+
+
+class Description(Element):
+    __slots__ = ()
+
+    NAME = "text:description"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:description"
+    DEFAULT_START_TAG = "<text:description"
+    END_TAG = "</text:description>"
+
+
+class EditingCycles(Element):
+    __slots__ = ()
+
+    NAME = "text:editing-cycles"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:editing-cycles"
+    DEFAULT_START_TAG = "<text:editing-cycles"
+    END_TAG = "</text:editing-cycles>"
+
+
+class EditingDuration(Element):
+    __slots__ = ()
+
+    NAME = "text:editing-duration"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_duration": "text:duration",
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:editing-duration"
+    DEFAULT_START_TAG = "<text:editing-duration"
+    END_TAG = "</text:editing-duration>"
+
+
+class ExecuteMacro(Element):
+    __slots__ = ()
+
+    NAME = "text:execute-macro"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:execute-macro"
+    DEFAULT_START_TAG = "<text:execute-macro"
+    END_TAG = "</text:execute-macro>"
+
+
+class Expression(Element):
+    __slots__ = ()
+
+    NAME = "text:expression"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_boolean_value": "office:boolean-value",
+            "office_currency": "office:currency",
+            "office_date_value": "office:date-value",
+            "office_string_value": "office:string-value",
+            "office_time_value": "office:time-value",
+            "office_value": "office:value",
+            "office_value_type": "office:value-type",
+            "style_data_style_name": "style:data-style-name",
+            "text_display": "text:display",
+            "text_formula": "text:formula",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:expression"
+    DEFAULT_START_TAG = "<text:expression"
+    END_TAG = "</text:expression>"
+
+
+class FileName(Element):
+    __slots__ = ()
+
+    NAME = "text:file-name"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_display": "text:display",
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:file-name"
+    DEFAULT_START_TAG = "<text:file-name"
+    END_TAG = "</text:file-name>"
+
+
+class FormatChange(Element):
+    __slots__ = ()
+
+    NAME = "text:format-change"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:format-change"
+    DEFAULT_START_TAG = "<text:format-change"
+    END_TAG = "</text:format-change>"
+
+
+class H(Element):
+    __slots__ = ()
+
+    NAME = "text:h"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_class_names": "text:class-names",
+            "text_cond_style_name": "text:cond-style-name",
+            "text_id": "text:id",
+            "text_is_list_header": "text:is-list-header",
+            "text_outline_level": "text:outline-level",
+            "text_restart_numbering": "text:restart-numbering",
+            "text_start_value": "text:start-value",
+            "text_style_name": "text:style-name",
+            "xhtml_about": "xhtml:about",
+            "xhtml_content": "xhtml:content",
+            "xhtml_datatype": "xhtml:datatype",
+            "xhtml_property": "xhtml:property",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType(
+        {
+            "text_style_name": "Heading 1",
+            "text_outline_level": "1",
+        }
+    )
+    START_TAG = "<text:h"
+    DEFAULT_START_TAG = '<text:h text:style-name="Heading 1" text:outline-level="1"'
+    END_TAG = "</text:h>"
+
+
+class HiddenParagraph(Element):
+    __slots__ = ()
+
+    NAME = "text:hidden-paragraph"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_condition": "text:condition",
+            "text_is_hidden": "text:is-hidden",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:hidden-paragraph"
+    DEFAULT_START_TAG = "<text:hidden-paragraph"
+    END_TAG = "</text:hidden-paragraph>"
+
+
+class HiddenText(Element):
+    __slots__ = ()
+
+    NAME = "text:hidden-text"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_condition": "text:condition",
+            "text_is_hidden": "text:is-hidden",
+            "text_string_value": "text:string-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:hidden-text"
+    DEFAULT_START_TAG = "<text:hidden-text"
+    END_TAG = "</text:hidden-text>"
+
+
+class IllustrationIndex(Element):
+    __slots__ = ()
+
+    NAME = "text:illustration-index"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:illustration-index"
+    DEFAULT_START_TAG = "<text:illustration-index"
+    END_TAG = "</text:illustration-index>"
+
+
+class IllustrationIndexEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:illustration-index-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:illustration-index-entry-template"
+    DEFAULT_START_TAG = "<text:illustration-index-entry-template"
+    END_TAG = "</text:illustration-index-entry-template>"
+
+
+class IllustrationIndexSource(Element):
+    __slots__ = ()
+
+    NAME = "text:illustration-index-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_caption_sequence_format": "text:caption-sequence-format",
+            "text_caption_sequence_name": "text:caption-sequence-name",
+            "text_index_scope": "text:index-scope",
+            "text_relative_tab_stop_position": "text:relative-tab-stop-position",
+            "text_use_caption": "text:use-caption",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:illustration-index-source"
+    DEFAULT_START_TAG = "<text:illustration-index-source"
+    END_TAG = "</text:illustration-index-source>"
+
+
+class ImageCount(Element):
+    __slots__ = ()
+
+    NAME = "text:image-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:image-count"
+    DEFAULT_START_TAG = "<text:image-count"
+    END_TAG = "</text:image-count>"
+
+
+class IndexBody(Element):
+    __slots__ = ()
+
+    NAME = "text:index-body"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-body"
+    DEFAULT_START_TAG = "<text:index-body"
+    END_TAG = "</text:index-body>"
+
+
+class IndexEntryBibliography(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-bibliography"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_bibliography_data_field": "text:bibliography-data-field",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-bibliography"
+    DEFAULT_START_TAG = "<text:index-entry-bibliography"
+    END_TAG = "</text:index-entry-bibliography>"
+
+
+class IndexEntryChapter(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-chapter"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_display": "text:display",
+            "text_outline_level": "text:outline-level",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-chapter"
+    DEFAULT_START_TAG = "<text:index-entry-chapter"
+    END_TAG = "</text:index-entry-chapter>"
+
+
+class IndexEntryLinkEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-link-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-link-end"
+    DEFAULT_START_TAG = "<text:index-entry-link-end"
+    END_TAG = "</text:index-entry-link-end>"
+
+
+class IndexEntryLinkStart(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-link-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-link-start"
+    DEFAULT_START_TAG = "<text:index-entry-link-start"
+    END_TAG = "</text:index-entry-link-start>"
+
+
+class IndexEntryPageNumber(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-page-number"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-page-number"
+    DEFAULT_START_TAG = "<text:index-entry-page-number"
+    END_TAG = "</text:index-entry-page-number>"
+
+
+class IndexEntrySpan(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-span"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-span"
+    DEFAULT_START_TAG = "<text:index-entry-span"
+    END_TAG = "</text:index-entry-span>"
+
+
+class IndexEntryTabStop(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-tab-stop"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_leader_char": "style:leader-char",
+            "style_position": "style:position",
+            "style_type": "style:type",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-tab-stop"
+    DEFAULT_START_TAG = "<text:index-entry-tab-stop"
+    END_TAG = "</text:index-entry-tab-stop>"
+
+
+class IndexEntryText(Element):
+    __slots__ = ()
+
+    NAME = "text:index-entry-text"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-entry-text"
+    DEFAULT_START_TAG = "<text:index-entry-text"
+    END_TAG = "</text:index-entry-text>"
+
+
+class IndexSourceStyle(Element):
+    __slots__ = ()
+
+    NAME = "text:index-source-style"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-source-style"
+    DEFAULT_START_TAG = "<text:index-source-style"
+    END_TAG = "</text:index-source-style>"
+
+
+class IndexSourceStyles(Element):
+    __slots__ = ()
+
+    NAME = "text:index-source-styles"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_outline_level": "text:outline-level",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-source-styles"
+    DEFAULT_START_TAG = "<text:index-source-styles"
+    END_TAG = "</text:index-source-styles>"
+
+
+class IndexTitle(Element):
+    __slots__ = ()
+
+    NAME = "text:index-title"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-title"
+    DEFAULT_START_TAG = "<text:index-title"
+    END_TAG = "</text:index-title>"
+
+
+class IndexTitleTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:index-title-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:index-title-template"
+    DEFAULT_START_TAG = "<text:index-title-template"
+    END_TAG = "</text:index-title-template>"
+
+
+class InitialCreator(Element):
+    __slots__ = ()
+
+    NAME = "text:initial-creator"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:initial-creator"
+    DEFAULT_START_TAG = "<text:initial-creator"
+    END_TAG = "</text:initial-creator>"
+
+
+class Insertion(Element):
+    __slots__ = ()
+
+    NAME = "text:insertion"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:insertion"
+    DEFAULT_START_TAG = "<text:insertion"
+    END_TAG = "</text:insertion>"
+
+
+class Keywords(Element):
+    __slots__ = ()
+
+    NAME = "text:keywords"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:keywords"
+    DEFAULT_START_TAG = "<text:keywords"
+    END_TAG = "</text:keywords>"
+
+
+class LineBreak(Element):
+    __slots__ = ()
+
+    NAME = "text:line-break"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:line-break"
+    DEFAULT_START_TAG = "<text:line-break"
+    END_TAG = "</text:line-break>"
+
+
+class LinenumberingConfiguration(Element):
+    __slots__ = ()
+
+    NAME = "text:linenumbering-configuration"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "text_count_empty_lines": "text:count-empty-lines",
+            "text_count_in_text_boxes": "text:count-in-text-boxes",
+            "text_increment": "text:increment",
+            "text_number_lines": "text:number-lines",
+            "text_number_position": "text:number-position",
+            "text_offset": "text:offset",
+            "text_restart_on_page": "text:restart-on-page",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:linenumbering-configuration"
+    DEFAULT_START_TAG = "<text:linenumbering-configuration"
+    END_TAG = "</text:linenumbering-configuration>"
+
+
+class LinenumberingSeparator(Element):
+    __slots__ = ()
+
+    NAME = "text:linenumbering-separator"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_increment": "text:increment",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:linenumbering-separator"
+    DEFAULT_START_TAG = "<text:linenumbering-separator"
+    END_TAG = "</text:linenumbering-separator>"
+
+
+class List(Element):
+    __slots__ = ()
+
+    NAME = "text:list"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_continue_list": "text:continue-list",
+            "text_continue_numbering": "text:continue-numbering",
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list"
+    DEFAULT_START_TAG = "<text:list"
+    END_TAG = "</text:list>"
+
+
+class ListHeader(Element):
+    __slots__ = ()
+
+    NAME = "text:list-header"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list-header"
+    DEFAULT_START_TAG = "<text:list-header"
+    END_TAG = "</text:list-header>"
+
+
+class ListItem(Element):
+    __slots__ = ()
+
+    NAME = "text:list-item"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_start_value": "text:start-value",
+            "text_style_override": "text:style-override",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list-item"
+    DEFAULT_START_TAG = "<text:list-item"
+    END_TAG = "</text:list-item>"
+
+
+class ListLevelStyleBullet(Element):
+    __slots__ = ()
+
+    NAME = "text:list-level-style-bullet"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_prefix": "style:num-prefix",
+            "style_num_suffix": "style:num-suffix",
+            "text_bullet_char": "text:bullet-char",
+            "text_bullet_relative_size": "text:bullet-relative-size",
+            "text_level": "text:level",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list-level-style-bullet"
+    DEFAULT_START_TAG = "<text:list-level-style-bullet"
+    END_TAG = "</text:list-level-style-bullet>"
+
+
+class ListLevelStyleImage(Element):
+    __slots__ = ()
+
+    NAME = "text:list-level-style-image"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_level": "text:level",
+            "xlink_actuate": "xlink:actuate",
+            "xlink_href": "xlink:href",
+            "xlink_show": "xlink:show",
+            "xlink_type": "xlink:type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list-level-style-image"
+    DEFAULT_START_TAG = "<text:list-level-style-image"
+    END_TAG = "</text:list-level-style-image>"
+
+
+class ListLevelStyleNumber(Element):
+    __slots__ = ()
+
+    NAME = "text:list-level-style-number"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "style_num_prefix": "style:num-prefix",
+            "style_num_suffix": "style:num-suffix",
+            "text_display_levels": "text:display-levels",
+            "text_level": "text:level",
+            "text_start_value": "text:start-value",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list-level-style-number"
+    DEFAULT_START_TAG = "<text:list-level-style-number"
+    END_TAG = "</text:list-level-style-number>"
+
+
+class ListStyle(Element):
+    __slots__ = ()
+
+    NAME = "text:list-style"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_display_name": "style:display-name",
+            "style_name": "style:name",
+            "text_consecutive_numbering": "text:consecutive-numbering",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:list-style"
+    DEFAULT_START_TAG = "<text:list-style"
+    END_TAG = "</text:list-style>"
+
+
+class Measure(Element):
+    __slots__ = ()
+
+    NAME = "text:measure"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_kind": "text:kind",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:measure"
+    DEFAULT_START_TAG = "<text:measure"
+    END_TAG = "</text:measure>"
+
+
+class Meta(Element):
+    __slots__ = ()
+
+    NAME = "text:meta"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "xhtml_about": "xhtml:about",
+            "xhtml_content": "xhtml:content",
+            "xhtml_datatype": "xhtml:datatype",
+            "xhtml_property": "xhtml:property",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:meta"
+    DEFAULT_START_TAG = "<text:meta"
+    END_TAG = "</text:meta>"
+
+
+class MetaField(Element):
+    __slots__ = ()
+
+    NAME = "text:meta-field"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:meta-field"
+    DEFAULT_START_TAG = "<text:meta-field"
+    END_TAG = "</text:meta-field>"
+
+
+class ModificationDate(Element):
+    __slots__ = ()
+
+    NAME = "text:modification-date"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_date_value": "text:date-value",
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:modification-date"
+    DEFAULT_START_TAG = "<text:modification-date"
+    END_TAG = "</text:modification-date>"
+
+
+class ModificationTime(Element):
+    __slots__ = ()
+
+    NAME = "text:modification-time"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_fixed": "text:fixed",
+            "text_time_value": "text:time-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:modification-time"
+    DEFAULT_START_TAG = "<text:modification-time"
+    END_TAG = "</text:modification-time>"
+
+
+class Note(Element):
+    __slots__ = ()
+
+    NAME = "text:note"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+            "text_note_class": "text:note-class",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:note"
+    DEFAULT_START_TAG = "<text:note"
+    END_TAG = "</text:note>"
+
+
+class NoteBody(Element):
+    __slots__ = ()
+
+    NAME = "text:note-body"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:note-body"
+    DEFAULT_START_TAG = "<text:note-body"
+    END_TAG = "</text:note-body>"
+
+
+class NoteCitation(Element):
+    __slots__ = ()
+
+    NAME = "text:note-citation"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_label": "text:label",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:note-citation"
+    DEFAULT_START_TAG = "<text:note-citation"
+    END_TAG = "</text:note-citation>"
+
+
+class NoteContinuationNoticeBackward(Element):
+    __slots__ = ()
+
+    NAME = "text:note-continuation-notice-backward"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:note-continuation-notice-backward"
+    DEFAULT_START_TAG = "<text:note-continuation-notice-backward"
+    END_TAG = "</text:note-continuation-notice-backward>"
+
+
+class NoteContinuationNoticeForward(Element):
+    __slots__ = ()
+
+    NAME = "text:note-continuation-notice-forward"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:note-continuation-notice-forward"
+    DEFAULT_START_TAG = "<text:note-continuation-notice-forward"
+    END_TAG = "</text:note-continuation-notice-forward>"
+
+
+class NoteRef(Element):
+    __slots__ = ()
+
+    NAME = "text:note-ref"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_note_class": "text:note-class",
+            "text_ref_name": "text:ref-name",
+            "text_reference_format": "text:reference-format",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:note-ref"
+    DEFAULT_START_TAG = "<text:note-ref"
+    END_TAG = "</text:note-ref>"
+
+
+class NotesConfiguration(Element):
+    __slots__ = ()
+
+    NAME = "text:notes-configuration"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "style_num_prefix": "style:num-prefix",
+            "style_num_suffix": "style:num-suffix",
+            "text_citation_body_style_name": "text:citation-body-style-name",
+            "text_citation_style_name": "text:citation-style-name",
+            "text_default_style_name": "text:default-style-name",
+            "text_footnotes_position": "text:footnotes-position",
+            "text_master_page_name": "text:master-page-name",
+            "text_note_class": "text:note-class",
+            "text_start_numbering_at": "text:start-numbering-at",
+            "text_start_value": "text:start-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:notes-configuration"
+    DEFAULT_START_TAG = "<text:notes-configuration"
+    END_TAG = "</text:notes-configuration>"
+
+
+class Number(Element):
+    __slots__ = ()
+
+    NAME = "text:number"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:number"
+    DEFAULT_START_TAG = "<text:number"
+    END_TAG = "</text:number>"
+
+
+class NumberedParagraph(Element):
+    __slots__ = ()
+
+    NAME = "text:numbered-paragraph"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_continue_numbering": "text:continue-numbering",
+            "text_level": "text:level",
+            "text_list_id": "text:list-id",
+            "text_start_value": "text:start-value",
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:numbered-paragraph"
+    DEFAULT_START_TAG = "<text:numbered-paragraph"
+    END_TAG = "</text:numbered-paragraph>"
+
+
+class ObjectCount(Element):
+    __slots__ = ()
+
+    NAME = "text:object-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:object-count"
+    DEFAULT_START_TAG = "<text:object-count"
+    END_TAG = "</text:object-count>"
+
+
+class ObjectIndex(Element):
+    __slots__ = ()
+
+    NAME = "text:object-index"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:object-index"
+    DEFAULT_START_TAG = "<text:object-index"
+    END_TAG = "</text:object-index>"
+
+
+class ObjectIndexEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:object-index-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:object-index-entry-template"
+    DEFAULT_START_TAG = "<text:object-index-entry-template"
+    END_TAG = "</text:object-index-entry-template>"
+
+
+class ObjectIndexSource(Element):
+    __slots__ = ()
+
+    NAME = "text:object-index-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_index_scope": "text:index-scope",
+            "text_relative_tab_stop_position": "text:relative-tab-stop-position",
+            "text_use_chart_objects": "text:use-chart-objects",
+            "text_use_draw_objects": "text:use-draw-objects",
+            "text_use_math_objects": "text:use-math-objects",
+            "text_use_other_objects": "text:use-other-objects",
+            "text_use_spreadsheet_objects": "text:use-spreadsheet-objects",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:object-index-source"
+    DEFAULT_START_TAG = "<text:object-index-source"
+    END_TAG = "</text:object-index-source>"
+
+
+class OutlineLevelStyle(Element):
+    __slots__ = ()
+
+    NAME = "text:outline-level-style"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "style_num_prefix": "style:num-prefix",
+            "style_num_suffix": "style:num-suffix",
+            "text_display_levels": "text:display-levels",
+            "text_level": "text:level",
+            "text_start_value": "text:start-value",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:outline-level-style"
+    DEFAULT_START_TAG = "<text:outline-level-style"
+    END_TAG = "</text:outline-level-style>"
+
+
+class OutlineStyle(Element):
+    __slots__ = ()
+
+    NAME = "text:outline-style"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_name": "style:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:outline-style"
+    DEFAULT_START_TAG = "<text:outline-style"
+    END_TAG = "</text:outline-style>"
+
+
+class P(Element):
+    __slots__ = ()
+
+    NAME = "text:p"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_class_names": "text:class-names",
+            "text_cond_style_name": "text:cond-style-name",
+            "text_id": "text:id",
+            "text_style_name": "text:style-name",
+            "xhtml_about": "xhtml:about",
+            "xhtml_content": "xhtml:content",
+            "xhtml_datatype": "xhtml:datatype",
+            "xhtml_property": "xhtml:property",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType(
+        {
+            "text_style_name": "Text Body",
+        }
+    )
+    START_TAG = "<text:p"
+    DEFAULT_START_TAG = '<text:p text:style-name="Text Body"'
+    END_TAG = "</text:p>"
+
+
+class Page(Element):
+    __slots__ = ()
+
+    NAME = "text:page"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_master_page_name": "text:master-page-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page"
+    DEFAULT_START_TAG = "<text:page"
+    END_TAG = "</text:page>"
+
+
+class PageContinuation(Element):
+    __slots__ = ()
+
+    NAME = "text:page-continuation"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_select_page": "text:select-page",
+            "text_string_value": "text:string-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page-continuation"
+    DEFAULT_START_TAG = "<text:page-continuation"
+    END_TAG = "</text:page-continuation>"
+
+
+class PageCount(Element):
+    __slots__ = ()
+
+    NAME = "text:page-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page-count"
+    DEFAULT_START_TAG = "<text:page-count"
+    END_TAG = "</text:page-count>"
+
+
+class PageNumber(Element):
+    __slots__ = ()
+
+    NAME = "text:page-number"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "text_fixed": "text:fixed",
+            "text_page_adjust": "text:page-adjust",
+            "text_select_page": "text:select-page",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page-number"
+    DEFAULT_START_TAG = "<text:page-number"
+    END_TAG = "</text:page-number>"
+
+
+class PageSequence(Element):
+    __slots__ = ()
+
+    NAME = "text:page-sequence"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page-sequence"
+    DEFAULT_START_TAG = "<text:page-sequence"
+    END_TAG = "</text:page-sequence>"
+
+
+class PageVariableGet(Element):
+    __slots__ = ()
+
+    NAME = "text:page-variable-get"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page-variable-get"
+    DEFAULT_START_TAG = "<text:page-variable-get"
+    END_TAG = "</text:page-variable-get>"
+
+
+class PageVariableSet(Element):
+    __slots__ = ()
+
+    NAME = "text:page-variable-set"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_active": "text:active",
+            "text_page_adjust": "text:page-adjust",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:page-variable-set"
+    DEFAULT_START_TAG = "<text:page-variable-set"
+    END_TAG = "</text:page-variable-set>"
+
+
+class ParagraphCount(Element):
+    __slots__ = ()
+
+    NAME = "text:paragraph-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:paragraph-count"
+    DEFAULT_START_TAG = "<text:paragraph-count"
+    END_TAG = "</text:paragraph-count>"
+
+
+class Placeholder(Element):
+    __slots__ = ()
+
+    NAME = "text:placeholder"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_description": "text:description",
+            "text_placeholder_type": "text:placeholder-type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:placeholder"
+    DEFAULT_START_TAG = "<text:placeholder"
+    END_TAG = "</text:placeholder>"
+
+
+class PrintDate(Element):
+    __slots__ = ()
+
+    NAME = "text:print-date"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_date_value": "text:date-value",
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:print-date"
+    DEFAULT_START_TAG = "<text:print-date"
+    END_TAG = "</text:print-date>"
+
+
+class PrintTime(Element):
+    __slots__ = ()
+
+    NAME = "text:print-time"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_fixed": "text:fixed",
+            "text_time_value": "text:time-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:print-time"
+    DEFAULT_START_TAG = "<text:print-time"
+    END_TAG = "</text:print-time>"
+
+
+class PrintedBy(Element):
+    __slots__ = ()
+
+    NAME = "text:printed-by"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:printed-by"
+    DEFAULT_START_TAG = "<text:printed-by"
+    END_TAG = "</text:printed-by>"
+
+
+class ReferenceMark(Element):
+    __slots__ = ()
+
+    NAME = "text:reference-mark"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:reference-mark"
+    DEFAULT_START_TAG = "<text:reference-mark"
+    END_TAG = "</text:reference-mark>"
+
+
+class ReferenceMarkEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:reference-mark-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:reference-mark-end"
+    DEFAULT_START_TAG = "<text:reference-mark-end"
+    END_TAG = "</text:reference-mark-end>"
+
+
+class ReferenceMarkStart(Element):
+    __slots__ = ()
+
+    NAME = "text:reference-mark-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:reference-mark-start"
+    DEFAULT_START_TAG = "<text:reference-mark-start"
+    END_TAG = "</text:reference-mark-start>"
+
+
+class ReferenceRef(Element):
+    __slots__ = ()
+
+    NAME = "text:reference-ref"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_ref_name": "text:ref-name",
+            "text_reference_format": "text:reference-format",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:reference-ref"
+    DEFAULT_START_TAG = "<text:reference-ref"
+    END_TAG = "</text:reference-ref>"
+
+
+class Ruby(Element):
+    __slots__ = ()
+
+    NAME = "text:ruby"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:ruby"
+    DEFAULT_START_TAG = "<text:ruby"
+    END_TAG = "</text:ruby>"
+
+
+class RubyBase(Element):
+    __slots__ = ()
+
+    NAME = "text:ruby-base"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:ruby-base"
+    DEFAULT_START_TAG = "<text:ruby-base"
+    END_TAG = "</text:ruby-base>"
+
+
+class RubyText(Element):
+    __slots__ = ()
+
+    NAME = "text:ruby-text"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:ruby-text"
+    DEFAULT_START_TAG = "<text:ruby-text"
+    END_TAG = "</text:ruby-text>"
+
+
+class S(Element):
+    __slots__ = ()
+
+    NAME = "text:s"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_c": "text:c",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:s"
+    DEFAULT_START_TAG = "<text:s"
+    END_TAG = "</text:s>"
+
+
+class Script(Element):
+    __slots__ = ()
+
+    NAME = "text:script"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "script_language": "script:language",
+            "xlink_href": "xlink:href",
+            "xlink_type": "xlink:type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:script"
+    DEFAULT_START_TAG = "<text:script"
+    END_TAG = "</text:script>"
+
+
+class Section(Element):
+    __slots__ = ()
+
+    NAME = "text:section"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_condition": "text:condition",
+            "text_display": "text:display",
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:section"
+    DEFAULT_START_TAG = "<text:section"
+    END_TAG = "</text:section>"
+
+
+class SectionSource(Element):
+    __slots__ = ()
+
+    NAME = "text:section-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_filter_name": "text:filter-name",
+            "text_section_name": "text:section-name",
+            "xlink_href": "xlink:href",
+            "xlink_show": "xlink:show",
+            "xlink_type": "xlink:type",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:section-source"
+    DEFAULT_START_TAG = "<text:section-source"
+    END_TAG = "</text:section-source>"
+
+
+class SenderCity(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-city"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-city"
+    DEFAULT_START_TAG = "<text:sender-city"
+    END_TAG = "</text:sender-city>"
+
+
+class SenderCompany(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-company"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-company"
+    DEFAULT_START_TAG = "<text:sender-company"
+    END_TAG = "</text:sender-company>"
+
+
+class SenderCountry(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-country"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-country"
+    DEFAULT_START_TAG = "<text:sender-country"
+    END_TAG = "</text:sender-country>"
+
+
+class SenderEmail(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-email"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-email"
+    DEFAULT_START_TAG = "<text:sender-email"
+    END_TAG = "</text:sender-email>"
+
+
+class SenderFax(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-fax"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-fax"
+    DEFAULT_START_TAG = "<text:sender-fax"
+    END_TAG = "</text:sender-fax>"
+
+
+class SenderFirstname(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-firstname"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-firstname"
+    DEFAULT_START_TAG = "<text:sender-firstname"
+    END_TAG = "</text:sender-firstname>"
+
+
+class SenderInitials(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-initials"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-initials"
+    DEFAULT_START_TAG = "<text:sender-initials"
+    END_TAG = "</text:sender-initials>"
+
+
+class SenderLastname(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-lastname"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-lastname"
+    DEFAULT_START_TAG = "<text:sender-lastname"
+    END_TAG = "</text:sender-lastname>"
+
+
+class SenderPhonePrivate(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-phone-private"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-phone-private"
+    DEFAULT_START_TAG = "<text:sender-phone-private"
+    END_TAG = "</text:sender-phone-private>"
+
+
+class SenderPhoneWork(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-phone-work"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-phone-work"
+    DEFAULT_START_TAG = "<text:sender-phone-work"
+    END_TAG = "</text:sender-phone-work>"
+
+
+class SenderPosition(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-position"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-position"
+    DEFAULT_START_TAG = "<text:sender-position"
+    END_TAG = "</text:sender-position>"
+
+
+class SenderPostalCode(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-postal-code"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-postal-code"
+    DEFAULT_START_TAG = "<text:sender-postal-code"
+    END_TAG = "</text:sender-postal-code>"
+
+
+class SenderStateOrProvince(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-state-or-province"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-state-or-province"
+    DEFAULT_START_TAG = "<text:sender-state-or-province"
+    END_TAG = "</text:sender-state-or-province>"
+
+
+class SenderStreet(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-street"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-street"
+    DEFAULT_START_TAG = "<text:sender-street"
+    END_TAG = "</text:sender-street>"
+
+
+class SenderTitle(Element):
+    __slots__ = ()
+
+    NAME = "text:sender-title"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sender-title"
+    DEFAULT_START_TAG = "<text:sender-title"
+    END_TAG = "</text:sender-title>"
+
+
+class Sequence(Element):
+    __slots__ = ()
+
+    NAME = "text:sequence"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+            "text_formula": "text:formula",
+            "text_name": "text:name",
+            "text_ref_name": "text:ref-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sequence"
+    DEFAULT_START_TAG = "<text:sequence"
+    END_TAG = "</text:sequence>"
+
+
+class SequenceDecl(Element):
+    __slots__ = ()
+
+    NAME = "text:sequence-decl"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_display_outline_level": "text:display-outline-level",
+            "text_name": "text:name",
+            "text_separation_character": "text:separation-character",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sequence-decl"
+    DEFAULT_START_TAG = "<text:sequence-decl"
+    END_TAG = "</text:sequence-decl>"
+
+
+class SequenceDecls(Element):
+    __slots__ = ()
+
+    NAME = "text:sequence-decls"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sequence-decls"
+    DEFAULT_START_TAG = "<text:sequence-decls"
+    END_TAG = "</text:sequence-decls>"
+
+
+class SequenceRef(Element):
+    __slots__ = ()
+
+    NAME = "text:sequence-ref"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_ref_name": "text:ref-name",
+            "text_reference_format": "text:reference-format",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sequence-ref"
+    DEFAULT_START_TAG = "<text:sequence-ref"
+    END_TAG = "</text:sequence-ref>"
+
+
+class SheetName(Element):
+    __slots__ = ()
+
+    NAME = "text:sheet-name"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sheet-name"
+    DEFAULT_START_TAG = "<text:sheet-name"
+    END_TAG = "</text:sheet-name>"
+
+
+class SoftPageBreak(Element):
+    __slots__ = ()
+
+    NAME = "text:soft-page-break"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:soft-page-break"
+    DEFAULT_START_TAG = "<text:soft-page-break"
+    END_TAG = "</text:soft-page-break>"
+
+
+class SortKey(Element):
+    __slots__ = ()
+
+    NAME = "text:sort-key"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_key": "text:key",
+            "text_sort_ascending": "text:sort-ascending",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:sort-key"
+    DEFAULT_START_TAG = "<text:sort-key"
+    END_TAG = "</text:sort-key>"
+
+
+class Span(Element):
+    __slots__ = ()
+
+    NAME = "text:span"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_class_names": "text:class-names",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType(
+        {
+            "text_style_name": "Text Body",
+        }
+    )
+    START_TAG = "<text:span"
+    DEFAULT_START_TAG = '<text:span text:style-name="Text Body"'
+    END_TAG = "</text:span>"
+
+
+class Subject(Element):
+    __slots__ = ()
+
+    NAME = "text:subject"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:subject"
+    DEFAULT_START_TAG = "<text:subject"
+    END_TAG = "</text:subject>"
+
+
+class Tab(Element):
+    __slots__ = ()
+
+    NAME = "text:tab"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_tab_ref": "text:tab-ref",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:tab"
+    DEFAULT_START_TAG = "<text:tab"
+    END_TAG = "</text:tab>"
+
+
+class TableCount(Element):
+    __slots__ = ()
+
+    NAME = "text:table-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-count"
+    DEFAULT_START_TAG = "<text:table-count"
+    END_TAG = "</text:table-count>"
+
+
+class TableFormula(Element):
+    __slots__ = ()
+
+    NAME = "text:table-formula"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_display": "text:display",
+            "text_formula": "text:formula",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-formula"
+    DEFAULT_START_TAG = "<text:table-formula"
+    END_TAG = "</text:table-formula>"
+
+
+class TableIndex(Element):
+    __slots__ = ()
+
+    NAME = "text:table-index"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-index"
+    DEFAULT_START_TAG = "<text:table-index"
+    END_TAG = "</text:table-index>"
+
+
+class TableIndexEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:table-index-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-index-entry-template"
+    DEFAULT_START_TAG = "<text:table-index-entry-template"
+    END_TAG = "</text:table-index-entry-template>"
+
+
+class TableIndexSource(Element):
+    __slots__ = ()
+
+    NAME = "text:table-index-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_caption_sequence_format": "text:caption-sequence-format",
+            "text_caption_sequence_name": "text:caption-sequence-name",
+            "text_index_scope": "text:index-scope",
+            "text_relative_tab_stop_position": "text:relative-tab-stop-position",
+            "text_use_caption": "text:use-caption",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-index-source"
+    DEFAULT_START_TAG = "<text:table-index-source"
+    END_TAG = "</text:table-index-source>"
+
+
+class TableOfContent(Element):
+    __slots__ = ()
+
+    NAME = "text:table-of-content"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-of-content"
+    DEFAULT_START_TAG = "<text:table-of-content"
+    END_TAG = "</text:table-of-content>"
+
+
+class TableOfContentEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:table-of-content-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_outline_level": "text:outline-level",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-of-content-entry-template"
+    DEFAULT_START_TAG = "<text:table-of-content-entry-template"
+    END_TAG = "</text:table-of-content-entry-template>"
+
+
+class TableOfContentSource(Element):
+    __slots__ = ()
+
+    NAME = "text:table-of-content-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_index_scope": "text:index-scope",
+            "text_outline_level": "text:outline-level",
+            "text_relative_tab_stop_position": "text:relative-tab-stop-position",
+            "text_use_index_marks": "text:use-index-marks",
+            "text_use_index_source_styles": "text:use-index-source-styles",
+            "text_use_outline_level": "text:use-outline-level",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:table-of-content-source"
+    DEFAULT_START_TAG = "<text:table-of-content-source"
+    END_TAG = "</text:table-of-content-source>"
+
+
+class TemplateName(Element):
+    __slots__ = ()
+
+    NAME = "text:template-name"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_display": "text:display",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:template-name"
+    DEFAULT_START_TAG = "<text:template-name"
+    END_TAG = "</text:template-name>"
+
+
+class TextInput(Element):
+    __slots__ = ()
+
+    NAME = "text:text-input"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_description": "text:description",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:text-input"
+    DEFAULT_START_TAG = "<text:text-input"
+    END_TAG = "</text:text-input>"
+
+
+class Time(Element):
+    __slots__ = ()
+
+    NAME = "text:time"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_fixed": "text:fixed",
+            "text_time_adjust": "text:time-adjust",
+            "text_time_value": "text:time-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:time"
+    DEFAULT_START_TAG = "<text:time"
+    END_TAG = "</text:time>"
+
+
+class Title(Element):
+    __slots__ = ()
+
+    NAME = "text:title"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_fixed": "text:fixed",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:title"
+    DEFAULT_START_TAG = "<text:title"
+    END_TAG = "</text:title>"
+
+
+class TocMark(Element):
+    __slots__ = ()
+
+    NAME = "text:toc-mark"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_outline_level": "text:outline-level",
+            "text_string_value": "text:string-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:toc-mark"
+    DEFAULT_START_TAG = "<text:toc-mark"
+    END_TAG = "</text:toc-mark>"
+
+
+class TocMarkEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:toc-mark-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:toc-mark-end"
+    DEFAULT_START_TAG = "<text:toc-mark-end"
+    END_TAG = "</text:toc-mark-end>"
+
+
+class TocMarkStart(Element):
+    __slots__ = ()
+
+    NAME = "text:toc-mark-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+            "text_outline_level": "text:outline-level",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:toc-mark-start"
+    DEFAULT_START_TAG = "<text:toc-mark-start"
+    END_TAG = "</text:toc-mark-start>"
+
+
+class TrackedChanges(Element):
+    __slots__ = ()
+
+    NAME = "text:tracked-changes"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_track_changes": "text:track-changes",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:tracked-changes"
+    DEFAULT_START_TAG = "<text:tracked-changes"
+    END_TAG = "</text:tracked-changes>"
+
+
+class UserDefined(Element):
+    __slots__ = ()
+
+    NAME = "text:user-defined"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_boolean_value": "office:boolean-value",
+            "office_date_value": "office:date-value",
+            "office_string_value": "office:string-value",
+            "office_time_value": "office:time-value",
+            "office_value": "office:value",
+            "style_data_style_name": "style:data-style-name",
+            "text_fixed": "text:fixed",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-defined"
+    DEFAULT_START_TAG = "<text:user-defined"
+    END_TAG = "</text:user-defined>"
+
+
+class UserFieldDecl(Element):
+    __slots__ = ()
+
+    NAME = "text:user-field-decl"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_boolean_value": "office:boolean-value",
+            "office_currency": "office:currency",
+            "office_date_value": "office:date-value",
+            "office_string_value": "office:string-value",
+            "office_time_value": "office:time-value",
+            "office_value": "office:value",
+            "office_value_type": "office:value-type",
+            "text_formula": "text:formula",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-field-decl"
+    DEFAULT_START_TAG = "<text:user-field-decl"
+    END_TAG = "</text:user-field-decl>"
+
+
+class UserFieldDecls(Element):
+    __slots__ = ()
+
+    NAME = "text:user-field-decls"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-field-decls"
+    DEFAULT_START_TAG = "<text:user-field-decls"
+    END_TAG = "</text:user-field-decls>"
+
+
+class UserFieldGet(Element):
+    __slots__ = ()
+
+    NAME = "text:user-field-get"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_display": "text:display",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-field-get"
+    DEFAULT_START_TAG = "<text:user-field-get"
+    END_TAG = "</text:user-field-get>"
+
+
+class UserFieldInput(Element):
+    __slots__ = ()
+
+    NAME = "text:user-field-input"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_description": "text:description",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-field-input"
+    DEFAULT_START_TAG = "<text:user-field-input"
+    END_TAG = "</text:user-field-input>"
+
+
+class UserIndex(Element):
+    __slots__ = ()
+
+    NAME = "text:user-index"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_name": "text:name",
+            "text_protected": "text:protected",
+            "text_protection_key": "text:protection-key",
+            "text_protection_key_digest_algorithm": "text:protection-key-digest-algorithm",  # noqa: E501
+            "text_style_name": "text:style-name",
+            "xml_id": "xml:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-index"
+    DEFAULT_START_TAG = "<text:user-index"
+    END_TAG = "</text:user-index>"
+
+
+class UserIndexEntryTemplate(Element):
+    __slots__ = ()
+
+    NAME = "text:user-index-entry-template"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_outline_level": "text:outline-level",
+            "text_style_name": "text:style-name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-index-entry-template"
+    DEFAULT_START_TAG = "<text:user-index-entry-template"
+    END_TAG = "</text:user-index-entry-template>"
+
+
+class UserIndexMark(Element):
+    __slots__ = ()
+
+    NAME = "text:user-index-mark"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_index_name": "text:index-name",
+            "text_outline_level": "text:outline-level",
+            "text_string_value": "text:string-value",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-index-mark"
+    DEFAULT_START_TAG = "<text:user-index-mark"
+    END_TAG = "</text:user-index-mark>"
+
+
+class UserIndexMarkEnd(Element):
+    __slots__ = ()
+
+    NAME = "text:user-index-mark-end"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-index-mark-end"
+    DEFAULT_START_TAG = "<text:user-index-mark-end"
+    END_TAG = "</text:user-index-mark-end>"
+
+
+class UserIndexMarkStart(Element):
+    __slots__ = ()
+
+    NAME = "text:user-index-mark-start"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_id": "text:id",
+            "text_index_name": "text:index-name",
+            "text_outline_level": "text:outline-level",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-index-mark-start"
+    DEFAULT_START_TAG = "<text:user-index-mark-start"
+    END_TAG = "</text:user-index-mark-start>"
+
+
+class UserIndexSource(Element):
+    __slots__ = ()
+
+    NAME = "text:user-index-source"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "text_copy_outline_levels": "text:copy-outline-levels",
+            "text_index_name": "text:index-name",
+            "text_index_scope": "text:index-scope",
+            "text_relative_tab_stop_position": "text:relative-tab-stop-position",
+            "text_use_floating_frames": "text:use-floating-frames",
+            "text_use_graphics": "text:use-graphics",
+            "text_use_index_marks": "text:use-index-marks",
+            "text_use_index_source_styles": "text:use-index-source-styles",
+            "text_use_objects": "text:use-objects",
+            "text_use_tables": "text:use-tables",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:user-index-source"
+    DEFAULT_START_TAG = "<text:user-index-source"
+    END_TAG = "</text:user-index-source>"
+
+
+class VariableDecl(Element):
+    __slots__ = ()
+
+    NAME = "text:variable-decl"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_value_type": "office:value-type",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:variable-decl"
+    DEFAULT_START_TAG = "<text:variable-decl"
+    END_TAG = "</text:variable-decl>"
+
+
+class VariableDecls(Element):
+    __slots__ = ()
+
+    NAME = "text:variable-decls"
+    ATTRIBUTES = MappingProxyType({})
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:variable-decls"
+    DEFAULT_START_TAG = "<text:variable-decls"
+    END_TAG = "</text:variable-decls>"
+
+
+class VariableGet(Element):
+    __slots__ = ()
+
+    NAME = "text:variable-get"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_data_style_name": "style:data-style-name",
+            "text_display": "text:display",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:variable-get"
+    DEFAULT_START_TAG = "<text:variable-get"
+    END_TAG = "</text:variable-get>"
+
+
+class VariableInput(Element):
+    __slots__ = ()
+
+    NAME = "text:variable-input"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_value_type": "office:value-type",
+            "style_data_style_name": "style:data-style-name",
+            "text_description": "text:description",
+            "text_display": "text:display",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:variable-input"
+    DEFAULT_START_TAG = "<text:variable-input"
+    END_TAG = "</text:variable-input>"
+
+
+class VariableSet(Element):
+    __slots__ = ()
+
+    NAME = "text:variable-set"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "office_boolean_value": "office:boolean-value",
+            "office_currency": "office:currency",
+            "office_date_value": "office:date-value",
+            "office_string_value": "office:string-value",
+            "office_time_value": "office:time-value",
+            "office_value": "office:value",
+            "office_value_type": "office:value-type",
+            "style_data_style_name": "style:data-style-name",
+            "text_display": "text:display",
+            "text_formula": "text:formula",
+            "text_name": "text:name",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:variable-set"
+    DEFAULT_START_TAG = "<text:variable-set"
+    END_TAG = "</text:variable-set>"
+
+
+class WordCount(Element):
+    __slots__ = ()
+
+    NAME = "text:word-count"
+    ATTRIBUTES = MappingProxyType(
+        {
+            "style_num_format": "style:num-format",
+            "style_num_letter_sync": "style:num-letter-sync",
+        }
+    )
+    DEFAULT_ATTRS = MappingProxyType({})
+    START_TAG = "<text:word-count"
+    DEFAULT_START_TAG = "<text:word-count"
+    END_TAG = "</text:word-count>"
+
+
+# The classes by the qualified names of their elements
+ELEMENTS = {
+    "text:a": A,
+    "text:alphabetical-index": AlphabeticalIndex,
+    "text:alphabetical-index-auto-mark-file": AlphabeticalIndexAutoMarkFile,
+    "text:alphabetical-index-entry-template": AlphabeticalIndexEntryTemplate,
+    "text:alphabetical-index-mark": AlphabeticalIndexMark,
+    "text:alphabetical-index-mark-end": AlphabeticalIndexMarkEnd,
+    "text:alphabetical-index-mark-start": AlphabeticalIndexMarkStart,
+    "text:alphabetical-index-source": AlphabeticalIndexSource,
+    "text:author-initials": AuthorInitials,
+    "text:author-name": AuthorName,
+    "text:bibliography": Bibliography,
+    "text:bibliography-configuration": BibliographyConfiguration,
+    "text:bibliography-entry-template": BibliographyEntryTemplate,
+    "text:bibliography-mark": BibliographyMark,
+    "text:bibliography-source": BibliographySource,
+    "text:bookmark": Bookmark,
+    "text:bookmark-end": BookmarkEnd,
+    "text:bookmark-ref": BookmarkRef,
+    "text:bookmark-start": BookmarkStart,
+    "text:change": Change,
+    "text:change-end": ChangeEnd,
+    "text:change-start": ChangeStart,
+    "text:changed-region": ChangedRegion,
+    "text:chapter": Chapter,
+    "text:character-count": CharacterCount,
+    "text:conditional-text": ConditionalText,
+    "text:creation-date": CreationDate,
+    "text:creation-time": CreationTime,
+    "text:creator": Creator,
+    "text:database-display": DatabaseDisplay,
+    "text:database-name": DatabaseName,
+    "text:database-next": DatabaseNext,
+    "text:database-row-number": DatabaseRowNumber,
+    "text:database-row-select": DatabaseRowSelect,
+    "text:date": Date,
+    "text:dde-connection": DdeConnection,
+    "text:dde-connection-decl": DdeConnectionDecl,
+    "text:dde-connection-decls": DdeConnectionDecls,
+    "text:deletion": Deletion,
+    "text:description": Description,
+    "text:editing-cycles": EditingCycles,
+    "text:editing-duration": EditingDuration,
+    "text:execute-macro": ExecuteMacro,
+    "text:expression": Expression,
+    "text:file-name": FileName,
+    "text:format-change": FormatChange,
+    "text:h": H,
+    "text:hidden-paragraph": HiddenParagraph,
+    "text:hidden-text": HiddenText,
+    "text:illustration-index": IllustrationIndex,
+    "text:illustration-index-entry-template": IllustrationIndexEntryTemplate,
+    "text:illustration-index-source": IllustrationIndexSource,
+    "text:image-count": ImageCount,
+    "text:index-body": IndexBody,
+    "text:index-entry-bibliography": IndexEntryBibliography,
+    "text:index-entry-chapter": IndexEntryChapter,
+    "text:index-entry-link-end": IndexEntryLinkEnd,
+    "text:index-entry-link-start": IndexEntryLinkStart,
+    "text:index-entry-page-number": IndexEntryPageNumber,
+    "text:index-entry-span": IndexEntrySpan,
+    "text:index-entry-tab-stop": IndexEntryTabStop,
+    "text:index-entry-text": IndexEntryText,
+    "text:index-source-style": IndexSourceStyle,
+    "text:index-source-styles": IndexSourceStyles,
+    "text:index-title": IndexTitle,
+    "text:index-title-template": IndexTitleTemplate,
+    "text:initial-creator": InitialCreator,
+    "text:insertion": Insertion,
+    "text:keywords": Keywords,
+    "text:line-break": LineBreak,
+    "text:linenumbering-configuration": LinenumberingConfiguration,
+    "text:linenumbering-separator": LinenumberingSeparator,
+    "text:list": List,
+    "text:list-header": ListHeader,
+    "text:list-item": ListItem,
+    "text:list-level-style-bullet": ListLevelStyleBullet,
+    "text:list-level-style-image": ListLevelStyleImage,
+    "text:list-level-style-number": ListLevelStyleNumber,
+    "text:list-style": ListStyle,
+    "text:measure": Measure,
+    "text:meta": Meta,
+    "text:meta-field": MetaField,
+    "text:modification-date": ModificationDate,
+    "text:modification-time": ModificationTime,
+    "text:note": Note,
+    "text:note-body": NoteBody,
+    "text:note-citation": NoteCitation,
+    "text:note-continuation-notice-backward": NoteContinuationNoticeBackward,
+    "text:note-continuation-notice-forward": NoteContinuationNoticeForward,
+    "text:note-ref": NoteRef,
+    "text:notes-configuration": NotesConfiguration,
+    "text:number": Number,
+    "text:numbered-paragraph": NumberedParagraph,
+    "text:object-count": ObjectCount,
+    "text:object-index": ObjectIndex,
+    "text:object-index-entry-template": ObjectIndexEntryTemplate,
+    "text:object-index-source": ObjectIndexSource,
+    "text:outline-level-style": OutlineLevelStyle,
+    "text:outline-style": OutlineStyle,
+    "text:p": P,
+    "text:page": Page,
+    "text:page-continuation": PageContinuation,
+    "text:page-count": PageCount,
+    "text:page-number": PageNumber,
+    "text:page-sequence": PageSequence,
+    "text:page-variable-get": PageVariableGet,
+    "text:page-variable-set": PageVariableSet,
+    "text:paragraph-count": ParagraphCount,
+    "text:placeholder": Placeholder,
+    "text:print-date": PrintDate,
+    "text:print-time": PrintTime,
+    "text:printed-by": PrintedBy,
+    "text:reference-mark": ReferenceMark,
+    "text:reference-mark-end": ReferenceMarkEnd,
+    "text:reference-mark-start": ReferenceMarkStart,
+    "text:reference-ref": ReferenceRef,
+    "text:ruby": Ruby,
+    "text:ruby-base": RubyBase,
+    "text:ruby-text": RubyText,
+    "text:s": S,
+    "text:script": Script,
+    "text:section": Section,
+    "text:section-source": SectionSource,
+    "text:sender-city": SenderCity,
+    "text:sender-company": SenderCompany,
+    "text:sender-country": SenderCountry,
+    "text:sender-email": SenderEmail,
+    "text:sender-fax": SenderFax,
+    "text:sender-firstname": SenderFirstname,
+    "text:sender-initials": SenderInitials,
+    "text:sender-lastname": SenderLastname,
+    "text:sender-phone-private": SenderPhonePrivate,
+    "text:sender-phone-work": SenderPhoneWork,
+    "text:sender-position": SenderPosition,
+    "text:sender-postal-code": SenderPostalCode,
+    "text:sender-state-or-province": SenderStateOrProvince,
+    "text:sender-street": SenderStreet,
+    "text:sender-title": SenderTitle,
+    "text:sequence": Sequence,
+    "text:sequence-decl": SequenceDecl,
+    "text:sequence-decls": SequenceDecls,
+    "text:sequence-ref": SequenceRef,
+    "text:sheet-name": SheetName,
+    "text:soft-page-break": SoftPageBreak,
+    "text:sort-key": SortKey,
+    "text:span": Span,
+    "text:subject": Subject,
+    "text:tab": Tab,
+    "text:table-count": TableCount,
+    "text:table-formula": TableFormula,
+    "text:table-index": TableIndex,
+    "text:table-index-entry-template": TableIndexEntryTemplate,
+    "text:table-index-source": TableIndexSource,
+    "text:table-of-content": TableOfContent,
+    "text:table-of-content-entry-template": TableOfContentEntryTemplate,
+    "text:table-of-content-source": TableOfContentSource,
+    "text:template-name": TemplateName,
+    "text:text-input": TextInput,
+    "text:time": Time,
+    "text:title": Title,
+    "text:toc-mark": TocMark,
+    "text:toc-mark-end": TocMarkEnd,
+    "text:toc-mark-start": TocMarkStart,
+    "text:tracked-changes": TrackedChanges,
+    "text:user-defined": UserDefined,
+    "text:user-field-decl": UserFieldDecl,
+    "text:user-field-decls": UserFieldDecls,
+    "text:user-field-get": UserFieldGet,
+    "text:user-field-input": UserFieldInput,
+    "text:user-index": UserIndex,
+    "text:user-index-entry-template": UserIndexEntryTemplate,
+    "text:user-index-mark": UserIndexMark,
+    "text:user-index-mark-end": UserIndexMarkEnd,
+    "text:user-index-mark-start": UserIndexMarkStart,
+    "text:user-index-source": UserIndexSource,
+    "text:variable-decl": VariableDecl,
+    "text:variable-decls": VariableDecls,
+    "text:variable-get": VariableGet,
+    "text:variable-input": VariableInput,
+    "text:variable-set": VariableSet,
+    "text:word-count": WordCount,
+}
@@ -1,39 +1,215 @@
-import xml.dom.minidom
+import re
+import threading
+import time
 import zipfile
-from datetime import datetime as Datetime
+import zlib
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import (
+    date as Date,
+    datetime as Datetime,
+    time as Time,
+    timedelta as Timedelta,
+)
 from decimal import Decimal
-from tempfile import NamedTemporaryFile
+from functools import partial
+from itertools import chain, groupby, islice, repeat
+from operator import itemgetter
+from tempfile import NamedTemporaryFile, TemporaryFile
 from xml.dom import Node
+from xml.parsers import expat
 
 import odio
-from odio.common import H, P, Span
+from odio.common import escape, python_name, qualified_name, quoteattr
+from odio.v1_2.line_breaks import LINE_BREAK_ELEMENTS
 
 
 OFFICE_VALUE_TYPE = "office:value-type"
 
+SPREADSHEET_MIMETYPE = "application/vnd.oasis.opendocument.spreadsheet"
 
-def escape(data):
-    return data.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+TEXT_MIMETYPE = "application/vnd.oasis.opendocument.text"
 
+CHUNK_SIZE = 64 * 1024
 
-def quoteattr(data):
-    data = escape(data)
+SORT_BUFFER = 1_000_000
 
-    if '"' in data:
-        if "'" in data:
-            data = '"%s"' % data.replace('"', "&quot;")
+SPILL_BATCH = 1000
+
+START_ELEMENT = 0
+END_ELEMENT = 1
+CHARACTERS = 2
+
+PARAGRAPHS = frozenset(("text:h", "text:p"))
+
+COLUMNS_REPEATED = "table:number-columns-repeated"
+
+CELLS = frozenset(("table:covered-table-cell", "table:table-cell"))
+
+STYLE_CONTAINERS = frozenset(("office:automatic-styles", "office:styles"))
+
+# The kinds of value of the data styles
+DATA_STYLES = {
+    "number:boolean-style": "boolean",
+    "number:currency-style": "currency",
+    "number:date-style": "date",
+    "number:number-style": "number",
+    "number:percentage-style": "percentage",
+    "number:text-style": "text",
+    "number:time-style": "time",
+}
+
+# The data styles written for each kind of date and time value, when the cell
+# doesn't have a Style that says otherwise
+DATE_DATA_STYLES = {
+    "datetime": "date",
+    "date": "day",
+    "time": "time",
+    "duration": "duration",
+}
+
+# The parts of a date style that show the time of day
+TIME_FIELDS = frozenset(
+    ("number:am-pm", "number:hours", "number:minutes", "number:seconds")
+)
+
+DATE_VALUE = re.compile(r"(-?\d+)-(\d+)-(\d+)(?:T(\d+):(\d+):(\d+)(?:\.(\d+))?)?")
+
+TIME_VALUE = re.compile(
+    r"(-)?P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?"
+)
+
+WHITESPACE = re.compile("[ \t\r\n]+")
+
+DOCUMENT_CONTENT_ATTRS = {
+    "xmlns:office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
+    "xmlns:style": "urn:oasis:names:tc:opendocument:xmlns:style:1.0",
+    "xmlns:text": "urn:oasis:names:tc:opendocument:xmlns:text:1.0",
+    "xmlns:table": "urn:oasis:names:tc:opendocument:xmlns:table:1.0",
+    "xmlns:draw": "urn:oasis:names:tc:opendocument:xmlns:drawing:1.0",
+    "xmlns:fo": "urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0",
+    "xmlns:xlink": "http://www.w3.org/1999/xlink",
+    "xmlns:dc": "http://purl.org/dc/elements/1.1/",
+    "xmlns:meta": "urn:oasis:names:tc:opendocument:xmlns:meta:1.0",
+    "xmlns:number": "urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0",
+    "xmlns:presentation": "urn:oasis:names:tc:opendocument:xmlns:presentation:1.0",
+    "xmlns:svg": "urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0",
+    "xmlns:chart": "urn:oasis:names:tc:opendocument:xmlns:chart:1.0",
+    "xmlns:dr3d": "urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0",
+    "xmlns:math": "http://www.w3.org/1998/Math/MathML",
+    "xmlns:form": "urn:oasis:names:tc:opendocument:xmlns:form:1.0",
+    "xmlns:script": "urn:oasis:names:tc:opendocument:xmlns:script:1.0",
+    "xmlns:dom": "http://www.w3.org/2001/xml-events",
+    "xmlns:xforms": "http://www.w3.org/2002/xforms",
+    "xmlns:xsd": "http://www.w3.org/2001/XMLSchema",
+    "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+    "xmlns:of": "urn:oasis:names:tc:opendocument:xmlns:of:1.2",
+    "xmlns:xhtml": "http://www.w3.org/1999/xhtml",
+    "xmlns:css3t": "http://www.w3.org/TR/css3-text/",
+    "office:version": "1.2",
+}
+
+
+class ValidationError(Exception):
+    pass
+
+
+class LimitExceeded(Exception):
+    pass
+
+
+class Validator:
+    # Checks each element as it's written or read, against the tables compiled
+    # from the ODF schema by gen/compile_schema.py. It checks that an element is
+    # allowed in its parent, that its attributes are allowed and the required ones
+    # are there, that enumerated attribute values are valid and that text only
+    # appears where it's allowed. The order and number of child elements aren't
+    # checked. Elements and attributes from namespaces that the schema doesn't
+    # know about are allowed anywhere, as the spec allows, and elements of
+    # namespaces that aren't checked aren't looked into.
+    def __init__(self, context=()):
+        from odio.v1_2 import schema
+
+        self.elements = schema.ELEMENTS
+        self.roots = schema.ROOTS
+        self.prefixes = schema.PREFIXES
+        self.stack = [(name, schema.ELEMENTS[name]) for name in context]
+
+    def start(self, name, attrs):
+        stack = self.stack
+        if len(stack) == 0:
+            if name not in self.roots:
+                raise ValidationError(f"The element '{name}' can't be the root.")
         else:
-            data = "'%s'" % data
-    else:
-        data = '"%s"' % data
-    return data
+            parent, parent_rule = stack[-1]
+            if parent_rule is None:
+                stack.append((name, None))
+                return
+            children = parent_rule[0]
+            if children is not None and name not in children:
+                if name.partition(":")[0] in self.prefixes:
+                    raise ValidationError(
+                        f"The element '{name}' isn't allowed in '{parent}'."
+                    )
+
+        rule = self.elements.get(name)
+        stack.append((name, rule))
+        if rule is None:
+            return
+
+        allowed, required, values = rule[1], rule[2], rule[4]
+        for k, v in attrs.items():
+            if allowed is not None and k not in allowed:
+                if k.partition(":")[0] in self.prefixes:
+                    raise ValidationError(
+                        f"The attribute '{k}' isn't allowed in '{name}'."
+                    )
+            elif k in values and v not in values[k]:
+                raise ValidationError(
+                    f"The value '{v}' of the attribute '{k}' of '{name}' isn't "
+                    f"allowed."
+                )
+        if len(required) > 0:
+            for k in required:
+                if k not in attrs:
+                    raise ValidationError(
+                        f"The element '{name}' must have the attribute '{k}'."
+                    )
+
+    def end(self):
+        self.stack.pop()
+
+    def text(self, data):
+        name, rule = self.stack[-1]
+        if rule is not None and not rule[3] and not data.isspace():
+            raise ValidationError(f"Text isn't allowed in '{name}'.")
+
+    def node(self, node):
+        stack = [node]
+        pop = stack.pop
+        push = stack.append
+        while len(stack) > 0:
+            item = pop()
+            if isinstance(item, str):
+                self.text(item)
+            elif item is None:
+                self.end()
+            else:
+                self.start(
+                    item.name,
+                    {qualified_name(k): v for k, v in item._attrs.items()},
+                )
+                push(None)
+                stack.extend(reversed(item.nodes))
 
 
 class XmlWriter:
-    def __init__(self, output):
-        self.indentation = 0
+    def __init__(self, output, declaration=True, indentation=0, validator=None):
+        self.indentation = indentation
         self.output = output
-        self._write('<?xml version="1.0" encoding="utf-8"?>\n')
+        self.validator = validator
+        if declaration:
+            self._write('<?xml version="1.0" encoding="utf-8"?>\n')
 
     @staticmethod
     def atts_to_str(attrs):
@@ -50,51 +226,356 @@ class XmlWriter:
         self.output.write(line.encode("utf8"))
 
     def start_tag(self, name, attrs):
+        if self.validator is not None:
+            self.validator.start(name, attrs)
         self._write(f"<{name}{XmlWriter.atts_to_str(attrs)}>\n")
         self.indentation += 1
 
     def end_tag(self, name):
+        if self.validator is not None:
+            self.validator.end()
         self.indentation -= 1
         self._write(f"</{name}>\n")
 
     def simple_tag(self, name, attrs, contents=None):
+        if self.validator is not None:
+            self.validator.start(name, attrs)
+            if contents is not None:
+                self.validator.text(contents)
+            self.validator.end()
         if contents is None:
             self._write(f"<{name}{XmlWriter.atts_to_str(attrs)}/>\n")
         else:
             self._write(f"<{name}{XmlWriter.atts_to_str(attrs)}>")
             content = escape(contents)
-            if name in (
-                "text:a",
-                "text:h",
-                "text:meta",
-                "text:meta-field",
-                "text:p",
-                "text:ruby-base",
-                "text:span",
-            ):
+            if name in LINE_BREAK_ELEMENTS:
                 content = "<text:line-break/>".join(content.splitlines())
             self._write(content, indent=False)
             self._write(f"</{name}>\n", indent=False)
 
+    def node(self, node):
+        if self.validator is not None:
+            self.validator.node(node)
+        self._write(node.to_xml() + "\n")
 
-class SpreadsheetWriter:
-    def __init__(self, f, compressed):
-        self.f = f
+
+def _gf2_matrix_times(mat, vec):
+    total = 0
+    i = 0
+    while vec:
+        if vec & 1:
+            total ^= mat[i]
+        vec >>= 1
+        i += 1
+    return total
+
+
+def _gf2_matrix_square(mat):
+    return [_gf2_matrix_times(mat, mat[n]) for n in range(32)]
+
+
+def crc32_combine(crc1, crc2, len2):
+    # The CRC-32 of two pieces of data joined together, given the CRC-32 of each
+    # and the length of the second. A port of crc32_combine() from zlib. The CRC
+    # is linear in crc1, so when it's 0, such as for the first of a list of
+    # fragments, the result is crc2.
+    if len2 == 0:
+        return crc1
+    elif crc1 == 0:
+        return crc2
+
+    odd = [0xEDB88320] + [1 << n for n in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+    while True:
+        even = _gf2_matrix_square(odd)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        len2 >>= 1
+        if len2 == 0:
+            break
+        odd = _gf2_matrix_square(even)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        len2 >>= 1
+        if len2 == 0:
+            break
+    return crc1 ^ crc2
+
+
+# The final, empty, block of a raw deflate stream
+DEFLATE_END = zlib.compressobj(wbits=-15).flush()
+
+
+class Fragment:
+    # A piece of a zip entry that's compressed on its own, as it's written, into a
+    # spill file. Each fragment ends with a sync flush, and so fragments written
+    # concurrently can be joined into one deflate stream afterwards.
+    def __init__(self, compressed):
+        self.spill = TemporaryFile()
         if compressed:
-            compression = zipfile.ZIP_DEFLATED
+            self.compressor = zlib.compressobj(wbits=-15)
         else:
-            compression = zipfile.ZIP_STORED
-        self.z = zipfile.ZipFile(f, "w", compression)
-        self.z.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet")
-        self.z.writestr(
+            self.compressor = None
+        self.buf = []
+        self.buf_size = 0
+        self.crc = 0
+        self.size = 0
+        self.compress_size = 0
+
+    def write(self, data):
+        self.buf.append(data)
+        self.buf_size += len(data)
+        if self.buf_size >= CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        data = b"".join(self.buf)
+        self.buf.clear()
+        self.buf_size = 0
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        self.spill.write(data)
+
+    def close(self):
+        self._flush()
+        if self.compressor is not None:
+            self.spill.write(self.compressor.flush(zlib.Z_SYNC_FLUSH))
+            self.compressor = None
+        self.compress_size = self.spill.tell()
+        self.spill.seek(0)
+
+    def chunks(self):
+        read = self.spill.read
+        while True:
+            chunk = read(CHUNK_SIZE)
+            if len(chunk) == 0:
+                break
+            yield chunk
+        self.spill.close()
+
+
+def write_raw_entry(z, name, fragments, compressed):
+    # Writes an entry from already compressed fragments. The zip module has no
+    # public API for this, so the entry is added the way ZipFile.writestr() does.
+    crc = 0
+    file_size = 0
+    compress_size = len(DEFLATE_END) if compressed else 0
+    for fragment in fragments:
+        crc = crc32_combine(crc, fragment.crc, fragment.size)
+        file_size += fragment.size
+        compress_size += fragment.compress_size
+
+    zinfo = zipfile.ZipInfo(name, time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_DEFLATED if compressed else zipfile.ZIP_STORED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = compress_size
+    zip64 = max(file_size, compress_size) > zipfile.ZIP64_LIMIT
+    with z._lock:
+        if z._seekable:
+            z.fp.seek(z.start_dir)
+        zinfo.header_offset = z.fp.tell()
+        z._writecheck(zinfo)
+        z._didModify = True
+        z.fp.write(zinfo.FileHeader(zip64))
+        for fragment in fragments:
+            for chunk in fragment.chunks():
+                z.fp.write(chunk)
+        if compressed:
+            z.fp.write(DEFLATE_END)
+        z.filelist.append(zinfo)
+        z.NameToInfo[name] = zinfo
+        z.start_dir = z.fp.tell()
+
+
+def _time_value_str(hours, minutes, seconds, microseconds, sign=""):
+    # An office:time-value, which is an ISO 8601 duration such as PT16H38M00S
+    if microseconds == 0:
+        return f"{sign}PT{hours:02d}H{minutes:02d}M{seconds:02d}S"
+    return f"{sign}PT{hours:02d}H{minutes:02d}M{seconds:02d}.{microseconds:06d}S"
+
+
+def _duration_str(val):
+    # Durations of a day or more are written in hours, as spreadsheet applications
+    # do
+    sign = "-" if val < Timedelta() else ""
+    val = abs(val)
+    minutes, seconds = divmod(val.days * 86400 + val.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return _time_value_str(hours, minutes, seconds, val.microseconds, sign)
+
+
+class StyleRegistry:
+    # Identical styles are interned, so each distinct style is written once
+    # however many cells use it.
+    def __init__(self):
+        # Cell styles are keyed by the Style and the kind of date or time value, if
+        # any. The style of datetime cells that don't have a Style is always there.
+        self.cell_styles = {(None, "datetime"): "cell_date"}
+        self.data_styles = {}
+        self.lock = threading.Lock()
+
+    def cell_style_name(self, style, kind=None):
+        key = (style, kind)
+        try:
+            return self.cell_styles[key]
+        except KeyError:
+            pass
+
+        # Tables may be written from several threads at once
+        with self.lock:
+            try:
+                return self.cell_styles[key]
+            except KeyError:
+                name = self.cell_styles[key] = f"ce{len(self.cell_styles)}"
+                return name
+
+    def data_style_name(self, style, kind):
+        if style is None:
+            return DATE_DATA_STYLES[kind]
+        key = (
+            style.decimal_places,
+            style.grouping,
+            style.percentage,
+            style.currency,
+            style.currency_symbol,
+        )
+        if key == (None, False, False, None, None):
+            return DATE_DATA_STYLES.get(kind)
+        try:
+            return self.data_styles[key]
+        except KeyError:
+            name = self.data_styles[key] = f"N{len(self.data_styles)}"
+            return name
+
+    def write(self, writer):
+        writer.start_tag("number:date-style", {"style:name": "date"})
+        writer.simple_tag("number:year", {"number:style": "long"})
+        writer.simple_tag("number:text", {}, "-")
+        writer.simple_tag("number:month", {"number:style": "long"})
+        writer.simple_tag("number:text", {}, "-")
+        writer.simple_tag("number:day", {"number:style": "long"})
+        writer.simple_tag("number:text", {}, " ")
+        writer.simple_tag("number:hours", {"number:style": "long"})
+        writer.simple_tag("number:text", {}, ":")
+        writer.simple_tag("number:minutes", {"number:style": "long"})
+        writer.end_tag("number:date-style")
+
+        # Working out the data styles adds to self.data_styles, so it's done
+        # before they're written out.
+        cell_styles = [
+            (name, style, self.data_style_name(style, kind))
+            for (style, kind), name in self.cell_styles.items()
+        ]
+
+        # The other date and time styles are only written if they're used
+        used = set(data_style for _, _, data_style in cell_styles)
+        if "day" in used:
+            writer.start_tag("number:date-style", {"style:name": "day"})
+            writer.simple_tag("number:year", {"number:style": "long"})
+            writer.simple_tag("number:text", {}, "-")
+            writer.simple_tag("number:month", {"number:style": "long"})
+            writer.simple_tag("number:text", {}, "-")
+            writer.simple_tag("number:day", {"number:style": "long"})
+            writer.end_tag("number:date-style")
+        for name, attrs in (
+            ("time", {"style:name": "time"}),
+            (
+                "duration",
+                {"style:name": "duration", "number:truncate-on-overflow": "false"},
+            ),
+        ):
+            if name in used:
+                writer.start_tag("number:time-style", attrs)
+                writer.simple_tag("number:hours", {"number:style": "long"})
+                writer.simple_tag("number:text", {}, ":")
+                writer.simple_tag("number:minutes", {"number:style": "long"})
+                writer.simple_tag("number:text", {}, ":")
+                writer.simple_tag("number:seconds", {"number:style": "long"})
+                writer.end_tag("number:time-style")
+
+        for key, name in self.data_styles.items():
+            decimal_places, grouping, percentage, currency, currency_symbol = key
+            number_attrs = {"number:min-integer-digits": "1"}
+            if grouping:
+                number_attrs["number:grouping"] = "true"
+            if currency is not None:
+                tag = "number:currency-style"
+                writer.start_tag(tag, {"style:name": name})
+                symbol = currency if currency_symbol is None else currency_symbol
+                writer.simple_tag("number:currency-symbol", {}, symbol)
+                number_attrs["number:decimal-places"] = str(
+                    2 if decimal_places is None else decimal_places
+                )
+                writer.simple_tag("number:number", number_attrs)
+            elif percentage:
+                tag = "number:percentage-style"
+                writer.start_tag(tag, {"style:name": name})
+                number_attrs["number:decimal-places"] = str(
+                    0 if decimal_places is None else decimal_places
+                )
+                writer.simple_tag("number:number", number_attrs)
+                writer.simple_tag("number:text", {}, "%")
+            else:
+                tag = "number:number-style"
+                writer.start_tag(tag, {"style:name": name})
+                if decimal_places is not None:
+                    number_attrs["number:decimal-places"] = str(decimal_places)
+                writer.simple_tag("number:number", number_attrs)
+            writer.end_tag(tag)
+
+        for name, style, data_style in cell_styles:
+            attrs = {
+                "style:name": name,
+                "style:family": "table-cell",
+                "style:parent-style-name": "Default",
+            }
+            if style is None:
+                attrs["style:data-style-name"] = data_style
+                writer.simple_tag("style:style", attrs)
+                continue
+
+            if data_style is not None:
+                attrs["style:data-style-name"] = data_style
+            cell_props = {}
+            if style.background_color is not None:
+                cell_props["fo:background-color"] = style.background_color
+            text_props = {}
+            if style.bold:
+                text_props["fo:font-weight"] = "bold"
+            if style.italic:
+                text_props["fo:font-style"] = "italic"
+            if style.color is not None:
+                text_props["fo:color"] = style.color
+
+            if len(cell_props) == 0 and len(text_props) == 0:
+                writer.simple_tag("style:style", attrs)
+            else:
+                writer.start_tag("style:style", attrs)
+                if len(cell_props) > 0:
+                    writer.simple_tag("style:table-cell-properties", cell_props)
+                if len(text_props) > 0:
+                    writer.simple_tag("style:text-properties", text_props)
+                writer.end_tag("style:style")
+
+
+def package_parts(mimetype):
+    # The parts of a package that are the same for every document of a type
+    return [
+        ("mimetype", mimetype),
+        (
             "META-INF/manifest.xml",
-            """<?xml version="1.0" encoding="UTF-8"?>
+            f"""<?xml version="1.0" encoding="UTF-8"?>
 <manifest:manifest
     manifest:version="1.2"
     xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">
   <manifest:file-entry
       manifest:full-path="/"
-      manifest:media-type="application/vnd.oasis.opendocument.spreadsheet"/>
+      manifest:media-type="{mimetype}"/>
   <manifest:file-entry
       manifest:full-path="settings.xml" manifest:media-type="text/xml"/>
   <manifest:file-entry
@@ -105,8 +586,8 @@ class SpreadsheetWriter:
       manifest:full-path="styles.xml" manifest:media-type="text/xml"/>
 </manifest:manifest>
 """,
-        )
-        self.z.writestr(
+        ),
+        (
             "meta.xml",
             """<?xml version="1.0" encoding="UTF-8"?>
 <office:document-meta
@@ -121,9 +602,8 @@ class SpreadsheetWriter:
   </office:meta>
 </office:document-meta>
 """,
-        )
-
-        self.z.writestr(
+        ),
+        (
             "settings.xml",
             """<?xml version="1.0" encoding="UTF-8"?>
 <office:document-settings
@@ -134,9 +614,8 @@ class SpreadsheetWriter:
     office:version="1.2">
 </office:document-settings>
 """,
-        )
-
-        self.z.writestr(
+        ),
+        (
             "styles.xml",
             """<?xml version="1.0" encoding="UTF-8"?>
 <office:document-styles
@@ -164,129 +643,472 @@ class SpreadsheetWriter:
     office:version="1.2">
 </office:document-styles>
 """,
-        )
-        self.tmp = NamedTemporaryFile()
-        self.writer = XmlWriter(self.tmp)
-        attrs = {
-            "xmlns:office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
-            "xmlns:office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
-            "xmlns:style": "urn:oasis:names:tc:opendocument:xmlns:style:1.0",
-            "xmlns:text": "urn:oasis:names:tc:opendocument:xmlns:text:1.0",
-            "xmlns:table": "urn:oasis:names:tc:opendocument:xmlns:table:1.0",
-            "xmlns:draw": "urn:oasis:names:tc:opendocument:xmlns:drawing:1.0",
-            "xmlns:fo": "urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0",
-            "xmlns:xlink": "http://www.w3.org/1999/xlink",
-            "xmlns:dc": "http://purl.org/dc/elements/1.1/",
-            "xmlns:meta": "urn:oasis:names:tc:opendocument:xmlns:meta:1.0",
-            "xmlns:number": "urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0",
-            "xmlns:presentation": "urn:oasis:names:tc:opendocument:xmlns"
-            ":presentation:1.0",
-            "xmlns:svg": "urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0",
-            "xmlns:chart": "urn:oasis:names:tc:opendocument:xmlns:chart:1.0",
-            "xmlns:dr3d": "urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0",
-            "xmlns:math": "http://www.w3.org/1998/Math/MathML",
-            "xmlns:form": "urn:oasis:names:tc:opendocument:xmlns:form:1.0",
-            "xmlns:script": "urn:oasis:names:tc:opendocument:xmlns:script:1.0",
-            "xmlns:dom": "http://www.w3.org/2001/xml-events",
-            "xmlns:xforms": "http://www.w3.org/2002/xforms",
-            "xmlns:xsd": "http://www.w3.org/2001/XMLSchema",
-            "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
-            "xmlns:of": "urn:oasis:names:tc:opendocument:xmlns:of:1.2",
-            "xmlns:xhtml": "http://www.w3.org/1999/xhtml",
-            "xmlns:css3t": "http://www.w3.org/TR/css3-text/",
-            "office:version": "1.2",
-        }
-        self.writer.start_tag("office:document-content", attrs)
-        self.writer.simple_tag("office:scripts", {})
-        self.writer.start_tag("office:automatic-styles", {})
-        self.writer.start_tag("number:date-style", {"style:name": "date"})
-        self.writer.simple_tag("number:year", {"number:style": "long"})
-        self.writer.simple_tag("number:text", {}, "-")
-        self.writer.simple_tag("number:month", {"number:style": "long"})
-        self.writer.simple_tag("number:text", {}, "-")
-        self.writer.simple_tag("number:day", {"number:style": "long"})
-        self.writer.simple_tag("number:text", {}, " ")
-        self.writer.simple_tag("number:hours", {"number:style": "long"})
-        self.writer.simple_tag("number:text", {}, ":")
-        self.writer.simple_tag("number:minutes", {"number:style": "long"})
-        self.writer.end_tag("number:date-style")
-        self.writer.simple_tag(
-            "style:style",
-            {
-                "style:name": "cell_date",
-                "style:family": "table-cell",
-                "style:parent-style-name": "Default",
-                "style:data-style-name": "date",
-            },
-        )
-        self.writer.end_tag("office:automatic-styles")
-        self.writer.start_tag("office:body", {})
-        self.writer.start_tag("office:spreadsheet", {})
+        ),
+    ]
+
+
+# The static parts of packages, compressed, by mimetype and whether they're
+# compressed. They're made the first time they're needed and then shared by all
+# the writers in the process. Two threads that make the same parts at once make
+# identical ones, so there's no need for a lock.
+PACKAGE_PARTS = {}
+
+
+class PackagePart:
+    # A part that's compressed once and can then be written, by write_raw_entry(),
+    # into any number of packages.
+    def __init__(self, data, compressed):
+        self.crc = zlib.crc32(data)
+        self.size = len(data)
+        if compressed:
+            compressor = zlib.compressobj(wbits=-15)
+            data = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        self.data = data
+        self.compress_size = len(data)
+
+    def chunks(self):
+        yield self.data
+
+
+def write_package_parts(z, mimetype):
+    compressed = z.compression == zipfile.ZIP_DEFLATED
+    key = (mimetype, compressed)
+    try:
+        parts = PACKAGE_PARTS[key]
+    except KeyError:
+        parts = PACKAGE_PARTS[key] = [
+            (name, PackagePart(text.encode("utf8"), compressed))
+            for name, text in package_parts(mimetype)
+        ]
+    for name, part in parts:
+        write_raw_entry(z, name, [part], compressed)
+
+
+def start_flat_document(writer, mimetype):
+    # A flat document is a single XML file, with the meta data inline before the
+    # content that would be in content.xml in a package.
+    attrs = dict(DOCUMENT_CONTENT_ATTRS)
+    attrs["office:mimetype"] = mimetype
+    writer.start_tag("office:document", attrs)
+    writer.start_tag("office:meta", {})
+    writer.simple_tag("meta:generator", {}, "Odio")
+    writer.end_tag("office:meta")
+
+
+class SpreadsheetWriter:
+    def __init__(self, f, compressed, flat=False, validate=False):
+        self.f = f
+        self.flat = flat
+        self.validate = validate
+        if flat:
+            # A flat document is never compressed
+            compressed = False
+            self.root = "office:document"
+        else:
+            self.root = "office:document-content"
+            if compressed:
+                compression = zipfile.ZIP_DEFLATED
+            else:
+                compression = zipfile.ZIP_STORED
+            self.z = zipfile.ZipFile(f, "w", compression)
+            write_package_parts(self.z, SPREADSHEET_MIMETYPE)
+        self.compressed = compressed
+        self.styles = StyleRegistry()
+
+        # Each table is written to its own fragment, so that the automatic styles
+        # that come before the tables can be collected as the cells are written,
+        # and so that tables can be written concurrently.
+        self.tables = []
+        self.closed = False
+
+    def _encode(self, val):
+        style = None
+        if isinstance(val, odio.Cell):
+            style = val.style
+            val = val.value
+
+        atts = {}
+        contents = None
+        kind = None
+        if isinstance(val, Datetime):
+            atts["office:value-type"] = "date"
+            atts["office:date-value"] = val.strftime("%Y-%m-%dT%H:%M:%S")
+            kind = "datetime"
+        elif isinstance(val, Date):
+            atts["office:value-type"] = "date"
+            atts["office:date-value"] = val.isoformat()
+            kind = "date"
+        elif isinstance(val, Time):
+            atts["office:value-type"] = "time"
+            atts["office:time-value"] = _time_value_str(
+                val.hour, val.minute, val.second, val.microsecond
+            )
+            kind = "time"
+        elif isinstance(val, Timedelta):
+            atts["office:value-type"] = "time"
+            atts["office:time-value"] = _duration_str(val)
+            kind = "duration"
+        elif isinstance(val, str):
+            atts["office:value-type"] = "string"
+            contents = val
+            # atts['office:string-value'] = val
+        elif isinstance(val, bool):
+            atts["office:value-type"] = "boolean"
+            atts["office:boolean-value"] = "true" if val else "false"
+        elif isinstance(val, (float, int, Decimal)):
+            atts["office:value-type"] = "float"
+            atts["office:value"] = str(val)
+            if style is not None:
+                if style.currency is not None:
+                    atts["office:value-type"] = "currency"
+                    atts["office:currency"] = style.currency
+                elif style.percentage:
+                    atts["office:value-type"] = "percentage"
+        elif isinstance(val, odio.Formula):
+            atts["table:formula"] = "of:" + str(val)
+        elif val is None:
+            pass
+        else:
+            atts["office:value-type"] = "string"
+            atts["office:string-value"] = str(val)
+
+        if style is not None or kind is not None:
+            atts["table:style-name"] = self.styles.cell_style_name(style, kind)
+        return atts, contents
+
+    def _encode_key(self, val):
+        # The cell as (attributes before the repeat attribute, attributes after it,
+        # contents), which is the same for two cells if and only if their XML is.
+        atts, contents = self._encode(val)
+        head = {k: v for k, v in atts.items() if k < COLUMNS_REPEATED}
+        tail = {k: v for k, v in atts.items() if k > COLUMNS_REPEATED}
+        return XmlWriter.atts_to_str(head), XmlWriter.atts_to_str(tail), contents
+
+    def _column_encoder(self, column_type):
+        # An encoder for values of exactly the given type, which falls back to the
+        # general encoder for anything else, such as None or an odio.Cell.
+        if column_type is None:
+            return self._encode_key
+
+        encode_key = self._encode_key
+
+        if column_type in (float, int, Decimal):
+
+            def encode(val):
+                if val.__class__ is column_type:
+                    return (
+                        f' office:value="{val!s}" office:value-type="float"',
+                        "",
+                        None,
+                    )
+                return encode_key(val)
+
+        elif column_type is str:
+
+            def encode(val):
+                if val.__class__ is str:
+                    return ' office:value-type="string"', "", val
+                return encode_key(val)
+
+        elif column_type is bool:
+            true_key = (
+                ' office:boolean-value="true" office:value-type="boolean"',
+                "",
+                None,
+            )
+            false_key = (
+                ' office:boolean-value="false" office:value-type="boolean"',
+                "",
+                None,
+            )
+
+            def encode(val):
+                if val is True:
+                    return true_key
+                elif val is False:
+                    return false_key
+                return encode_key(val)
+
+        elif column_type is Datetime:
+
+            def encode(val):
+                if val.__class__ is Datetime:
+                    return (
+                        f' office:date-value="{val.strftime("%Y-%m-%dT%H:%M:%S")}"'
+                        ' office:value-type="date"',
+                        ' table:style-name="cell_date"',
+                        None,
+                    )
+                return encode_key(val)
+
+        elif column_type is odio.Formula:
+
+            def encode(val):
+                if val.__class__ is odio.Formula:
+                    return f" table:formula={quoteattr('of:' + str(val))}", "", None
+                return encode_key(val)
 
-    def append_table(self, name, rows):
+        else:
+            raise Exception(
+                f"The column type {column_type!r} isn't recognized. The valid types "
+                f"are float, int, decimal.Decimal, str, bool, datetime.datetime, "
+                f"odio.Formula and None."
+            )
+        return encode
+
+    def open_table(self, name, schema=None):
+        if self.closed:
+            raise Exception("The spreadsheet has already been closed.")
+        table = TableWriter(self, name, schema)
+        self.tables.append(table)
+        return table
+
+    def append_table(self, name, rows, schema=None):
+        with self.open_table(name, schema) as table:
+            for row in rows:
+                table.append_row(row)
+
+    def append_sparse_table(self, name, cells, sort_buffer=SORT_BUFFER):
+        # Cells are (row, column, value) triples, or a {(row, column): value}
+        # mapping, in any order. Runs of empty cells and rows are written with
+        # repeat attributes, so the time taken depends on the number of cells
+        # given rather than on the area of the table.
+        if isinstance(cells, dict):
+            cells = ((r, c, v) for (r, c), v in cells.items())
+        with self.open_table(name) as table, table.lock:
+            table.check_open()
+            next_row = 0
+            for r, row_cells in groupby(_sort_cells(cells, sort_buffer), itemgetter(0)):
+                if r < next_row:
+                    raise Exception(f"The row {r} appears more than once.")
+                elif r > next_row:
+                    gap = r - next_row
+                    attrs = {}
+                    if gap > 1:
+                        attrs["table:number-rows-repeated"] = str(gap)
+                    table.writer.start_tag("table:table-row", attrs)
+                    table.writer.simple_tag("table:table-cell", {})
+                    table.writer.end_tag("table:table-row")
+
+                runs = []
+                next_col = 0
+                for _, c, val in row_cells:
+                    if c < next_col:
+                        raise Exception(f"The cell ({r}, {c}) appears more than once.")
+                    elif c > next_col:
+                        _add_run(runs, {}, None, c - next_col)
+                    atts, contents = self._encode(val)
+                    _add_run(runs, atts, contents, 1)
+                    next_col = c + 1
+                self._write_runs(table.writer, runs)
+                next_row = r + 1
+
+    def _write_row(self, writer, row):
+        runs = []
+        for val in row:
+            atts, contents = self._encode(val)
+            _add_run(runs, atts, contents, 1)
+        self._write_runs(writer, runs)
+
+    def _write_schema_row(self, writer, row, encoders):
+        # Writes the same XML as _write_row(), but each value is encoded by the
+        # encoder for its column, and repeats are found by comparing values, and
+        # then encoded cells, rather than dicts.
+        runs = []
+        prev = key = None
+        count = 0
+        for encode, val in zip(chain(encoders, repeat(self._encode_key)), row):
+            if count > 0 and val is prev:
+                count += 1
+                continue
+            new_key = encode(val)
+            if count > 0 and new_key == key:
+                count += 1
+            else:
+                if count > 0:
+                    runs.append((key, count))
+                key = new_key
+                count = 1
+            prev = val
+        if count > 0:
+            runs.append((key, count))
+
+        indent = " " * writer.indentation * 2
+        cell_indent = indent + "  "
+        lines = [indent, "<table:table-row>\n"]
+        for (head, tail, contents), count in runs:
+            if count > 1:
+                head = f'{head} table:number-columns-repeated="{count}"'
+            if contents is None:
+                lines.append(f"{cell_indent}<table:table-cell{head}{tail}/>\n")
+            else:
+                text = "<text:line-break/>".join(escape(contents).splitlines())
+                lines.append(
+                    f"{cell_indent}<table:table-cell{head}{tail}>\n"
+                    f"{cell_indent}  <text:p>{text}</text:p>\n"
+                    f"{cell_indent}</table:table-cell>\n"
+                )
+        lines.append(indent)
+        lines.append("</table:table-row>\n")
+        writer.output.write("".join(lines).encode("utf8"))
+
+    def _write_runs(self, writer, runs):
+        writer.start_tag("table:table-row", {})
+        for cell in runs:
+            atts = cell["atts"]
+            contents = cell["contents"]
+            if cell["count"] > 1:
+                atts["table:number-columns-repeated"] = str(cell["count"])
+            if contents is None:
+                writer.simple_tag("table:table-cell", atts)
+            else:
+                writer.start_tag("table:table-cell", atts)
+                writer.simple_tag("text:p", {}, contents=contents)
+                writer.end_tag("table:table-cell")
+        writer.end_tag("table:table-row")
+
+    def close(self):
+        self.closed = True
+        for table in self.tables:
+            table.close()
+
+        header = Fragment(self.compressed)
+        writer = XmlWriter(header, validator=self._validator())
+        if self.flat:
+            start_flat_document(writer, SPREADSHEET_MIMETYPE)
+        else:
+            writer.start_tag(self.root, DOCUMENT_CONTENT_ATTRS)
+        writer.simple_tag("office:scripts", {})
+        writer.start_tag("office:automatic-styles", {})
+        self.styles.write(writer)
+        writer.end_tag("office:automatic-styles")
+        writer.start_tag("office:body", {})
+        writer.start_tag("office:spreadsheet", {})
+        header.close()
+
+        footer = Fragment(self.compressed)
+        writer.output = footer
+        writer.end_tag("office:spreadsheet")
+        writer.end_tag("office:body")
+        writer.end_tag(self.root)
+        footer.close()
+
+        fragments = [header] + [table.fragment for table in self.tables] + [footer]
+        if self.flat:
+            for fragment in fragments:
+                for chunk in fragment.chunks():
+                    self.f.write(chunk)
+        else:
+            write_raw_entry(self.z, "content.xml", fragments, self.compressed)
+            self.z.close()
+
+    def _validator(self, *context):
+        if self.validate:
+            return Validator(context)
+        else:
+            return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _add_run(runs, atts, contents, count):
+    if len(runs) > 0 and runs[-1]["atts"] == atts and runs[-1]["contents"] == contents:
+        runs[-1]["count"] += count
+    else:
+        runs.append({"count": count, "atts": atts, "contents": contents})
+
+
+def _sort_cells(cells, sort_buffer):
+    # An external sort: runs of at most sort_buffer cells are sorted in memory and
+    # spilled to temporary files, then merged.
+    key = itemgetter(0, 1)
+    buf = []
+    spills = []
+    for cell in cells:
+        buf.append(cell)
+        if len(buf) >= sort_buffer:
+            buf.sort(key=key)
+            spills.append(_spill(buf))
+            buf = []
+    buf.sort(key=key)
+    if len(spills) == 0:
+        return iter(buf)
+    else:
+        from heapq import merge
+
+        return merge(*(_unspill(spill) for spill in spills), iter(buf), key=key)
+
+
+def _spill(cells):
+    import pickle
+
+    spill = TemporaryFile()
+    for i in range(0, len(cells), SPILL_BATCH):
+        pickle.dump(cells[i : i + SPILL_BATCH], spill, pickle.HIGHEST_PROTOCOL)
+    spill.seek(0)
+    return spill
+
+
+def _unspill(spill):
+    import pickle
+
+    with spill:
+        while True:
+            try:
+                yield from pickle.load(spill)
+            except EOFError:
+                return
+
+
+class TableWriter:
+    def __init__(self, sheet, name, schema=None):
+        # With a schema, values are encoded by an encoder for the type of their
+        # column. A document that's being validated is written the general way.
+        if schema is None or sheet.validate:
+            self.encoders = None
+        else:
+            self.encoders = [sheet._column_encoder(t) for t in schema]
+        self.sheet = sheet
+        self.name = name
+        self.fragment = Fragment(sheet.compressed)
+        self.writer = XmlWriter(
+            self.fragment,
+            declaration=False,
+            indentation=3,
+            validator=sheet._validator(sheet.root, "office:body", "office:spreadsheet"),
+        )
+        self.lock = threading.Lock()
+        self.closed = False
         self.writer.start_tag("table:table", {"table:name": name})
         self.writer.simple_tag("table:table-column", {})
-        for row in rows:
-            self.writer.start_tag("table:table-row", {})
-            cells = []
-            for val in row:
-                atts = {}
-                contents = None
-                if isinstance(val, Datetime):
-                    atts["office:value-type"] = "date"
-                    atts["office:date-value"] = val.strftime("%Y-%m-%dT%H:%M:%S")
-                    atts["table:style-name"] = "cell_date"
-                elif isinstance(val, str):
-                    atts["office:value-type"] = "string"
-                    contents = val
-                    # atts['office:string-value'] = val
-                elif isinstance(val, bool):
-                    atts["office:value-type"] = "boolean"
-                    atts["office:boolean-value"] = "true" if val else "false"
-                elif isinstance(val, (float, int, Decimal)):
-                    atts["office:value-type"] = "float"
-                    atts["office:value"] = str(val)
-                elif isinstance(val, odio.Formula):
-                    atts["table:formula"] = "of:" + str(val)
-                elif val is None:
-                    pass
-                else:
-                    atts["office:value-type"] = "string"
-                    atts["office:string-value"] = str(val)
-
-                if (
-                    len(cells) > 0
-                    and cells[-1]["atts"] == atts
-                    and cells[-1]["contents"] == contents
-                ):
-                    cells[-1]["count"] += 1
-                else:
-                    cells.append({"count": 1, "atts": atts, "contents": contents})
-
-            for cell in cells:
-                atts = cell["atts"]
-                contents = cell["contents"]
-                if cell["count"] > 1:
-                    atts["table:number-columns-repeated"] = str(cell["count"])
-                if contents is None:
-                    self.writer.simple_tag("table:table-cell", atts)
-                else:
-                    self.writer.start_tag("table:table-cell", atts)
-                    self.writer.simple_tag("text:p", {}, contents=contents)
-                    self.writer.end_tag("table:table-cell")
-            self.writer.end_tag("table:table-row")
 
-        self.writer.end_tag("table:table")
+    def check_open(self):
+        # Rows written once the table is closed would be lost, so it's an error
+        if self.closed:
+            raise Exception(f"The table '{self.name}' has already been closed.")
+
+    def append_row(self, row):
+        with self.lock:
+            self.check_open()
+            if self.encoders is None:
+                self.sheet._write_row(self.writer, row)
+            else:
+                self.sheet._write_schema_row(self.writer, row, self.encoders)
+
+    def append_rows(self, rows):
+        for row in rows:
+            self.append_row(row)
 
     def close(self):
-        self.writer.end_tag("office:spreadsheet")
-        self.writer.end_tag("office:body")
-        self.writer.end_tag("office:document-content")
-        self.tmp.flush()
-        self.tmp.seek(0)
-        self.z.write(self.tmp.name, "content.xml")
-        self.z.close()
-        self.tmp.close()
+        with self.lock:
+            if not self.closed:
+                self.writer.end_tag("table:table")
+                self.fragment.close()
+                self.closed = True
 
     def __enter__(self):
         return self
@@ -295,11 +1117,137 @@ class SpreadsheetWriter:
         self.close()
 
 
+class DataStyle:
+    # What's needed from a number:*-style to decode the values of cells that use it
+    def __init__(self, kind, attrs):
+        self.kind = kind
+        self.decimal_places = None
+        self.grouping = False
+        self.currency_symbol = None
+        self.has_time = False
+        self.duration = attrs.get("number:truncate-on-overflow") == "false"
+        self.styles = {}
+
+    def cell_style(self, percentage, currency):
+        # The odio.Style of a percentage or currency cell, which is shared by all
+        # the cells that have the same one.
+        key = (percentage, currency)
+        try:
+            return self.styles[key]
+        except KeyError:
+            style = self.styles[key] = odio.Style(
+                decimal_places=self.decimal_places,
+                grouping=self.grouping,
+                percentage=percentage,
+                currency=currency,
+                currency_symbol=None if currency is None else self.currency_symbol,
+            )
+            return style
+
+
+# The data style of cells that don't have one
+NO_DATA_STYLE = DataStyle(None, {})
+
+
+class StyleIndex:
+    # Finds the data style of a cell from the name of its cell style. It's filled
+    # from the common styles of styles.xml and the styles at the start of
+    # content.xml, before any cells are read, and each name is only resolved once.
+    def __init__(self):
+        self.data_styles = {}
+        self.cell_styles = {}
+        self.cache = {}
+
+    def read(self, events):
+        # Reads the events that follow the start of an office:styles or
+        # office:automatic-styles element, up to and including its end.
+        depth = 1
+        data_style = None
+        symbol = None
+        for kind, data, attrs in events:
+            if kind == START_ELEMENT:
+                depth += 1
+                if data in DATA_STYLES:
+                    data_style = DataStyle(DATA_STYLES[data], attrs)
+                    self.data_styles[attrs.get("style:name")] = data_style
+                elif data_style is not None:
+                    if data == "number:number":
+                        places = attrs.get("number:decimal-places")
+                        if places is not None:
+                            data_style.decimal_places = int(places)
+                        data_style.grouping = attrs.get("number:grouping") == "true"
+                    elif data == "number:currency-symbol":
+                        symbol = []
+                    elif data in TIME_FIELDS:
+                        data_style.has_time = True
+                elif data == "style:style":
+                    if attrs.get("style:family") == "table-cell":
+                        self.cell_styles[attrs.get("style:name")] = (
+                            attrs.get("style:data-style-name"),
+                            attrs.get("style:parent-style-name"),
+                        )
+            elif kind == CHARACTERS:
+                if symbol is not None:
+                    symbol.append(data)
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+                elif data in DATA_STYLES:
+                    data_style = None
+                elif data == "number:currency-symbol" and symbol is not None:
+                    data_style.currency_symbol = "".join(symbol).strip()
+                    symbol = None
+
+    def read_styles(self, stream):
+        # Reads the common styles from styles.xml
+        events = iter_events(stream)
+        for kind, data, _ in events:
+            if kind == START_ELEMENT and data == "office:styles":
+                self.read(events)
+                return
+
+    def read_dom(self, document):
+        for name in ("office:styles", "office:automatic-styles"):
+            for elem in document.getElementsByTagName(name):
+                self.read(_dom_events(elem))
+
+    def data_style(self, name):
+        try:
+            return self.cache[name]
+        except KeyError:
+            pass
+
+        # A cell style without a data style inherits the one of its parent
+        data_style = NO_DATA_STYLE
+        parent = name
+        seen = set()
+        while parent is not None and parent not in seen:
+            seen.add(parent)
+            data_style_name, parent = self.cell_styles.get(parent, (None, None))
+            if data_style_name is not None:
+                data_style = self.data_styles.get(data_style_name, NO_DATA_STYLE)
+                break
+        self.cache[name] = data_style
+        return data_style
+
+
+def _dom_events(elem):
+    # The events for the contents of a minidom element and its end
+    for child in elem.childNodes:
+        if child.nodeType == Node.ELEMENT_NODE:
+            yield START_ELEMENT, child.tagName, dict(child.attributes.items())
+            yield from _dom_events(child)
+        elif child.nodeType == Node.TEXT_NODE:
+            yield CHARACTERS, child.nodeValue, None
+    yield END_ELEMENT, elem.tagName, None
+
+
 class SpreadsheetReader:
-    def __init__(self, spreadsheet_elem):
+    def __init__(self, spreadsheet_elem, styles=None, budget=None):
         self.tables = []
         for table_elem in spreadsheet_elem.getElementsByTagName("table:table"):
-            self.tables.append(TableReader(table_elem))
+            self.tables.append(TableReader(table_elem, styles, budget))
 
 
 def _get_text(node):
@@ -312,189 +1260,138 @@ def _get_text(node):
     return "".join(txt)
 
 
+def _cell_value(attrs, get_text, styles=None):
+    # Percentage and currency values are returned as an odio.Cell, with an
+    # odio.Style made from the data style of the cell.
+    if "table:formula" in attrs:
+        formula = attrs["table:formula"]
+        eq_idx = formula.index("=")
+        return odio.Formula(formula[eq_idx:])
+
+    val_type = attrs.get(OFFICE_VALUE_TYPE)
+    if val_type == "string":
+        val = attrs.get("office:string-value")
+        return get_text() if val is None else val
+    elif val_type == "float":
+        return float(attrs["office:value"])
+    elif val_type == "boolean":
+        return attrs["office:boolean-value"] == "true"
+    elif val_type is None:
+        return None
+
+    if styles is None:
+        data_style = NO_DATA_STYLE
+    else:
+        data_style = styles.data_style(attrs.get("table:style-name"))
+    if val_type == "date":
+        return _date_value(attrs["office:date-value"], data_style)
+    elif val_type == "time":
+        return _time_value(attrs["office:time-value"], data_style)
+    elif val_type == "percentage":
+        return odio.Cell(
+            float(attrs["office:value"]), data_style.cell_style(True, None)
+        )
+    elif val_type == "currency":
+        return odio.Cell(
+            Decimal(attrs["office:value"]),
+            data_style.cell_style(False, attrs.get("office:currency")),
+        )
+    else:
+        return None
+
+
+def _date_value(value, data_style):
+    # A date without a time is a datetime.date, and so is a date at midnight whose
+    # style only shows the date.
+    year, month, day, hour, minute, second, fraction = DATE_VALUE.match(value).groups()
+    if hour is None:
+        return Date(int(year), int(month), int(day))
+    microsecond = 0 if fraction is None else int(fraction[:6].ljust(6, "0"))
+    val = Datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        microsecond,
+    )
+    if data_style.kind == "date" and not data_style.has_time and val.time() == Time():
+        return val.date()
+    return val
+
+
+def _time_value(value, data_style):
+    # A datetime.time, unless the style is for a duration, or the value is
+    # negative or a day or more, when it's a datetime.timedelta.
+    sign, days, hours, minutes, seconds = TIME_VALUE.match(value).groups()
+    val = Timedelta(
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=float(seconds or 0),
+    )
+    if sign is not None:
+        val = -val
+    if data_style.duration or not Timedelta() <= val < Timedelta(days=1):
+        return val
+    return (Datetime.min + val).time()
+
+
 class TableReader:
-    def __init__(self, table_elem):
+    def __init__(self, table_elem, styles=None, budget=None):
         self.name = table_elem.getAttribute("table:name")
         self.rows = []
         for row_elem in table_elem.getElementsByTagName("table:table-row"):
+            if budget is not None:
+                budget.add_rows(1)
             row = []
             self.rows.append(row)
             for cell_elem in row_elem.getElementsByTagName("table:table-cell"):
-                if cell_elem.hasAttribute("table:formula"):
-                    formula = cell_elem.getAttribute("table:formula")
-                    eq_idx = formula.index("=")
-                    val = odio.Formula(formula[eq_idx:])
-                elif cell_elem.hasAttribute(OFFICE_VALUE_TYPE):
-                    val_type = cell_elem.getAttribute(OFFICE_VALUE_TYPE)
-                    if val_type == "date":
-                        val = Datetime.strptime(
-                            cell_elem.getAttribute("office:date-value"),
-                            "%Y-%m-%dT%H:%M:%S",
-                        )
-                    elif val_type == "string":
-                        if cell_elem.hasAttribute("office:string-value"):
-                            val = cell_elem.getAttribute("office:string-value")
-                        else:
-                            val = _get_text(cell_elem)
-                    elif val_type == "float":
-                        val = float(cell_elem.getAttribute("office:value"))
-                    elif val_type == "boolean":
-                        val = cell_elem.getAttribute("office:boolean-value") == "true"
-                else:
-                    val = None
-
-                if cell_elem.hasAttribute("table:number-columns-repeated"):
-                    count = int(cell_elem.getAttribute("table:number-columns-repeated"))
-                else:
-                    count = 1
-
+                attrs = dict(cell_elem.attributes.items())
+                val = _cell_value(attrs, partial(_get_text, cell_elem), styles)
+                count = int(attrs.get("table:number-columns-repeated", "1"))
+                if budget is not None:
+                    budget.add_cells(count)
                 for i in range(count):
                     row.append(val)
 
 
 class TextWriter:
-    def __init__(self, f):
+    def __init__(self, f, flat=False, validate=False):
         self.f = f
-        self.z = zipfile.ZipFile(f, "w")
-        self.z.writestr("mimetype", "application/vnd.oasis.opendocument.text")
-        self.z.writestr(
-            "META-INF/manifest.xml",
-            """<?xml version="1.0" encoding="UTF-8"?>
-<manifest:manifest
-    manifest:version="1.2"
-    xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0">
-  <manifest:file-entry
-      manifest:full-path="/"
-      manifest:media-type="application/vnd.oasis.opendocument.text"/>
-  <manifest:file-entry
-      manifest:full-path="settings.xml" manifest:media-type="text/xml"/>
-  <manifest:file-entry
-      manifest:full-path="content.xml" manifest:media-type="text/xml"/>
-  <manifest:file-entry
-      manifest:full-path="meta.xml" manifest:media-type="text/xml"/>
-  <manifest:file-entry
-      manifest:full-path="styles.xml" manifest:media-type="text/xml"/>
-</manifest:manifest>
-""",
-        )
-        self.z.writestr(
-            "meta.xml",
-            """<?xml version="1.0" encoding="UTF-8"?>
-<office:document-meta
-    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
-    xmlns:xlink="http://www.w3.org/1999/xlink"
-    xmlns:dc="http://purl.org/dc/elements/1.1/"
-    xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0"
-    xmlns:of="urn:oasis:names:tc:opendocument:xmlns:of:1.2"
-    office:version="1.2">
-  <office:meta>
-      <meta:generator>Odio</meta:generator>
-  </office:meta>
-</office:document-meta>
-""",
-        )
-
-        self.z.writestr(
-            "settings.xml",
-            """<?xml version="1.0" encoding="UTF-8"?>
-<office:document-settings
-    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
-    xmlns:xlink="http://www.w3.org/1999/xlink"
-    xmlns:config="urn:oasis:names:tc:opendocument:xmlns:config:1.0"
-    xmlns:of="urn:oasis:names:tc:opendocument:xmlns:of:1.2"
-    office:version="1.2">
-</office:document-settings>
-""",
-        )
-
-        self.z.writestr(
-            "styles.xml",
-            """<?xml version="1.0" encoding="UTF-8"?>
-<office:document-styles
-    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
-    xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0"
-    xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"
-    xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
-    xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0"
-    xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0"
-    xmlns:xlink="http://www.w3.org/1999/xlink"
-    xmlns:dc="http://purl.org/dc/elements/1.1/"
-    xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0"
-    xmlns:number="urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0"
-    xmlns:presentation="urn:oasis:names:tc:opendocument:xmlns:presentation:1.0"
-    xmlns:svg="urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0"
-    xmlns:chart="urn:oasis:names:tc:opendocument:xmlns:chart:1.0"
-    xmlns:dr3d="urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0"
-    xmlns:math="http://www.w3.org/1998/Math/MathML"
-    xmlns:form="urn:oasis:names:tc:opendocument:xmlns:form:1.0"
-    xmlns:script="urn:oasis:names:tc:opendocument:xmlns:script:1.0"
-    xmlns:dom="http://www.w3.org/2001/xml-events"
-    xmlns:of="urn:oasis:names:tc:opendocument:xmlns:of:1.2"
-    xmlns:xhtml="http://www.w3.org/1999/xhtml"
-    xmlns:css3t="http://www.w3.org/TR/css3-text/"
-    office:version="1.2">
-</office:document-styles>
-""",
-        )
-        self.doc = xml.dom.minidom.parseString(
-            """<?xml version="1.0" encoding="UTF-8"?>
-<office:document-content
-    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
-    xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0"
-    xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"
-    xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
-    xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0"
-    xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0"
-    xmlns:xlink="http://www.w3.org/1999/xlink"
-    xmlns:dc="http://purl.org/dc/elements/1.1/"
-    xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0"
-    xmlns:number="urn:oasis:names:tc:opendocument:xmlns:datastyle:1.0"
-    xmlns:presentation="urn:oasis:names:tc:opendocument:xmlns:presentation:1.0"
-    xmlns:svg="urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0"
-    xmlns:chart="urn:oasis:names:tc:opendocument:xmlns:chart:1.0"
-    xmlns:dr3d="urn:oasis:names:tc:opendocument:xmlns:dr3d:1.0"
-    xmlns:math="http://www.w3.org/1998/Math/MathML"
-    xmlns:form="urn:oasis:names:tc:opendocument:xmlns:form:1.0"
-    xmlns:script="urn:oasis:names:tc:opendocument:xmlns:script:1.0"
-    xmlns:dom="http://www.w3.org/2001/xml-events"
-    xmlns:xforms="http://www.w3.org/2002/xforms"
-    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
-    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-    xmlns:of="urn:oasis:names:tc:opendocument:xmlns:of:1.2"
-    xmlns:xhtml="http://www.w3.org/1999/xhtml"
-    xmlns:css3t="http://www.w3.org/TR/css3-text/"
-    office:version="1.2">
-  <office:scripts/>
-  <office:automatic-styles>
-    <number:date-style style:name="date">
-      <number:year number:style="long"/>
-      <number:text>-</number:text>
-      <number:month number:style="long"/>
-      <number:text>-</number:text>
-      <number:day number:style="long"/>
-      <number:text> </number:text>
-      <number:hours number:style="long"/>
-      <number:text>:</number:text>
-      <number:minutes number:style="long"/>
-    </number:date-style>
-    <style:style style:name="cell_date" style:family="table-cell"
-      style:parent-style-name="Default" style:data-style-name="date"/>
-  </office:automatic-styles>
-  <office:body>
-    <office:text>
-    </office:text>
-  </office:body>
-</office:document-content>"""
-        )
-        self.text_elem = self.doc.getElementsByTagName("office:text")[0]
+        self.flat = flat
+        validator = Validator() if validate else None
+        if flat:
+            # Nodes are written straight to the file as they're appended
+            self.writer = XmlWriter(f, validator=validator)
+            start_flat_document(self.writer, TEXT_MIMETYPE)
+            self.root = "office:document"
+        else:
+            self.z = zipfile.ZipFile(f, "w")
+            write_package_parts(self.z, TEXT_MIMETYPE)
+            self.tmp = NamedTemporaryFile()
+            self.writer = XmlWriter(self.tmp, validator=validator)
+            self.root = "office:document-content"
+            self.writer.start_tag(self.root, DOCUMENT_CONTENT_ATTRS)
+        self.writer.simple_tag("office:scripts", {})
+        self.writer.simple_tag("office:automatic-styles", {})
+        self.writer.start_tag("office:body", {})
+        self.writer.start_tag("office:text", {})
 
     def append(self, *subnodes):
         for node in subnodes:
-            node.attach(self.doc, self.text_elem)
+            self.writer.node(node)
 
     def close(self):
-        self.z.writestr("content.xml", self.doc.toprettyxml(encoding="utf-8"))
-        self.z.close()
+        self.writer.end_tag("office:text")
+        self.writer.end_tag("office:body")
+        self.writer.end_tag(self.root)
+        if not self.flat:
+            self.tmp.flush()
+            self.z.write(self.tmp.name, "content.xml")
+            self.z.close()
+            self.tmp.close()
 
     def __enter__(self):
         return self
@@ -503,45 +1400,1075 @@ class TextWriter:
         self.close()
 
 
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+
+class PrefixReader:
+    # A file that's already had its first few bytes read, for streams that can't
+    # seek back to the start.
+    def __init__(self, prefix, f):
+        self.prefix = prefix
+        self.f = f
+
+    def read(self, size=-1):
+        prefix = self.prefix
+        if len(prefix) == 0:
+            return self.f.read(size)
+        elif size < 0:
+            self.prefix = b""
+            return prefix + self.f.read()
+        else:
+            self.prefix = prefix[size:]
+            return prefix[:size]
+
+
+def sniff_flat(f):
+    # Returns whether f is a flat document rather than a zipped package, and a file
+    # to read it from that starts at the same place as f.
+    if f.seekable():
+        pos = f.tell()
+        head = f.read(len(ZIP_SIGNATURE))
+        f.seek(pos)
+    else:
+        head = f.read(len(ZIP_SIGNATURE))
+        f = PrefixReader(head, f)
+    return head != ZIP_SIGNATURE, f
+
+
+class Limits:
+    # Limits on what reading a document can take, for documents that can't be
+    # trusted. Bytes are those of the XML after decompression, cells and rows are
+    # counted after repeats are expanded, and timeout is in seconds. None is no
+    # limit.
+    def __init__(
+        self,
+        max_bytes=None,
+        max_cells=None,
+        max_rows=None,
+        max_depth=None,
+        timeout=None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_cells = max_cells
+        self.max_rows = max_rows
+        self.max_depth = max_depth
+        self.timeout = timeout
+
+    def __repr__(self):
+        return (
+            f"odio.v1_2.Limits(max_bytes={self.max_bytes}, "
+            f"max_cells={self.max_cells}, max_rows={self.max_rows}, "
+            f"max_depth={self.max_depth}, timeout={self.timeout})"
+        )
+
+
+class Budget:
+    # Keeps count of what's been taken against the Limits while reading a document
+    def __init__(self, limits):
+        self.limits = limits
+        self.bytes = 0
+        self.cells = 0
+        self.rows = 0
+        if limits.timeout is None:
+            self.deadline = None
+        else:
+            self.deadline = time.monotonic() + limits.timeout
+
+    def check_time(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise LimitExceeded(
+                f"Reading the document took longer than {self.limits.timeout} "
+                f"seconds."
+            )
+
+    def add_bytes(self, count):
+        self.bytes += count
+        if self.limits.max_bytes is not None and self.bytes > self.limits.max_bytes:
+            raise LimitExceeded(
+                f"The document has more than {self.limits.max_bytes} bytes of XML."
+            )
+        self.check_time()
+
+    def add_cells(self, count):
+        self.cells += count
+        if self.limits.max_cells is not None and self.cells > self.limits.max_cells:
+            raise LimitExceeded(
+                f"The document has more than {self.limits.max_cells} cells."
+            )
+        self.check_time()
+
+    def add_rows(self, count):
+        self.rows += count
+        if self.limits.max_rows is not None and self.rows > self.limits.max_rows:
+            raise LimitExceeded(
+                f"The document has more than {self.limits.max_rows} rows."
+            )
+        self.check_time()
+
+
+class LimitedReader:
+    # A file whose reads are counted against a Budget, so that a document that's
+    # too big is stopped a chunk at a time as it's decompressed.
+    def __init__(self, f, budget):
+        self.f = f
+        self.budget = budget
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.budget.add_bytes(len(data))
+        return data
+
+
+def limit_depth(parser, max_depth):
+    # Wraps the handlers of an expat parser, to raise LimitExceeded as soon as
+    # elements are nested deeper than max_depth.
+    start = parser.StartElementHandler
+    end = parser.EndElementHandler
+    depth = 0
+
+    def start_element(*args):
+        nonlocal depth
+        depth += 1
+        if depth > max_depth:
+            raise LimitExceeded(
+                f"The document has elements nested more than {max_depth} deep."
+            )
+        start(*args)
+
+    def end_element(*args):
+        nonlocal depth
+        depth -= 1
+        end(*args)
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+
+
+@contextmanager
+def open_content(f, styles=None, budget=None):
+    # For a package this is the content.xml part, and for a flat document it's the
+    # whole file, which has the same body. If styles is a StyleIndex, the common
+    # styles of a package's styles.xml are read into it, as for a flat document
+    # they come before the body. If budget is a Budget, the XML read is counted
+    # against it.
+    flat, f = sniff_flat(f)
+    if flat:
+        yield f if budget is None else LimitedReader(f, budget)
+    else:
+        with zipfile.ZipFile(f, "r") as z:
+            if styles is not None and "styles.xml" in z.namelist():
+                with z.open("styles.xml") as styles_xml:
+                    if budget is None:
+                        styles.read_styles(styles_xml)
+                    else:
+                        styles.read_styles(LimitedReader(styles_xml, budget))
+            with z.open("content.xml") as content:
+                yield content if budget is None else LimitedReader(content, budget)
+
+
+def parse_dom(content, budget=None):
+    # Parses content into a minidom document, within the limits of the budget
+    if budget is None or budget.limits.max_depth is None:
+        from xml.dom import minidom
+
+        return minidom.parse(content)
+
+    from xml.dom.expatbuilder import ExpatBuilder
+
+    class DepthLimitedBuilder(ExpatBuilder):
+        # Builds a minidom document, raising LimitExceeded as soon as elements
+        # are nested deeper than max_depth.
+        def __init__(self, max_depth):
+            super().__init__()
+            self.max_depth = max_depth
+            self.depth = 0
+
+        def start_element_handler(self, name, attributes):
+            self.depth += 1
+            if self.depth > self.max_depth:
+                raise LimitExceeded(
+                    f"The document has elements nested more than {self.max_depth} "
+                    f"deep."
+                )
+            super().start_element_handler(name, attributes)
+
+        def end_element_handler(self, name):
+            self.depth -= 1
+            super().end_element_handler(name)
+
+    return DepthLimitedBuilder(budget.limits.max_depth).parseFile(content)
+
+
+def iter_events(
+    stream, chunk_size=CHUNK_SIZE, text=True, validate=False, max_depth=None
+):
+    # Yields (kind, data, attrs) tuples, where data is the element name or the
+    # character data. Character data between two tags is always yielded as a
+    # single event, even if it straddles chunks. If text is False, character data
+    # is skipped altogether. If validate is True, each element is checked by a
+    # Validator as it's parsed. If max_depth is given, LimitExceeded is raised as
+    # soon as elements are nested deeper than that.
+    events = []
+    append = events.append
+
+    def start_element(name, attrs):
+        append((START_ELEMENT, name, attrs))
+
+    def end_element(name):
+        append((END_ELEMENT, name, None))
+
+    def character_data(data):
+        if len(events) > 0 and events[-1][0] == CHARACTERS:
+            events[-1] = (CHARACTERS, events[-1][1] + data, None)
+        else:
+            append((CHARACTERS, data, None))
+
+    if validate:
+        validator = Validator()
+
+        def validate_start_element(name, attrs):
+            validator.start(name, attrs)
+            append((START_ELEMENT, name, attrs))
+
+        def validate_end_element(name):
+            validator.end()
+            append((END_ELEMENT, name, None))
+
+        def validate_character_data(data):
+            validator.text(data)
+            character_data(data)
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.buffer_size = chunk_size
+    if validate:
+        parser.StartElementHandler = validate_start_element
+        parser.EndElementHandler = validate_end_element
+        if text:
+            parser.CharacterDataHandler = validate_character_data
+    else:
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        if text:
+            parser.CharacterDataHandler = character_data
+    if max_depth is not None:
+        limit_depth(parser, max_depth)
+
+    read = stream.read
+    while True:
+        chunk = read(chunk_size)
+        try:
+            parser.Parse(chunk, len(chunk) == 0)
+        except ValidationError as e:
+            raise ValidationError(f"Line {parser.CurrentLineNumber}: {e}") from None
+        if len(chunk) == 0:
+            yield from events
+            return
+
+        count = len(events)
+        if count > 0 and events[-1][0] == CHARACTERS:
+            count -= 1
+        if count > 0:
+            yield from events[:count]
+            del events[:count]
+
+
+def _new_text_node(elements, name, attrs):
+    try:
+        node = elements[name]()
+    except KeyError:
+        raise Exception(f"Node name {name} not recognized.")
+    for k, v in attrs:
+        node.set_attribute(python_name(k), v)
+    return node
+
+
+def _text_content(fnode):
+    snode = fnode.strip()
+    if len(snode) == 0:
+        return None
+    node = snode
+    if len(fnode.rstrip()) < len(fnode):
+        node += " "
+    if len(fnode.lstrip()) < len(fnode):
+        node = " " + node
+    return node
+
+
 class TextReader:
     def __init__(self, text_elem):
+        from odio.text import ELEMENTS
+
         self.nodes = []
         self.attributes = {}
         for node_elem in text_elem.childNodes:
-            self._parse_node(self, node_elem)
+            self._parse_node(ELEMENTS, self, node_elem)
 
-    def _parse_node(self, parent_node, node_dom):
+    def _parse_node(self, elements, parent_node, node_dom):
+        # As with iter_text_nodes(), elements that aren't text elements are skipped
+        # along with their contents
         node_type = node_dom.nodeType
         if node_type == Node.ELEMENT_NODE:
-            name = node_dom.tagName
-            if name == "text:p":
-                node = P()
-            elif name == "text:h":
-                node = H()
-            elif name == "text:span":
-                node = Span()
-            else:
-                raise Exception(f"Node name {name} not recognized.")
-            if node_dom.hasAttributes():
-                attrs = node_dom.attributes
-                for i in range(len(attrs)):
-                    attr = attrs.item(i)
-                    attr_name = attr.name.replace(":", "_").replace("-", "_")
-                    node.attributes[attr_name] = attr.value
+            if node_dom.tagName not in elements:
+                return
+            node = _new_text_node(
+                elements, node_dom.tagName, node_dom.attributes.items()
+            )
             for subnode_dom in node_dom.childNodes:
-                self._parse_node(node, subnode_dom)
+                self._parse_node(elements, node, subnode_dom)
         elif node_type == Node.TEXT_NODE:
-            fnode = node_dom.nodeValue
-            snode = fnode.strip()
-            if len(snode) == 0:
+            node = _text_content(node_dom.nodeValue)
+            if node is None:
                 return
-            node = snode
-            rnode = node.rstrip()
-            if len(rnode) < len(fnode):
-                node += " "
-            lnode = node.lstrip()
-            if len(lnode) < len(fnode):
-                node = " " + node
         else:
             raise Exception(f"Node type {node_type} not recognized.")
         parent_node.nodes.append(node)
+
+
+def iter_text_nodes(content, validate=False, max_depth=None):
+    from odio.text import ELEMENTS
+
+    events = iter_events(content, validate=validate, max_depth=max_depth)
+    for kind, name, attrs in events:
+        if kind == START_ELEMENT and name == "office:text":
+            break
+    else:
+        raise Exception("The element 'office:text' can't be found.")
+
+    # The subtree of each top-level node is built with an explicit stack rather
+    # than by recursion, so deep nesting can't hit the recursion limit. Elements
+    # that aren't text elements, such as office:forms, table:table or a draw:frame
+    # in a paragraph, are skipped along with their contents.
+    stack = []
+    skip = 0
+    for kind, data, attrs in events:
+        if skip > 0:
+            if kind == START_ELEMENT:
+                skip += 1
+            elif kind == END_ELEMENT:
+                skip -= 1
+        elif kind == START_ELEMENT:
+            if data not in ELEMENTS:
+                skip = 1
+                continue
+            node = _new_text_node(ELEMENTS, data, attrs.items())
+            if len(stack) > 0:
+                stack[-1].nodes.append(node)
+            stack.append(node)
+        elif kind == END_ELEMENT:
+            if len(stack) == 0:
+                return
+            node = stack.pop()
+            if len(stack) == 0:
+                yield node
+        else:
+            node = _text_content(data)
+            if node is None:
+                pass
+            elif len(stack) > 0:
+                stack[-1].nodes.append(node)
+            else:
+                yield node
+
+
+def iter_plain_text(content, chunk_size=CHUNK_SIZE, max_depth=None):
+    # Yields the text of each paragraph and heading followed by a newline. White
+    # space is collapsed as described in section 6.1.2 of the ODF 1.2 spec. A
+    # paragraph inside another one, such as in a footnote or a text box, is
+    # yielded on its own line after the paragraph it's in, and the citation of a
+    # note is left out.
+    out = []
+    nested = []
+    para = []
+    append = para.append
+    stack = []
+    space = True
+
+    def start_element(name, attrs):
+        nonlocal para, append, space
+        if name in PARAGRAPHS:
+            if len(stack) == 0:
+                parser.CharacterDataHandler = character_data
+            stack.append((para, space))
+            para = []
+            append = para.append
+            space = True
+        elif len(stack) > 0:
+            if name == "text:s":
+                append(" " * int(attrs.get("text:c", "1")))
+            elif name == "text:tab":
+                append("\t")
+            elif name == "text:line-break":
+                append("\n")
+            elif name == "text:note-citation":
+                parser.CharacterDataHandler = None
+                return
+            else:
+                return
+            space = False
+
+    def end_element(name):
+        nonlocal para, append, space
+        if name in PARAGRAPHS:
+            if space and len(para) > 0 and para[-1].endswith(" "):
+                para[-1] = para[-1][:-1]
+            para.append("\n")
+            text = "".join(para)
+            para, space = stack.pop()
+            append = para.append
+            if len(stack) == 0:
+                parser.CharacterDataHandler = None
+                out.append(text)
+                out.extend(nested)
+                nested.clear()
+            else:
+                nested.append(text)
+        elif name == "text:note-citation" and len(stack) > 0:
+            parser.CharacterDataHandler = character_data
+
+    def character_data(data):
+        nonlocal space
+        if data.isascii():
+            # For ASCII, str.split() only splits on the XML white space
+            # characters, and is much faster than the regular expression.
+            text = " ".join(data.split())
+            if len(text) == 0:
+                text = " "
+            else:
+                if data[0] in " \t\r\n":
+                    text = " " + text
+                if data[-1] in " \t\r\n":
+                    text += " "
+        else:
+            text = WHITESPACE.sub(" ", data)
+        if space and text.startswith(" "):
+            text = text[1:]
+        if len(text) > 0:
+            append(text)
+            space = text.endswith(" ")
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.buffer_size = chunk_size
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    if max_depth is not None:
+        limit_depth(parser, max_depth)
+
+    read = content.read
+    while True:
+        chunk = read(chunk_size)
+        parser.Parse(chunk, len(chunk) == 0)
+        if len(out) > 0:
+            yield "".join(out)
+            out.clear()
+        if len(chunk) == 0:
+            return
+
+
+def iter_tables(content, validate=False, styles=None, budget=None):
+    # Yields a (name, rows) pair for each table, where rows is an iterator of
+    # tuples. Moving on to the next table skips any rows that haven't been read.
+    # The styles that come before the tables are added to the StyleIndex.
+    if styles is None:
+        styles = StyleIndex()
+    max_depth = None if budget is None else budget.limits.max_depth
+    events = iter_events(content, validate=validate, max_depth=max_depth)
+    for kind, name, attrs in events:
+        if kind == START_ELEMENT:
+            if name == "table:table":
+                rows = _iter_rows(events, styles, budget)
+                yield attrs.get("table:name"), rows
+                for _ in rows:
+                    pass
+            elif name in STYLE_CONTAINERS:
+                styles.read(events)
+
+
+def _iter_rows(events, styles, budget=None):
+    # Rows repeated with table:number-rows-repeated are yielded as the same tuple.
+    # Trailing empty cells and rows are left out, so that the padding added by
+    # spreadsheet applications doesn't turn into millions of empty values.
+    text = []
+    get_text = partial(str.join, "", text)
+    cell_attrs = None
+    row = []
+    row_repeat = 1
+    empty_cells = 0
+    empty_rows = 0
+    for kind, data, attrs in events:
+        if kind == START_ELEMENT:
+            if data in CELLS:
+                cell_attrs = attrs
+                text.clear()
+            elif data == "table:table-row":
+                row_repeat = int(attrs.get("table:number-rows-repeated", "1"))
+                row = []
+                empty_cells = 0
+        elif kind == CHARACTERS:
+            if cell_attrs is not None:
+                text.append(data.strip())
+        elif data in CELLS:
+            val = _cell_value(cell_attrs, get_text, styles)
+            count = int(cell_attrs.get("table:number-columns-repeated", "1"))
+            cell_attrs = None
+            if val is None:
+                empty_cells += count
+            else:
+                # Cells are counted before they're expanded
+                if budget is not None:
+                    budget.add_cells(empty_cells + count)
+                if empty_cells > 0:
+                    row.extend([None] * empty_cells)
+                    empty_cells = 0
+                if count == 1:
+                    row.append(val)
+                else:
+                    row.extend([val] * count)
+        elif data == "table:table-row":
+            if len(row) == 0:
+                empty_rows += row_repeat
+            else:
+                if budget is not None:
+                    budget.add_rows(empty_rows + row_repeat)
+                    budget.add_cells(len(row) * (row_repeat - 1))
+                for _ in range(empty_rows):
+                    yield ()
+                empty_rows = 0
+                row = tuple(row)
+                for _ in range(row_repeat):
+                    yield row
+        elif data == "table:table":
+            return
+
+
+def iter_batches(rows, size, columns=False):
+    # Yields lists of up to size rows, or if columns is True, lists of columns,
+    # where each column is a tuple with a value for each row of the batch. Rows
+    # that are shorter than the longest row in their batch are padded with None.
+    while True:
+        batch = list(islice(rows, size))
+        if len(batch) == 0:
+            return
+        if columns:
+            width = max(len(row) for row in batch)
+            batch = list(zip(*(row + (None,) * (width - len(row)) for row in batch)))
+        yield batch
+
+
+def prefetch(items, depth):
+    # Iterates over items in a thread, keeping up to depth of them ready, so that
+    # whatever is done with each item overlaps with producing the next ones. An
+    # exception raised by the iterator is raised again here.
+    from queue import Full, Queue
+
+    queue = Queue(depth)
+    stop = threading.Event()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def run():
+        try:
+            for item in items:
+                if not put((False, item)):
+                    return
+        except BaseException as e:
+            put((True, e))
+        else:
+            put((True, None))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        while True:
+            done, item = queue.get()
+            if done:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+AGGREGATES = ("count", "sum", "min", "max", "distinct")
+
+
+class ColumnAggregate:
+    # The count and distinct count are of the cells that aren't empty, and the sum,
+    # min and max are of the cells that are numbers. Those not asked for are None.
+    # Decimal values, such as currencies, are summed exactly, apart from the sum
+    # of the floats, so the sum of a column of Decimals is an exact Decimal.
+    def __init__(self, names):
+        for name in names:
+            if name not in AGGREGATES:
+                raise Exception(
+                    f"The aggregate '{name}' isn't recognized. The valid aggregates "
+                    f"are 'count', 'sum', 'min', 'max' and 'distinct'."
+                )
+        self.names = tuple(name for name in AGGREGATES if name in names)
+        self.count = 0 if "count" in names else None
+        self._float_sum = None
+        self._decimal_sum = None
+        self.min = None
+        self.max = None
+        self.distinct = 0 if "distinct" in names else None
+        self._numeric = any(name in names for name in ("sum", "min", "max"))
+        self._values = set() if "distinct" in names else None
+
+    def add(self, val, count):
+        # Adds a value that appears count times. Percentage and currency values
+        # are added as their numbers.
+        if val.__class__ is odio.Cell:
+            val = val.value
+        if self.count is not None:
+            self.count += count
+        if self._values is not None and val not in self._values:
+            self._values.add(val)
+            self.distinct += 1
+        if self._numeric and val.__class__ in (float, Decimal):
+            if "sum" in self.names:
+                if val.__class__ is Decimal:
+                    if self._decimal_sum is None:
+                        self._decimal_sum = val * count
+                    else:
+                        self._decimal_sum += val * count
+                elif self._float_sum is None:
+                    self._float_sum = val * count
+                else:
+                    self._float_sum += val * count
+            if "min" in self.names and (self.min is None or val < self.min):
+                self.min = val
+            if "max" in self.names and (self.max is None or val > self.max):
+                self.max = val
+
+    @property
+    def sum(self):
+        if "sum" not in self.names:
+            return None
+        elif self._decimal_sum is None:
+            return 0.0 if self._float_sum is None else self._float_sum
+        elif self._float_sum is None:
+            return self._decimal_sum
+        else:
+            return self._float_sum + float(self._decimal_sum)
+
+    def __repr__(self):
+        arg_str = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.names)
+        return f"odio.v1_2.ColumnAggregate({arg_str})"
+
+
+def aggregate_tables(content, specs, validate=False, styles=None, budget=None):
+    # The specs are {table name: {column index: [aggregate names]}}. The values
+    # are folded in as the cells stream past, and a cell or row that's repeated is
+    # added once with its count multiplied, so that memory doesn't grow with the
+    # size of the tables. Only the cells in the columns asked for are decoded. If
+    # budget is a Budget, the cells and rows of every table are counted against it
+    # as they are by iter_tables(), which only needs their attributes.
+    aggregates = {}
+    for table_name, columns in specs.items():
+        aggregates[table_name] = {c: ColumnAggregate(n) for c, n in columns.items()}
+    if styles is None:
+        styles = StyleIndex()
+
+    text = []
+    get_text = partial(str.join, "", text)
+    table = None
+    cell_attrs = None
+    col = 0
+    row_repeat = 1
+    row_cells = 0
+    empty_cells = 0
+    empty_rows = 0
+    max_depth = None if budget is None else budget.limits.max_depth
+    events = iter_events(content, validate=validate, max_depth=max_depth)
+    for kind, data, attrs in events:
+        if kind == START_ELEMENT:
+            if data in CELLS:
+                if table is not None:
+                    cell_attrs = attrs
+                    text.clear()
+                if budget is not None:
+                    count = int(attrs.get("table:number-columns-repeated", "1"))
+                    if OFFICE_VALUE_TYPE in attrs or "table:formula" in attrs:
+                        budget.add_cells(empty_cells + count)
+                        row_cells += empty_cells + count
+                        empty_cells = 0
+                    else:
+                        empty_cells += count
+            elif data == "table:table-row":
+                row_repeat = int(attrs.get("table:number-rows-repeated", "1"))
+                col = 0
+                row_cells = 0
+                empty_cells = 0
+            elif data == "table:table":
+                table = aggregates.get(attrs.get("table:name"))
+                if table is not None:
+                    columns = sorted(table)
+                empty_rows = 0
+            elif data in STYLE_CONTAINERS:
+                styles.read(events)
+        elif kind == CHARACTERS:
+            if cell_attrs is not None:
+                text.append(data.strip())
+        elif data in CELLS:
+            if cell_attrs is not None:
+                count = int(cell_attrs.get("table:number-columns-repeated", "1"))
+                start = bisect_left(columns, col)
+                stop = bisect_left(columns, col + count)
+                if start < stop:
+                    val = _cell_value(cell_attrs, get_text, styles)
+                    if val is not None:
+                        for c in columns[start:stop]:
+                            table[c].add(val, row_repeat)
+                col += count
+                cell_attrs = None
+        elif data == "table:table-row":
+            if budget is not None:
+                if row_cells == 0:
+                    empty_rows += row_repeat
+                else:
+                    budget.add_rows(empty_rows + row_repeat)
+                    budget.add_cells(row_cells * (row_repeat - 1))
+                    empty_rows = 0
+        elif data == "table:table":
+            table = None
+    return aggregates
+
+
+class SpreadsheetInfo:
+    def __init__(self, version, tables, meta, user_defined):
+        self.version = version
+        self.tables = tables
+        self.meta = meta
+        self.user_defined = user_defined
+
+    def __repr__(self):
+        return (
+            f"odio.v1_2.SpreadsheetInfo(version={self.version!r}, "
+            f"tables={self.tables!r})"
+        )
+
+
+class TableInfo:
+    def __init__(self, name):
+        self.name = name
+        self.row_count = 0
+        self.column_count = 0
+        self.value_types = {}
+
+    def __repr__(self):
+        return (
+            f"odio.v1_2.TableInfo({self.name!r}, row_count={self.row_count}, "
+            f"column_count={self.column_count}, value_types={self.value_types!r})"
+        )
+
+
+def inspect_content(content, flat=False, budget=None):
+    # The row and column counts are those of the used area, so the trailing empty
+    # rows and cells that spreadsheet applications pad a table with don't count.
+    # A flat document has its meta data at the start, and so it's read on the way
+    # through, which needs the character data as well. If budget is a Budget, the
+    # rows and cells of the used areas are counted against it.
+    version = None
+    fields = {}
+    user_defined = {}
+    tables = []
+    table = None
+    rows = 0
+    row_repeat = 1
+    col = 0
+    last_col = 0
+    max_depth = None if budget is None else budget.limits.max_depth
+    events = iter_events(content, text=flat, max_depth=max_depth)
+    for kind, name, attrs in events:
+        if kind == START_ELEMENT:
+            if name in CELLS:
+                count = int(attrs.get("table:number-columns-repeated", "1"))
+                col += count
+                val_type = attrs.get(OFFICE_VALUE_TYPE)
+                if val_type is None and "table:formula" in attrs:
+                    val_type = "formula"
+                if val_type is not None:
+                    value_types = table.value_types
+                    value_types[val_type] = (
+                        value_types.get(val_type, 0) + count * row_repeat
+                    )
+                    last_col = col
+            elif name == "table:table-row":
+                row_repeat = int(attrs.get("table:number-rows-repeated", "1"))
+                col = last_col = 0
+            elif name == "table:table":
+                table = TableInfo(attrs.get("table:name"))
+                tables.append(table)
+                rows = 0
+            elif name in ("office:document", "office:document-content"):
+                version = attrs.get("office:version")
+            elif name == "office:meta":
+                fields, user_defined = _inspect_meta(events)
+        elif kind == END_ELEMENT and name == "table:table-row":
+            rows += row_repeat
+            if last_col > 0:
+                if budget is not None:
+                    budget.add_rows(rows - table.row_count)
+                    budget.add_cells(last_col * row_repeat)
+                table.row_count = rows
+                table.column_count = max(table.column_count, last_col)
+    return version, tables, fields, user_defined
+
+
+def inspect_meta(meta, max_depth=None):
+    return _inspect_meta(iter_events(meta, max_depth=max_depth))
+
+
+def _inspect_meta(events):
+    # Stops at the end of the office:meta element
+    fields = {}
+    user_defined = {}
+    user_name = None
+    text = []
+    for kind, data, attrs in events:
+        if kind == START_ELEMENT:
+            text.clear()
+            if data == "meta:document-statistic":
+                fields.update(attrs)
+            elif data == "meta:user-defined":
+                user_name = attrs.get("meta:name")
+        elif kind == CHARACTERS:
+            text.append(data)
+        else:
+            value = "".join(text)
+            text.clear()
+            if data == "meta:user-defined":
+                user_defined[user_name] = value
+            elif data == "office:meta":
+                break
+            elif len(value.strip()) > 0:
+                fields[data] = value
+    return fields, user_defined
+
+
+class RowHashes:
+    # A manifest of the hash of each row of each table, in the order of the tables
+    # in the document. It can be saved, so that the next diff only has to read the
+    # new version of a spreadsheet.
+    def __init__(self, tables):
+        self.tables = tables
+
+    def __repr__(self):
+        arg_str = ", ".join(f"{name!r}: {len(hashes)}" for name, hashes in self.tables)
+        return f"odio.v1_2.RowHashes({{{arg_str}}})"
+
+    def save(self, f):
+        import json
+
+        json.dump(
+            [[name, [h.hex() for h in hashes]] for name, hashes in self.tables], f
+        )
+
+
+def load_row_hashes(f):
+    import json
+
+    return RowHashes(
+        [(name, [bytes.fromhex(h) for h in hashes]) for name, hashes in json.load(f)]
+    )
+
+
+# The markers that hash_tables() puts in the text of a cell for the start of a
+# paragraph and for the elements that stand for white space. They're control
+# characters, which can't appear in the character data of an XML 1.0 document.
+# The count of a text:s comes between its marker and SPACE_COUNT_END.
+PARAGRAPH_MARK = "\x01"
+
+SPACE_MARKS = {"text:line-break": "\x02", "text:s": "\x03", "text:tab": "\x04"}
+
+SPACE_COUNT_END = "\x05"
+
+# The attributes of a cell that make its value. Style names and other attributes of
+# its presentation are left out of its key, as they change when a document is saved
+# again, or only its formatting is changed.
+VALUE_ATTRS = (
+    "office:boolean-value",
+    "office:currency",
+    "office:date-value",
+    "office:string-value",
+    "office:time-value",
+    "office:value",
+    OFFICE_VALUE_TYPE,
+    "table:formula",
+)
+
+
+def _cell_key(attrs, text):
+    # Empty cells all have the same key, whatever their style
+    if OFFICE_VALUE_TYPE not in attrs and "table:formula" not in attrs:
+        if all(t == PARAGRAPH_MARK for t in text):
+            return None
+    parts = [f"{k}={attrs[k]}" for k in VALUE_ATTRS if k in attrs]
+    parts.append("".join(text))
+    return "\x1f".join(parts).encode("utf8")
+
+
+def hash_tables(content, budget=None):
+    # The hash of a row is taken from the value attributes and text of its cells,
+    # without decoding their values. Runs of identical cells are hashed as a cell and a
+    # count, so a row hashes the same however its cells are grouped into repeats.
+    # Paragraph boundaries and white space elements are part of the text, so cells
+    # whose text only differs in its layout hash differently. As with
+    # iter_tables(), trailing empty cells and rows are left out, and if budget is a
+    # Budget, the rest are counted against it before they're hashed.
+    from hashlib import blake2b
+
+    tables = []
+    hashes = None
+    text = []
+    cell_attrs = None
+    runs = []
+    row_repeat = 1
+    empty_rows = 0
+    empty_row = blake2b(digest_size=16).digest()
+    max_depth = None if budget is None else budget.limits.max_depth
+    for kind, data, attrs in iter_events(content, max_depth=max_depth):
+        if kind == START_ELEMENT:
+            if data in CELLS:
+                cell_attrs = attrs
+                text.clear()
+            elif data == "table:table-row":
+                row_repeat = int(attrs.get("table:number-rows-repeated", "1"))
+                runs.clear()
+            elif data == "table:table":
+                hashes = []
+                tables.append((attrs.get("table:name"), hashes))
+                empty_rows = 0
+            elif cell_attrs is not None:
+                if data in PARAGRAPHS:
+                    text.append(PARAGRAPH_MARK)
+                elif data == "text:s":
+                    spaces = attrs.get("text:c", "1")
+                    text.append(f"{SPACE_MARKS[data]}{spaces}{SPACE_COUNT_END}")
+                elif data in SPACE_MARKS:
+                    text.append(SPACE_MARKS[data])
+        elif kind == CHARACTERS:
+            if cell_attrs is not None:
+                text.append(data.strip())
+        elif data in CELLS:
+            key = _cell_key(cell_attrs, text)
+            count = int(cell_attrs.get("table:number-columns-repeated", "1"))
+            cell_attrs = None
+            if len(runs) > 0 and runs[-1][0] == key:
+                runs[-1][1] += count
+            else:
+                runs.append([key, count])
+        elif data == "table:table-row":
+            if len(runs) > 0 and runs[-1][0] is None:
+                runs.pop()
+            if len(runs) == 0:
+                empty_rows += row_repeat
+            else:
+                if budget is not None:
+                    budget.add_rows(empty_rows + row_repeat)
+                    budget.add_cells(sum(count for _, count in runs) * row_repeat)
+                hashes.extend([empty_row] * empty_rows)
+                empty_rows = 0
+                h = blake2b(digest_size=16)
+                for key, count in runs:
+                    h.update(b"%d\x1e" % count)
+                    if key is not None:
+                        h.update(key)
+                    h.update(b"\x1d")
+                hashes.extend([h.digest()] * row_repeat)
+    return RowHashes(tables)
+
+
+class SpreadsheetDiff:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def __repr__(self):
+        return f"odio.v1_2.SpreadsheetDiff({self.tables!r})"
+
+
+class TableDiff:
+    # Each range is a (start, stop) pair of zero-based row numbers. The deleted
+    # ranges refer to rows of the old table, and the inserted and changed ranges to
+    # rows of the new table.
+    def __init__(self, name):
+        self.name = name
+        self.inserted = []
+        self.deleted = []
+        self.changed = []
+
+    def __repr__(self):
+        return (
+            f"odio.v1_2.TableDiff({self.name!r}, inserted={self.inserted!r}, "
+            f"deleted={self.deleted!r}, changed={self.changed!r})"
+        )
+
+
+def _diff_rows(table, old, new):
+    # Rows at the start and end that haven't changed are skipped before the
+    # matching, which is all that's needed when a few rows have changed.
+    lo = 0
+    hi_old = len(old)
+    hi_new = len(new)
+    while lo < hi_old and lo < hi_new and old[lo] == new[lo]:
+        lo += 1
+    while hi_old > lo and hi_new > lo and old[hi_old - 1] == new[hi_new - 1]:
+        hi_old -= 1
+        hi_new -= 1
+
+    from difflib import SequenceMatcher
+
+    matcher = SequenceMatcher(None, old[lo:hi_old], new[lo:hi_new], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        i1 += lo
+        i2 += lo
+        j1 += lo
+        j2 += lo
+        if tag == "replace":
+            common = min(i2 - i1, j2 - j1)
+            table.changed.append((j1, j1 + common))
+            if i2 - i1 > common:
+                table.deleted.append((i1 + common, i2))
+            elif j2 - j1 > common:
+                table.inserted.append((j1 + common, j2))
+        elif tag == "delete":
+            table.deleted.append((i1, i2))
+        elif tag == "insert":
+            table.inserted.append((j1, j2))
+
+
+def diff_row_hashes(old, new):
+    # Tables are matched by name. A table that's only in the old spreadsheet has
+    # all its rows deleted, and one that's only in the new spreadsheet has all its
+    # rows inserted.
+    old_tables = dict(old.tables)
+    new_names = set()
+    tables = []
+    for name, new_hashes in new.tables:
+        new_names.add(name)
+        table = TableDiff(name)
+        tables.append(table)
+        old_hashes = old_tables.get(name)
+        if old_hashes is None:
+            if len(new_hashes) > 0:
+                table.inserted.append((0, len(new_hashes)))
+        else:
+            _diff_rows(table, old_hashes, new_hashes)
+
+    for name, old_hashes in old.tables:
+        if name not in new_names:
+            table = TableDiff(name)
+            tables.append(table)
+            if len(old_hashes) > 0:
+                table.deleted.append((0, len(old_hashes)))
+    return SpreadsheetDiff(tables)
@@ -0,0 +1,15 @@
+# Generated from gen/OpenDocument-schema-v1.2-cd04.rng by gen/compile_schema.py.
+# Don't edit.
+
+# The elements that can contain a text:line-break
+LINE_BREAK_ELEMENTS = frozenset(
+    (
+        "text:a",
+        "text:h",
+        "text:meta",
+        "text:meta-field",
+        "text:p",
+        "text:ruby-base",
+        "text:span",
+    )
+)
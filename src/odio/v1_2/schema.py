@@ -0,0 +1,3311 @@
+# Generated from gen/OpenDocument-schema-v1.2-cd04.rng by gen/compile_schema.py.
+# Don't edit.
+
+# flake8: noqa
+# fmt: off
+
+ROOTS = frozenset(('office:document', 'office:document-content', 'office:document-meta', 'office:document-settings', 'office:document-styles'))
+
+PREFIXES = frozenset(('anim', 'chart', 'config', 'db', 'dc', 'dr3d', 'draw', 'fo', 'form', 'grddl', 'math', 'meta', 'number', 'office', 'presentation', 'script', 'smil', 'style', 'svg', 'table', 'text', 'xforms', 'xhtml', 'xlink', 'xml'))
+
+CHECKED_PREFIXES = frozenset(('meta', 'number', 'office', 'style', 'table', 'text'))
+
+_SETS = [
+    frozenset(('onLoad',)),
+    frozenset(('replace',)),
+    frozenset(('simple',)),
+    frozenset(()),
+    frozenset(('meta:delay', 'xlink:actuate', 'xlink:href', 'xlink:show', 'xlink:type')),
+    frozenset(('meta:cell-count', 'meta:character-count', 'meta:draw-count', 'meta:frame-count', 'meta:image-count', 'meta:non-whitespace-character-count', 'meta:object-count', 'meta:ole-object-count', 'meta:page-count', 'meta:paragraph-count', 'meta:row-count', 'meta:sentence-count', 'meta:syllable-count', 'meta:table-count', 'meta:word-count')),
+    frozenset(('new', 'replace')),
+    frozenset(('office:target-frame-name', 'xlink:show')),
+    frozenset(('onRequest',)),
+    frozenset(('meta:date', 'xlink:actuate', 'xlink:href', 'xlink:title', 'xlink:type')),
+    frozenset(('xlink:href', 'xlink:type')),
+    frozenset(('boolean', 'date', 'float', 'string', 'time')),
+    frozenset(('meta:name', 'meta:value-type')),
+    frozenset(('meta:name',)),
+    frozenset(('long', 'medium', 'short')),
+    frozenset(('false', 'true')),
+    frozenset(('number:boolean', 'number:text', 'style:map', 'style:text-properties')),
+    frozenset(('number:country', 'number:language', 'number:rfc-language-tag', 'number:script', 'number:title', 'number:transliteration-country', 'number:transliteration-format', 'number:transliteration-language', 'number:transliteration-style', 'style:name', 'style:volatile')),
+    frozenset(('style:name',)),
+    frozenset(('number:currency-symbol', 'number:number', 'number:text', 'style:map', 'style:text-properties')),
+    frozenset(('number:automatic-order', 'number:country', 'number:language', 'number:rfc-language-tag', 'number:script', 'number:title', 'number:transliteration-country', 'number:transliteration-format', 'number:transliteration-language', 'number:transliteration-style', 'style:name', 'style:volatile')),
+    frozenset(('number:country', 'number:language', 'number:rfc-language-tag', 'number:script')),
+    frozenset(('fixed', 'language')),
+    frozenset(('number:am-pm', 'number:day', 'number:day-of-week', 'number:era', 'number:hours', 'number:minutes', 'number:month', 'number:quarter', 'number:seconds', 'number:text', 'number:week-of-year', 'number:year', 'style:map', 'style:text-properties')),
+    frozenset(('number:automatic-order', 'number:country', 'number:format-source', 'number:language', 'number:rfc-language-tag', 'number:script', 'number:title', 'number:transliteration-country', 'number:transliteration-format', 'number:transliteration-language', 'number:transliteration-style', 'style:name', 'style:volatile')),
+    frozenset(('long', 'short')),
+    frozenset(('number:calendar', 'number:style')),
+    frozenset(('number:position',)),
+    frozenset(('number:denominator-value', 'number:grouping', 'number:min-denominator-digits', 'number:min-integer-digits', 'number:min-numerator-digits')),
+    frozenset(('number:style',)),
+    frozenset(('number:calendar', 'number:possessive-form', 'number:style', 'number:textual')),
+    frozenset(('number:embedded-text',)),
+    frozenset(('number:decimal-places', 'number:decimal-replacement', 'number:display-factor', 'number:grouping', 'number:min-integer-digits')),
+    frozenset(('number:fraction', 'number:number', 'number:scientific-number', 'number:text', 'style:map', 'style:text-properties')),
+    frozenset(('number:number', 'number:text', 'style:map', 'style:text-properties')),
+    frozenset(('number:decimal-places', 'number:grouping', 'number:min-exponent-digits', 'number:min-integer-digits')),
+    frozenset(('number:decimal-places', 'number:style')),
+    frozenset(('number:text', 'number:text-content', 'style:map', 'style:text-properties')),
+    frozenset(('number:am-pm', 'number:hours', 'number:minutes', 'number:seconds', 'number:text', 'style:map', 'style:text-properties')),
+    frozenset(('number:country', 'number:format-source', 'number:language', 'number:rfc-language-tag', 'number:script', 'number:title', 'number:transliteration-country', 'number:transliteration-format', 'number:transliteration-language', 'number:transliteration-style', 'number:truncate-on-overflow', 'style:name', 'style:volatile')),
+    frozenset(('number:calendar',)),
+    frozenset(('as-char', 'char', 'frame', 'page', 'paragraph')),
+    frozenset(('dc:creator', 'dc:date', 'meta:date-string', 'text:list', 'text:p')),
+    frozenset(('draw:caption-point-x', 'draw:caption-point-y', 'draw:class-names', 'draw:corner-radius', 'draw:id', 'draw:layer', 'draw:name', 'draw:style-name', 'draw:text-style-name', 'draw:transform', 'draw:z-index', 'office:display', 'office:name', 'presentation:class-names', 'presentation:style-name', 'svg:height', 'svg:width', 'svg:x', 'svg:y', 'table:end-cell-address', 'table:end-x', 'table:end-y', 'table:table-background', 'text:anchor-page-number', 'text:anchor-type', 'xml:id')),
+    frozenset(('office:name',)),
+    frozenset(('number:boolean-style', 'number:currency-style', 'number:date-style', 'number:number-style', 'number:percentage-style', 'number:text-style', 'number:time-style', 'style:page-layout', 'style:style', 'text:list-style')),
+    frozenset(('office:chart', 'office:database', 'office:drawing', 'office:image', 'office:presentation', 'office:spreadsheet', 'office:text')),
+    frozenset(('dc:creator', 'dc:date', 'text:p')),
+    frozenset(('chart:chart', 'table:calculation-settings', 'table:consolidation', 'table:content-validations', 'table:data-pilot-tables', 'table:database-ranges', 'table:dde-links', 'table:label-ranges', 'table:named-expressions', 'text:alphabetical-index-auto-mark-file', 'text:dde-connection-decls', 'text:sequence-decls', 'text:user-field-decls', 'text:variable-decls')),
+    frozenset(('db:data-source', 'db:forms', 'db:queries', 'db:reports', 'db:schema-definition', 'db:table-representations')),
+    frozenset(('into-default-style-data-style', 'into-english-number', 'keep-text')),
+    frozenset(('office:automatic-update', 'office:conversion-mode', 'office:dde-application', 'office:dde-item', 'office:dde-topic', 'office:name')),
+    frozenset(('office:dde-application', 'office:dde-item', 'office:dde-topic')),
+    frozenset(('1.2',)),
+    frozenset(('office:automatic-styles', 'office:body', 'office:font-face-decls', 'office:master-styles', 'office:meta', 'office:scripts', 'office:settings', 'office:styles')),
+    frozenset(('grddl:transformation', 'office:mimetype', 'office:version')),
+    frozenset(('office:mimetype', 'office:version')),
+    frozenset(('office:automatic-styles', 'office:body', 'office:font-face-decls', 'office:scripts')),
+    frozenset(('grddl:transformation', 'office:version')),
+    frozenset(('office:version',)),
+    frozenset(('office:meta',)),
+    frozenset(('office:settings',)),
+    frozenset(('office:automatic-styles', 'office:font-face-decls', 'office:master-styles', 'office:styles')),
+    frozenset(('draw:page', 'table:calculation-settings', 'table:consolidation', 'table:content-validations', 'table:data-pilot-tables', 'table:database-ranges', 'table:dde-links', 'table:label-ranges', 'table:named-expressions', 'text:alphabetical-index-auto-mark-file', 'text:dde-connection-decls', 'text:sequence-decls', 'text:user-field-decls', 'text:variable-decls')),
+    frozenset(('presentation:event-listener', 'script:event-listener')),
+    frozenset(('style:font-face',)),
+    frozenset(('form:form', 'xforms:model')),
+    frozenset(('form:apply-design-mode', 'form:automatic-focus')),
+    frozenset(('draw:frame',)),
+    frozenset(('draw:layer-set', 'style:handout-master', 'style:master-page', 'table:table-template')),
+    frozenset(('dc:creator', 'dc:date', 'dc:description', 'dc:language', 'dc:subject', 'dc:title', 'meta:auto-reload', 'meta:creation-date', 'meta:document-statistic', 'meta:editing-cycles', 'meta:editing-duration', 'meta:generator', 'meta:hyperlink-behaviour', 'meta:initial-creator', 'meta:keyword', 'meta:print-date', 'meta:printed-by', 'meta:template', 'meta:user-defined')),
+    frozenset(('draw:page', 'presentation:date-time-decl', 'presentation:footer-decl', 'presentation:header-decl', 'presentation:settings', 'table:calculation-settings', 'table:consolidation', 'table:content-validations', 'table:data-pilot-tables', 'table:database-ranges', 'table:dde-links', 'table:label-ranges', 'table:named-expressions', 'text:alphabetical-index-auto-mark-file', 'text:dde-connection-decls', 'text:sequence-decls', 'text:user-field-decls', 'text:variable-decls')),
+    frozenset(('script:language',)),
+    frozenset(('office:event-listeners', 'office:script')),
+    frozenset(('config:config-item-set',)),
+    frozenset(('table:calculation-settings', 'table:consolidation', 'table:content-validations', 'table:data-pilot-tables', 'table:database-ranges', 'table:dde-links', 'table:label-ranges', 'table:named-expressions', 'table:table', 'table:tracked-changes', 'text:alphabetical-index-auto-mark-file', 'text:dde-connection-decls', 'text:sequence-decls', 'text:user-field-decls', 'text:variable-decls')),
+    frozenset(('table:protection-key', 'table:protection-key-digest-algorithm', 'table:structure-protected')),
+    frozenset(('draw:fill-image', 'draw:gradient', 'draw:hatch', 'draw:marker', 'draw:opacity', 'draw:stroke-dash', 'number:boolean-style', 'number:currency-style', 'number:date-style', 'number:number-style', 'number:percentage-style', 'number:text-style', 'number:time-style', 'style:default-page-layout', 'style:default-style', 'style:presentation-page-layout', 'style:style', 'svg:linearGradient', 'svg:radialGradient', 'text:bibliography-configuration', 'text:linenumbering-configuration', 'text:list-style', 'text:notes-configuration', 'text:outline-style')),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:forms', 'table:calculation-settings', 'table:consolidation', 'table:content-validations', 'table:data-pilot-tables', 'table:database-ranges', 'table:dde-links', 'table:label-ranges', 'table:named-expressions', 'table:table', 'text:alphabetical-index', 'text:alphabetical-index-auto-mark-file', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:dde-connection-decls', 'text:h', 'text:illustration-index', 'text:list', 'text:numbered-paragraph', 'text:object-index', 'text:p', 'text:page-sequence', 'text:section', 'text:sequence-decls', 'text:soft-page-break', 'text:table-index', 'text:table-of-content', 'text:tracked-changes', 'text:user-field-decls', 'text:user-index', 'text:variable-decls')),
+    frozenset(('text:global', 'text:use-soft-page-breaks')),
+    frozenset(('no-repeat', 'repeat', 'stretch')),
+    frozenset(('embed',)),
+    frozenset(('office:binary-data',)),
+    frozenset(('draw:opacity', 'style:filter-name', 'style:position', 'style:repeat', 'xlink:actuate', 'xlink:href', 'xlink:show', 'xlink:type')),
+    frozenset(('near-axis', 'near-axis-other-side', 'outside-end', 'outside-start')),
+    frozenset(('none', 'percentage', 'value', 'value-and-percentage')),
+    frozenset(('cell-range', 'constant', 'error-margin', 'none', 'percentage', 'standard-deviation', 'standard-error', 'variance')),
+    frozenset(('b-spline', 'cubic-spline', 'none')),
+    frozenset(('side-by-side', 'stagger-even', 'stagger-odd')),
+    frozenset(('avoid-overlap', 'bottom', 'bottom-left', 'bottom-right', 'center', 'inside', 'left', 'near-origin', 'outside', 'right', 'top', 'top-left', 'top-right')),
+    frozenset(('exponential', 'linear', 'logarithmic', 'none', 'power')),
+    frozenset(('columns', 'rows')),
+    frozenset(('cone', 'cuboid', 'cylinder', 'pyramid')),
+    frozenset(('arrow-down', 'arrow-left', 'arrow-right', 'arrow-up', 'asterisk', 'bow-tie', 'circle', 'diamond', 'horizontal-bar', 'hourglass', 'plus', 'square', 'star', 'vertical-bar', 'x')),
+    frozenset(('automatic', 'image', 'named-symbol', 'none')),
+    frozenset(('at-axis', 'at-labels', 'at-labels-and-axis')),
+    frozenset(('ignore', 'leave-gap', 'use-zero')),
+    frozenset(('ltr', 'ttb')),
+    frozenset(('chart:label-separator', 'chart:symbol-image')),
+    frozenset(('chart:angle-offset', 'chart:auto-position', 'chart:auto-size', 'chart:axis-label-position', 'chart:axis-position', 'chart:connect-bars', 'chart:data-label-number', 'chart:data-label-symbol', 'chart:data-label-text', 'chart:deep', 'chart:display-label', 'chart:error-category', 'chart:error-lower-indicator', 'chart:error-lower-limit', 'chart:error-margin', 'chart:error-percentage', 'chart:error-upper-indicator', 'chart:error-upper-limit', 'chart:gap-width', 'chart:group-bars-per-axis', 'chart:hole-size', 'chart:include-hidden-cells', 'chart:interpolation', 'chart:interval-major', 'chart:interval-minor-divisor', 'chart:japanese-candle-stick', 'chart:label-arrangement', 'chart:label-position', 'chart:label-position-negative', 'chart:lines', 'chart:link-data-style-to-source', 'chart:logarithmic', 'chart:maximum', 'chart:mean-value', 'chart:minimum', 'chart:origin', 'chart:overlap', 'chart:percentage', 'chart:pie-offset', 'chart:regression-type', 'chart:reverse-direction', 'chart:right-angled-axes', 'chart:scale-text', 'chart:series-source', 'chart:solid-type', 'chart:sort-by-x-values', 'chart:spline-order', 'chart:spline-resolution', 'chart:stacked', 'chart:symbol-height', 'chart:symbol-name', 'chart:symbol-type', 'chart:symbol-width', 'chart:text-overlap', 'chart:three-dimensional', 'chart:tick-mark-position', 'chart:tick-marks-major-inner', 'chart:tick-marks-major-outer', 'chart:tick-marks-minor-inner', 'chart:tick-marks-minor-outer', 'chart:treat-empty-cells', 'chart:vertical', 'chart:visible', 'style:direction', 'style:rotation-angle', 'text:line-break')),
+    frozenset(('fo:end-indent', 'fo:space-after', 'fo:space-before', 'fo:start-indent', 'style:rel-width')),
+    frozenset(('style:rel-width',)),
+    frozenset(('dashed', 'dot-dashed', 'dotted', 'none', 'solid')),
+    frozenset(('bottom', 'middle', 'top')),
+    frozenset(('style:color', 'style:height', 'style:style', 'style:vertical-align', 'style:width')),
+    frozenset(('style:width',)),
+    frozenset(('style:column', 'style:column-sep')),
+    frozenset(('fo:column-count', 'fo:column-gap')),
+    frozenset(('fo:column-count',)),
+    frozenset(('style:footer-style', 'style:header-style', 'style:page-layout-properties')),
+    frozenset(('chart', 'drawing-page', 'graphic', 'paragraph', 'presentation', 'ruby', 'section', 'table', 'table-cell', 'table-column', 'table-row', 'text')),
+    frozenset(('style:chart-properties', 'style:drawing-page-properties', 'style:graphic-properties', 'style:paragraph-properties', 'style:ruby-properties', 'style:section-properties', 'style:table-cell-properties', 'style:table-column-properties', 'style:table-properties', 'style:table-row-properties', 'style:text-properties')),
+    frozenset(('style:family',)),
+    frozenset(('border', 'full')),
+    frozenset(('bitmap', 'gradient', 'hatch', 'none', 'solid')),
+    frozenset(('bottom', 'bottom-left', 'bottom-right', 'center', 'left', 'right', 'top', 'top-left', 'top-right')),
+    frozenset(('fast', 'medium', 'slow')),
+    frozenset(('clockwise', 'close', 'close-horizontal', 'close-vertical', 'counterclockwise', 'dissolve', 'fade-from-bottom', 'fade-from-center', 'fade-from-left', 'fade-from-lowerleft', 'fade-from-lowerright', 'fade-from-right', 'fade-from-top', 'fade-from-upperleft', 'fade-from-upperright', 'fade-to-center', 'fly-away', 'horizontal-checkerboard', 'horizontal-lines', 'horizontal-stripes', 'interlocking-horizontal-left', 'interlocking-horizontal-right', 'interlocking-vertical-bottom', 'interlocking-vertical-top', 'melt', 'move-from-bottom', 'move-from-left', 'move-from-lowerleft', 'move-from-lowerright', 'move-from-right', 'move-from-top', 'move-from-upperleft', 'move-from-upperright', 'none', 'open', 'open-horizontal', 'open-vertical', 'random', 'roll-from-bottom', 'roll-from-left', 'roll-from-right', 'roll-from-top', 'spiralin-left', 'spiralin-right', 'spiralout-left', 'spiralout-right', 'stretch-from-bottom', 'stretch-from-left', 'stretch-from-right', 'stretch-from-top', 'uncover-to-bottom', 'uncover-to-left', 'uncover-to-lowerleft', 'uncover-to-lowerright', 'uncover-to-right', 'uncover-to-top', 'uncover-to-upperleft', 'uncover-to-upperright', 'vertical-checkerboard', 'vertical-lines', 'vertical-stripes', 'wavyline-from-bottom', 'wavyline-from-left', 'wavyline-from-right', 'wavyline-from-top')),
+    frozenset(('automatic', 'manual', 'semi-automatic')),
+    frozenset(('hidden', 'visible')),
+    frozenset(('forward', 'reverse')),
+    frozenset(('evenodd', 'nonzero')),
+    frozenset(('presentation:sound',)),
+    frozenset(('draw:background-size', 'draw:fill', 'draw:fill-color', 'draw:fill-gradient-name', 'draw:fill-hatch-name', 'draw:fill-hatch-solid', 'draw:fill-image-height', 'draw:fill-image-name', 'draw:fill-image-ref-point', 'draw:fill-image-ref-point-x', 'draw:fill-image-ref-point-y', 'draw:fill-image-width', 'draw:gradient-step-count', 'draw:opacity', 'draw:opacity-name', 'draw:secondary-fill-color', 'draw:tile-repeat-offset', 'presentation:background-objects-visible', 'presentation:background-visible', 'presentation:display-date-time', 'presentation:display-footer', 'presentation:display-header', 'presentation:display-page-number', 'presentation:duration', 'presentation:transition-speed', 'presentation:transition-style', 'presentation:transition-type', 'presentation:visibility', 'smil:direction', 'smil:fadeColor', 'smil:subtype', 'smil:type', 'style:repeat', 'svg:fill-rule')),
+    frozenset(('style:distance', 'style:length', 'style:lines', 'style:style-name')),
+    frozenset(('decorative', 'modern', 'roman', 'script', 'swiss', 'system')),
+    frozenset(('fixed', 'variable')),
+    frozenset(('condensed', 'expanded', 'extra-condensed', 'extra-expanded', 'normal', 'semi-condensed', 'semi-expanded', 'ultra-condensed', 'ultra-expanded')),
+    frozenset(('italic', 'normal', 'oblique')),
+    frozenset(('normal', 'small-caps')),
+    frozenset(('100', '200', '300', '400', '500', '600', '700', '800', '900', 'bold', 'normal')),
+    frozenset(('svg:definition-src', 'svg:font-face-src')),
+    frozenset(('style:font-adornments', 'style:font-charset', 'style:font-family-generic', 'style:font-pitch', 'style:name', 'svg:accent-height', 'svg:alphabetic', 'svg:ascent', 'svg:bbox', 'svg:cap-height', 'svg:descent', 'svg:font-family', 'svg:font-size', 'svg:font-stretch', 'svg:font-style', 'svg:font-variant', 'svg:font-weight', 'svg:hanging', 'svg:ideographic', 'svg:mathematical', 'svg:overline-position', 'svg:overline-thickness', 'svg:panose-1', 'svg:slope', 'svg:stemh', 'svg:stemv', 'svg:strikethrough-position', 'svg:strikethrough-thickness', 'svg:underline-position', 'svg:underline-thickness', 'svg:unicode-range', 'svg:units-per-em', 'svg:v-alphabetic', 'svg:v-hanging', 'svg:v-ideographic', 'svg:v-mathematical', 'svg:widths', 'svg:x-height')),
+    frozenset(('style:region-center', 'style:region-left', 'style:region-right', 'table:table', 'text:alphabetical-index', 'text:alphabetical-index-auto-mark-file', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:dde-connection-decls', 'text:h', 'text:illustration-index', 'text:index-title', 'text:list', 'text:object-index', 'text:p', 'text:section', 'text:sequence-decls', 'text:table-index', 'text:table-of-content', 'text:tracked-changes', 'text:user-field-decls', 'text:user-index', 'text:variable-decls')),
+    frozenset(('style:display',)),
+    frozenset(('style:header-footer-properties',)),
+    frozenset(('center', 'left', 'right')),
+    frozenset(('dash', 'dot-dash', 'dot-dot-dash', 'dotted', 'long-dash', 'none', 'solid', 'wave')),
+    frozenset(('style:adjustment', 'style:color', 'style:distance-after-sep', 'style:distance-before-sep', 'style:line-style', 'style:rel-width', 'style:width')),
+    frozenset(('disabled', 'enabled')),
+    frozenset(('attractive', 'correct')),
+    frozenset(('double-sided', 'standard')),
+    frozenset(('inverse', 'normal')),
+    frozenset(('flat', 'object', 'sphere')),
+    frozenset(('object', 'parallel', 'sphere')),
+    frozenset(('color', 'intensity', 'luminance')),
+    frozenset(('blend', 'modulate', 'replace')),
+    frozenset(('fixed', 'free')),
+    frozenset(('auto', 'horizontal', 'vertical')),
+    frozenset(('angled-connector-line', 'angled-line', 'straight-line')),
+    frozenset(('greyscale', 'mono', 'standard', 'watermark')),
+    frozenset(('content', 'icon', 'print-view', 'thumbnail')),
+    frozenset(('automatic', 'inside', 'left-outside', 'right-outside')),
+    frozenset(('above', 'automatic', 'below', 'center')),
+    frozenset(('above', 'below')),
+    frozenset(('dash', 'none', 'solid')),
+    frozenset(('bevel', 'middle', 'miter', 'none', 'round')),
+    frozenset(('center', 'justify', 'left', 'right')),
+    frozenset(('bottom', 'justify', 'middle', 'top')),
+    frozenset(('automatic', 'cm', 'ft', 'inch', 'km', 'm', 'mi', 'mm', 'pc', 'pt')),
+    frozenset(('iterative', 'once-concurrent', 'once-successive')),
+    frozenset(('no-wrap', 'wrap')),
+    frozenset(('center', 'from-inside', 'from-left', 'inside', 'left', 'outside', 'right')),
+    frozenset(('char', 'frame', 'frame-content', 'frame-end-margin', 'frame-start-margin', 'page', 'page-content', 'page-end-margin', 'page-start-margin', 'paragraph', 'paragraph-content', 'paragraph-end-margin', 'paragraph-start-margin')),
+    frozenset(('auto-create-new-frame', 'clip')),
+    frozenset(('background', 'foreground')),
+    frozenset(('below', 'bottom', 'from-top', 'middle', 'top')),
+    frozenset(('baseline', 'char', 'frame', 'frame-content', 'line', 'page', 'page-content', 'paragraph', 'paragraph-content', 'text')),
+    frozenset(('biggest', 'dynamic', 'left', 'none', 'parallel', 'right', 'run-through')),
+    frozenset(('full', 'outside')),
+    frozenset(('lr', 'lr-tb', 'page', 'rl', 'rl-tb', 'tb', 'tb-lr', 'tb-rl')),
+    frozenset(('butt', 'round', 'square')),
+    frozenset(('alternate', 'none', 'scroll', 'slide')),
+    frozenset(('down', 'left', 'right', 'up')),
+    frozenset(('style:background-image', 'style:columns', 'text:list-style')),
+    frozenset(('dr3d:ambient-color', 'dr3d:back-scale', 'dr3d:backface-culling', 'dr3d:close-back', 'dr3d:close-front', 'dr3d:depth', 'dr3d:diffuse-color', 'dr3d:edge-rounding', 'dr3d:edge-rounding-mode', 'dr3d:emissive-color', 'dr3d:end-angle', 'dr3d:horizontal-segments', 'dr3d:lighting-mode', 'dr3d:normals-direction', 'dr3d:normals-kind', 'dr3d:shadow', 'dr3d:shininess', 'dr3d:specular-color', 'dr3d:texture-filter', 'dr3d:texture-generation-mode-x', 'dr3d:texture-generation-mode-y', 'dr3d:texture-kind', 'dr3d:texture-mode', 'dr3d:vertical-segments', 'draw:auto-grow-height', 'draw:auto-grow-width', 'draw:blue', 'draw:caption-angle', 'draw:caption-angle-type', 'draw:caption-escape', 'draw:caption-escape-direction', 'draw:caption-fit-line-length', 'draw:caption-gap', 'draw:caption-line-length', 'draw:caption-type', 'draw:color-inversion', 'draw:color-mode', 'draw:contrast', 'draw:decimal-places', 'draw:draw-aspect', 'draw:end-guide', 'draw:end-line-spacing-horizontal', 'draw:end-line-spacing-vertical', 'draw:fill', 'draw:fill-color', 'draw:fill-gradient-name', 'draw:fill-hatch-name', 'draw:fill-hatch-solid', 'draw:fill-image-height', 'draw:fill-image-name', 'draw:fill-image-ref-point', 'draw:fill-image-ref-point-x', 'draw:fill-image-ref-point-y', 'draw:fill-image-width', 'draw:fit-to-contour', 'draw:fit-to-size', 'draw:frame-display-border', 'draw:frame-display-scrollbar', 'draw:frame-margin-horizontal', 'draw:frame-margin-vertical', 'draw:gamma', 'draw:gradient-step-count', 'draw:green', 'draw:guide-distance', 'draw:guide-overhang', 'draw:image-opacity', 'draw:line-distance', 'draw:luminance', 'draw:marker-end', 'draw:marker-end-center', 'draw:marker-end-width', 'draw:marker-start', 'draw:marker-start-center', 'draw:marker-start-width', 'draw:measure-align', 'draw:measure-vertical-align', 'draw:ole-draw-aspect', 'draw:opacity', 'draw:opacity-name', 'draw:parallel', 'draw:placing', 'draw:red', 'draw:secondary-fill-color', 'draw:shadow', 'draw:shadow-color', 'draw:shadow-offset-x', 'draw:shadow-offset-y', 'draw:shadow-opacity', 'draw:show-unit', 'draw:start-guide', 'draw:start-line-spacing-horizontal', 'draw:start-line-spacing-vertical', 'draw:stroke', 'draw:stroke-dash', 'draw:stroke-dash-names', 'draw:stroke-linejoin', 'draw:symbol-color', 'draw:textarea-horizontal-align', 'draw:textarea-vertical-align', 'draw:tile-repeat-offset', 'draw:unit', 'draw:visible-area-height', 'draw:visible-area-left', 'draw:visible-area-top', 'draw:visible-area-width', 'draw:wrap-influence-on-position', 'fo:background-color', 'fo:border', 'fo:border-bottom', 'fo:border-left', 'fo:border-right', 'fo:border-top', 'fo:clip', 'fo:margin', 'fo:margin-bottom', 'fo:margin-left', 'fo:margin-right', 'fo:margin-top', 'fo:max-height', 'fo:max-width', 'fo:min-height', 'fo:min-width', 'fo:padding', 'fo:padding-bottom', 'fo:padding-left', 'fo:padding-right', 'fo:padding-top', 'fo:wrap-option', 'style:background-transparency', 'style:border-line-width', 'style:border-line-width-bottom', 'style:border-line-width-left', 'style:border-line-width-right', 'style:border-line-width-top', 'style:editable', 'style:flow-with-text', 'style:horizontal-pos', 'style:horizontal-rel', 'style:mirror', 'style:number-wrapped-paragraphs', 'style:overflow-behavior', 'style:print-content', 'style:protect', 'style:rel-height', 'style:rel-width', 'style:repeat', 'style:run-through', 'style:shadow', 'style:shrink-to-fit', 'style:vertical-pos', 'style:vertical-rel', 'style:wrap', 'style:wrap-contour', 'style:wrap-contour-mode', 'style:wrap-dynamic-threshold', 'style:writing-mode', 'svg:fill-rule', 'svg:height', 'svg:stroke-color', 'svg:stroke-linecap', 'svg:stroke-opacity', 'svg:stroke-width', 'svg:width', 'svg:x', 'svg:y', 'text:anchor-page-number', 'text:anchor-type', 'text:animation', 'text:animation-delay', 'text:animation-direction', 'text:animation-repeat', 'text:animation-start-inside', 'text:animation-steps', 'text:animation-stop-inside')),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon')),
+    frozenset(('draw:style-name', 'presentation:presentation-page-layout-name', 'presentation:use-date-time-name', 'presentation:use-footer-name', 'presentation:use-header-name', 'style:page-layout-name')),
+    frozenset(('style:page-layout-name',)),
+    frozenset(('style:background-image',)),
+    frozenset(('fo:background-color', 'fo:border', 'fo:border-bottom', 'fo:border-left', 'fo:border-right', 'fo:border-top', 'fo:margin', 'fo:margin-bottom', 'fo:margin-left', 'fo:margin-right', 'fo:margin-top', 'fo:min-height', 'fo:padding', 'fo:padding-bottom', 'fo:padding-left', 'fo:padding-right', 'fo:padding-top', 'style:border-line-width', 'style:border-line-width-bottom', 'style:border-line-width-left', 'style:border-line-width-right', 'style:border-line-width-top', 'style:dynamic-spacing', 'style:shadow', 'svg:height')),
+    frozenset(('listtab', 'nothing', 'space')),
+    frozenset(('fo:margin-left', 'fo:text-indent', 'text:label-followed-by', 'text:list-tab-stop-position')),
+    frozenset(('text:label-followed-by',)),
+    frozenset(('center', 'end', 'justify', 'left', 'right', 'start')),
+    frozenset(('label-alignment', 'label-width-and-position')),
+    frozenset(('style:list-level-label-alignment',)),
+    frozenset(('fo:height', 'fo:text-align', 'fo:width', 'style:font-name', 'style:vertical-pos', 'style:vertical-rel', 'svg:y', 'text:list-level-position-and-space-mode', 'text:min-label-distance', 'text:min-label-width', 'text:space-before')),
+    frozenset(('style:apply-style-name', 'style:base-cell-address', 'style:condition')),
+    frozenset(('style:apply-style-name', 'style:condition')),
+    frozenset(('anim:animate', 'anim:animateColor', 'anim:animateMotion', 'anim:animateTransform', 'anim:audio', 'anim:command', 'anim:iterate', 'anim:par', 'anim:seq', 'anim:set', 'anim:transitionFilter', 'dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:layer-set', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:forms', 'presentation:notes', 'style:footer', 'style:footer-left', 'style:header', 'style:header-left')),
+    frozenset(('draw:style-name', 'style:display-name', 'style:name', 'style:next-style-name', 'style:page-layout-name')),
+    frozenset(('style:name', 'style:page-layout-name')),
+    frozenset(('all', 'left', 'mirrored', 'right')),
+    frozenset(('style:name', 'style:page-usage')),
+    frozenset(('both', 'line', 'none')),
+    frozenset(('landscape', 'portrait')),
+    frozenset(('both', 'horizontal', 'none', 'vertical')),
+    frozenset(('style:background-image', 'style:columns', 'style:footnote-sep')),
+    frozenset(('fo:background-color', 'fo:border', 'fo:border-bottom', 'fo:border-left', 'fo:border-right', 'fo:border-top', 'fo:margin', 'fo:margin-bottom', 'fo:margin-left', 'fo:margin-right', 'fo:margin-top', 'fo:padding', 'fo:padding-bottom', 'fo:padding-left', 'fo:padding-right', 'fo:padding-top', 'fo:page-height', 'fo:page-width', 'style:border-line-width', 'style:border-line-width-bottom', 'style:border-line-width-left', 'style:border-line-width-right', 'style:border-line-width-top', 'style:first-page-number', 'style:footnote-max-height', 'style:layout-grid-base-height', 'style:layout-grid-base-width', 'style:layout-grid-color', 'style:layout-grid-display', 'style:layout-grid-lines', 'style:layout-grid-mode', 'style:layout-grid-print', 'style:layout-grid-ruby-below', 'style:layout-grid-ruby-height', 'style:layout-grid-snap-to', 'style:layout-grid-standard-mode', 'style:num-format', 'style:num-letter-sync', 'style:num-prefix', 'style:num-suffix', 'style:paper-tray-name', 'style:print', 'style:print-orientation', 'style:print-page-order', 'style:register-truth-ref-style-name', 'style:scale-to', 'style:scale-to-pages', 'style:shadow', 'style:table-centering', 'style:writing-mode')),
+    frozenset(('auto', 'column', 'page')),
+    frozenset(('auto', 'page')),
+    frozenset(('always', 'auto')),
+    frozenset(('center', 'justify', 'start')),
+    frozenset(('normal', 'strict')),
+    frozenset(('hanging', 'simple')),
+    frozenset(('ideograph-alpha', 'none')),
+    frozenset(('auto', 'baseline', 'bottom', 'middle', 'top')),
+    frozenset(('style:background-image', 'style:drop-cap', 'style:tab-stops')),
+    frozenset(('fo:background-color', 'fo:border', 'fo:border-bottom', 'fo:border-left', 'fo:border-right', 'fo:border-top', 'fo:break-after', 'fo:break-before', 'fo:hyphenation-keep', 'fo:hyphenation-ladder-count', 'fo:keep-together', 'fo:keep-with-next', 'fo:line-height', 'fo:margin', 'fo:margin-bottom', 'fo:margin-left', 'fo:margin-right', 'fo:margin-top', 'fo:orphans', 'fo:padding', 'fo:padding-bottom', 'fo:padding-left', 'fo:padding-right', 'fo:padding-top', 'fo:text-align', 'fo:text-align-last', 'fo:text-indent', 'fo:widows', 'style:auto-text-indent', 'style:background-transparency', 'style:border-line-width', 'style:border-line-width-bottom', 'style:border-line-width-left', 'style:border-line-width-right', 'style:border-line-width-top', 'style:font-independent-line-spacing', 'style:join-border', 'style:justify-single-word', 'style:line-break', 'style:line-height-at-least', 'style:line-spacing', 'style:page-number', 'style:punctuation-wrap', 'style:register-true', 'style:shadow', 'style:snap-to-layout-grid', 'style:tab-stop-distance', 'style:text-autospace', 'style:vertical-align', 'style:writing-mode', 'style:writing-mode-automatic', 'text:line-number', 'text:number-lines')),
+    frozenset(('presentation:placeholder',)),
+    frozenset(('style:display-name', 'style:name')),
+    frozenset(('text:p',)),
+    frozenset(('center', 'distribute-letter', 'distribute-space', 'left', 'right')),
+    frozenset(('style:ruby-align', 'style:ruby-position')),
+    frozenset(('style:background-image', 'style:columns', 'text:notes-configuration')),
+    frozenset(('fo:background-color', 'fo:margin-left', 'fo:margin-right', 'style:editable', 'style:protect', 'style:writing-mode', 'text:dont-balance-text-columns')),
+    frozenset(('style:chart-properties', 'style:drawing-page-properties', 'style:graphic-properties', 'style:map', 'style:paragraph-properties', 'style:ruby-properties', 'style:section-properties', 'style:table-cell-properties', 'style:table-column-properties', 'style:table-properties', 'style:table-row-properties', 'style:text-properties')),
+    frozenset(('style:auto-update', 'style:class', 'style:data-style-name', 'style:default-outline-level', 'style:display-name', 'style:family', 'style:list-level', 'style:list-style-name', 'style:master-page-name', 'style:name', 'style:next-style-name', 'style:parent-style-name', 'style:percentage-data-style-name')),
+    frozenset(('style:family', 'style:name')),
+    frozenset(('double', 'none', 'single')),
+    frozenset(('center', 'char', 'left', 'right')),
+    frozenset(('style:char', 'style:leader-color', 'style:leader-style', 'style:leader-text', 'style:leader-text-style', 'style:leader-type', 'style:leader-width', 'style:position', 'style:type')),
+    frozenset(('style:position',)),
+    frozenset(('style:tab-stop',)),
+    frozenset(('0', '0deg', '0grad', '0rad', 'auto')),
+    frozenset(('bottom', 'center', 'none', 'top')),
+    frozenset(('fix', 'value-type')),
+    frozenset(('automatic', 'bottom', 'middle', 'top')),
+    frozenset(('fo:background-color', 'fo:border', 'fo:border-bottom', 'fo:border-left', 'fo:border-right', 'fo:border-top', 'fo:padding', 'fo:padding-bottom', 'fo:padding-left', 'fo:padding-right', 'fo:padding-top', 'fo:wrap-option', 'style:border-line-width', 'style:border-line-width-bottom', 'style:border-line-width-left', 'style:border-line-width-right', 'style:border-line-width-top', 'style:cell-protect', 'style:decimal-places', 'style:diagonal-bl-tr', 'style:diagonal-bl-tr-widths', 'style:diagonal-tl-br', 'style:diagonal-tl-br-widths', 'style:direction', 'style:glyph-orientation-vertical', 'style:print-content', 'style:repeat-content', 'style:rotation-align', 'style:rotation-angle', 'style:shadow', 'style:shrink-to-fit', 'style:text-align-source', 'style:vertical-align', 'style:writing-mode')),
+    frozenset(('fo:break-after', 'fo:break-before', 'style:column-width', 'style:rel-column-width', 'style:use-optimal-column-width')),
+    frozenset(('center', 'left', 'margins', 'right')),
+    frozenset(('collapsing', 'separating')),
+    frozenset(('fo:background-color', 'fo:break-after', 'fo:break-before', 'fo:keep-with-next', 'fo:margin', 'fo:margin-bottom', 'fo:margin-left', 'fo:margin-right', 'fo:margin-top', 'style:may-break-between-rows', 'style:page-number', 'style:rel-width', 'style:shadow', 'style:width', 'style:writing-mode', 'table:align', 'table:border-model', 'table:display')),
+    frozenset(('fo:background-color', 'fo:break-after', 'fo:break-before', 'fo:keep-together', 'style:min-row-height', 'style:row-height', 'style:use-optimal-row-height')),
+    frozenset(('capitalize', 'lowercase', 'none', 'uppercase')),
+    frozenset(('embossed', 'engraved', 'none')),
+    frozenset(('asian', 'complex', 'ignore', 'latin')),
+    frozenset(('letters', 'lines', 'none')),
+    frozenset(('continuous', 'skip-white-space')),
+    frozenset(('fixed', 'line-height')),
+    frozenset(('none',)),
+    frozenset(('condition', 'none', 'true')),
+    frozenset(('fo:background-color', 'fo:color', 'fo:country', 'fo:font-family', 'fo:font-size', 'fo:font-style', 'fo:font-variant', 'fo:font-weight', 'fo:hyphenate', 'fo:hyphenation-push-char-count', 'fo:hyphenation-remain-char-count', 'fo:language', 'fo:letter-spacing', 'fo:script', 'fo:text-shadow', 'fo:text-transform', 'style:country-asian', 'style:country-complex', 'style:font-charset', 'style:font-charset-asian', 'style:font-charset-complex', 'style:font-family-asian', 'style:font-family-complex', 'style:font-family-generic', 'style:font-family-generic-asian', 'style:font-family-generic-complex', 'style:font-name', 'style:font-name-asian', 'style:font-name-complex', 'style:font-pitch', 'style:font-pitch-asian', 'style:font-pitch-complex', 'style:font-relief', 'style:font-size-asian', 'style:font-size-complex', 'style:font-size-rel', 'style:font-size-rel-asian', 'style:font-size-rel-complex', 'style:font-style-asian', 'style:font-style-complex', 'style:font-style-name', 'style:font-style-name-asian', 'style:font-style-name-complex', 'style:font-weight-asian', 'style:font-weight-complex', 'style:language-asian', 'style:language-complex', 'style:letter-kerning', 'style:rfc-language-tag', 'style:rfc-language-tag-asian', 'style:rfc-language-tag-complex', 'style:script-asian', 'style:script-complex', 'style:script-type', 'style:text-blinking', 'style:text-combine', 'style:text-combine-end-char', 'style:text-combine-start-char', 'style:text-emphasize', 'style:text-line-through-color', 'style:text-line-through-mode', 'style:text-line-through-style', 'style:text-line-through-text', 'style:text-line-through-text-style', 'style:text-line-through-type', 'style:text-line-through-width', 'style:text-outline', 'style:text-overline-color', 'style:text-overline-mode', 'style:text-overline-style', 'style:text-overline-type', 'style:text-overline-width', 'style:text-position', 'style:text-rotation-angle', 'style:text-rotation-scale', 'style:text-scale', 'style:text-underline-color', 'style:text-underline-mode', 'style:text-underline-style', 'style:text-underline-type', 'style:text-underline-width', 'style:use-window-font-color', 'text:condition', 'text:display')),
+    frozenset(('table:style-name',)),
+    frozenset(('table:paragraph-style-name', 'table:style-name')),
+    frozenset(('table:iteration', 'table:null-date')),
+    frozenset(('table:automatic-find-labels', 'table:case-sensitive', 'table:null-year', 'table:precision-as-shown', 'table:search-criteria-must-apply-to-whole-cell', 'table:use-regular-expressions', 'table:use-wildcards')),
+    frozenset(('table:column', 'table:row', 'table:table')),
+    frozenset(('accepted', 'pending', 'rejected')),
+    frozenset(('office:change-info', 'table:cell-address', 'table:deletions', 'table:dependencies', 'table:previous')),
+    frozenset(('table:acceptance-state', 'table:id', 'table:rejecting-change-id')),
+    frozenset(('table:id',)),
+    frozenset(('table:cell-address', 'table:change-track-table-cell')),
+    frozenset(('table:filter-name', 'table:filter-options', 'table:last-column-spanned', 'table:last-row-spanned', 'table:name', 'table:refresh-delay', 'xlink:actuate', 'xlink:href', 'xlink:type')),
+    frozenset(('table:last-column-spanned', 'table:last-row-spanned', 'table:name', 'xlink:href', 'xlink:type')),
+    frozenset(('boolean', 'currency', 'date', 'float', 'percentage', 'string', 'time')),
+    frozenset(('office:boolean-value', 'office:currency', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'office:value-type', 'table:cell-address', 'table:formula', 'table:matrix-covered', 'table:number-matrix-columns-spanned', 'table:number-matrix-rows-spanned')),
+    frozenset(('both', 'column', 'none', 'row')),
+    frozenset(('table:function', 'table:link-to-source-data', 'table:source-cell-range-addresses', 'table:target-cell-address', 'table:use-labels')),
+    frozenset(('table:function', 'table:source-cell-range-addresses', 'table:target-cell-address')),
+    frozenset(('none', 'sort-ascending', 'unsorted')),
+    frozenset(('office:event-listeners', 'table:error-macro', 'table:error-message', 'table:help-message')),
+    frozenset(('table:allow-empty-cell', 'table:base-cell-address', 'table:condition', 'table:display-list', 'table:name')),
+    frozenset(('table:name',)),
+    frozenset(('table:content-validation',)),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:annotation', 'table:cell-range-source', 'table:detective', 'table:table', 'text:alphabetical-index', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:h', 'text:illustration-index', 'text:list', 'text:numbered-paragraph', 'text:object-index', 'text:p', 'text:section', 'text:soft-page-break', 'text:table-index', 'text:table-of-content', 'text:user-index')),
+    frozenset(('office:boolean-value', 'office:currency', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'office:value-type', 'table:content-validation-name', 'table:formula', 'table:number-columns-repeated', 'table:protect', 'table:protected', 'table:style-name', 'xhtml:about', 'xhtml:content', 'xhtml:datatype', 'xhtml:property', 'xml:id')),
+    frozenset(('table:insertion-cut-off', 'table:movement-cut-off')),
+    frozenset(('from-bottom', 'from-top')),
+    frozenset(('table:data-field', 'table:display-member-mode', 'table:enabled', 'table:member-count')),
+    frozenset(('column', 'data', 'hidden', 'page', 'row')),
+    frozenset(('table:data-pilot-field-reference', 'table:data-pilot-groups', 'table:data-pilot-level')),
+    frozenset(('table:function', 'table:is-data-layout-field', 'table:orientation', 'table:selected-page', 'table:source-field-name', 'table:used-hierarchy')),
+    frozenset(('table:orientation', 'table:source-field-name')),
+    frozenset(('named', 'next', 'previous')),
+    frozenset(('column-percentage', 'index', 'member-difference', 'member-percentage', 'member-percentage-difference', 'none', 'row-percentage', 'running-total', 'total-percentage')),
+    frozenset(('table:field-name', 'table:member-name', 'table:member-type', 'table:type')),
+    frozenset(('table:field-name', 'table:member-type', 'table:type')),
+    frozenset(('table:data-pilot-group-member',)),
+    frozenset(('days', 'hours', 'minutes', 'months', 'quarters', 'seconds', 'years')),
+    frozenset(('table:data-pilot-group',)),
+    frozenset(('table:date-end', 'table:date-start', 'table:end', 'table:grouped-by', 'table:source-field-name', 'table:start', 'table:step')),
+    frozenset(('table:grouped-by', 'table:source-field-name', 'table:step')),
+    frozenset(('outline-subtotals-bottom', 'outline-subtotals-top', 'tabular-layout')),
+    frozenset(('table:add-empty-lines', 'table:layout-mode')),
+    frozenset(('table:data-pilot-display-info', 'table:data-pilot-layout-info', 'table:data-pilot-members', 'table:data-pilot-sort-info', 'table:data-pilot-subtotals')),
+    frozenset(('table:show-empty',)),
+    frozenset(('table:display', 'table:name', 'table:show-details')),
+    frozenset(('table:data-pilot-member',)),
+    frozenset(('ascending', 'descending')),
+    frozenset(('data', 'manual', 'name', 'none')),
+    frozenset(('table:data-field', 'table:order', 'table:sort-mode')),
+    frozenset(('table:order', 'table:sort-mode')),
+    frozenset(('table:function',)),
+    frozenset(('table:data-pilot-subtotal',)),
+    frozenset(('table:data-pilot-field', 'table:database-source-query', 'table:database-source-sql', 'table:database-source-table', 'table:source-cell-range', 'table:source-service')),
+    frozenset(('table:application-data', 'table:buttons', 'table:drill-down-on-double-click', 'table:grand-total', 'table:identify-categories', 'table:ignore-empty-rows', 'table:name', 'table:show-filter-button', 'table:target-range-address')),
+    frozenset(('table:name', 'table:target-range-address')),
+    frozenset(('table:data-pilot-table',)),
+    frozenset(('column', 'row')),
+    frozenset(('table:database-source-query', 'table:database-source-sql', 'table:database-source-table', 'table:filter', 'table:sort', 'table:subtotal-rules')),
+    frozenset(('table:contains-header', 'table:display-filter-buttons', 'table:has-persistent-data', 'table:is-selection', 'table:name', 'table:on-update-keep-size', 'table:on-update-keep-styles', 'table:orientation', 'table:refresh-delay', 'table:target-range-address')),
+    frozenset(('table:target-range-address',)),
+    frozenset(('table:database-range',)),
+    frozenset(('table:database-name', 'table:query-name')),
+    frozenset(('table:database-name', 'table:parse-sql-statement', 'table:sql-statement')),
+    frozenset(('table:database-name', 'table:sql-statement')),
+    frozenset(('table:database-name', 'table:database-table-name')),
+    frozenset(('office:dde-source', 'table:table')),
+    frozenset(('table:dde-link',)),
+    frozenset(('column', 'row', 'table')),
+    frozenset(('office:change-info', 'table:cut-offs', 'table:deletions', 'table:dependencies')),
+    frozenset(('table:acceptance-state', 'table:id', 'table:multi-deletion-spanned', 'table:position', 'table:rejecting-change-id', 'table:table', 'table:type')),
+    frozenset(('table:id', 'table:position', 'table:type')),
+    frozenset(('table:cell-content-deletion', 'table:change-deletion')),
+    frozenset(('table:dependency',)),
+    frozenset(('table:highlighted-range', 'table:operation')),
+    frozenset(('table:execute',)),
+    frozenset(('information', 'stop', 'warning')),
+    frozenset(('table:display', 'table:message-type', 'table:title')),
+    frozenset(('cell-range', 'self')),
+    frozenset(('table:filter-and', 'table:filter-condition', 'table:filter-or')),
+    frozenset(('table:condition-source', 'table:condition-source-range-address', 'table:display-duplicates', 'table:target-range-address')),
+    frozenset(('table:filter-condition', 'table:filter-or')),
+    frozenset(('number', 'text')),
+    frozenset(('table:filter-set-item',)),
+    frozenset(('table:case-sensitive', 'table:data-type', 'table:field-number', 'table:operator', 'table:value')),
+    frozenset(('table:field-number', 'table:operator', 'table:value')),
+    frozenset(('table:filter-and', 'table:filter-condition')),
+    frozenset(('table:value',)),
+    frozenset(('table:display', 'table:title')),
+    frozenset(('from-another-table', 'from-same-table', 'to-another-table')),
+    frozenset(('table:cell-range-address', 'table:contains-error', 'table:direction', 'table:marked-invalid')),
+    frozenset(('office:change-info', 'table:deletions', 'table:dependencies')),
+    frozenset(('table:acceptance-state', 'table:count', 'table:id', 'table:position', 'table:rejecting-change-id', 'table:table', 'table:type')),
+    frozenset(('table:id', 'table:position')),
+    frozenset(('disable', 'enable')),
+    frozenset(('table:maximum-difference', 'table:status', 'table:steps')),
+    frozenset(('table:data-cell-range-address', 'table:label-cell-range-address', 'table:orientation')),
+    frozenset(('table:label-range',)),
+    frozenset(('office:change-info', 'table:deletions', 'table:dependencies', 'table:source-range-address', 'table:target-range-address')),
+    frozenset(('table:end-position', 'table:position', 'table:start-position')),
+    frozenset(('table:base-cell-address', 'table:expression', 'table:name')),
+    frozenset(('table:expression', 'table:name')),
+    frozenset(('table:named-expression', 'table:named-range')),
+    frozenset(('table:base-cell-address', 'table:cell-range-address', 'table:name', 'table:range-usable-as')),
+    frozenset(('table:cell-range-address', 'table:name')),
+    frozenset(('date',)),
+    frozenset(('table:date-value', 'table:value-type')),
+    frozenset(('remove-dependents', 'remove-precedents', 'trace-dependents', 'trace-errors', 'trace-precedents')),
+    frozenset(('table:index', 'table:name')),
+    frozenset(('table:change-track-table-cell',)),
+    frozenset(('table:border-color', 'table:comment', 'table:copy-back', 'table:copy-formulas', 'table:copy-styles', 'table:display-border', 'table:is-active', 'table:protected', 'table:scenario-ranges')),
+    frozenset(('table:is-active', 'table:scenario-ranges')),
+    frozenset(('alpha-numeric', 'double', 'integer')),
+    frozenset(('table:sort-by',)),
+    frozenset(('table:algorithm', 'table:bind-styles-to-content', 'table:case-sensitive', 'table:country', 'table:embedded-number-behavior', 'table:language', 'table:rfc-language-tag', 'table:script', 'table:target-range-address')),
+    frozenset(('table:data-type', 'table:field-number', 'table:order')),
+    frozenset(('table:field-number',)),
+    frozenset(('table:data-type', 'table:order')),
+    frozenset(('table:filter',)),
+    frozenset(('table:cell-range-address',)),
+    frozenset(('table:column', 'table:end-column', 'table:end-row', 'table:end-table', 'table:row', 'table:start-column', 'table:start-row', 'table:start-table', 'table:table')),
+    frozenset(('table:name', 'table:object-name', 'table:password', 'table:source-name', 'table:user-name')),
+    frozenset(('table:name', 'table:object-name', 'table:source-name')),
+    frozenset(('table:field-number', 'table:function')),
+    frozenset(('table:subtotal-field',)),
+    frozenset(('table:group-by-field-number',)),
+    frozenset(('table:sort-groups', 'table:subtotal-rule')),
+    frozenset(('table:bind-styles-to-content', 'table:case-sensitive', 'table:page-breaks-on-group-change')),
+    frozenset(('office:dde-source', 'office:forms', 'table:desc', 'table:named-expressions', 'table:scenario', 'table:shapes', 'table:table-column', 'table:table-column-group', 'table:table-columns', 'table:table-header-columns', 'table:table-header-rows', 'table:table-row', 'table:table-row-group', 'table:table-rows', 'table:table-source', 'table:title', 'text:soft-page-break')),
+    frozenset(('table:is-sub-table', 'table:name', 'table:print', 'table:print-ranges', 'table:protected', 'table:protection-key', 'table:protection-key-digest-algorithm', 'table:style-name', 'table:template-name', 'table:use-banding-columns-styles', 'table:use-banding-rows-styles', 'table:use-first-column-styles', 'table:use-first-row-styles', 'table:use-last-column-styles', 'table:use-last-row-styles', 'xml:id')),
+    frozenset(('office:boolean-value', 'office:currency', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'office:value-type', 'table:content-validation-name', 'table:formula', 'table:number-columns-repeated', 'table:number-columns-spanned', 'table:number-matrix-columns-spanned', 'table:number-matrix-rows-spanned', 'table:number-rows-spanned', 'table:protect', 'table:protected', 'table:style-name', 'xhtml:about', 'xhtml:content', 'xhtml:datatype', 'xhtml:property', 'xml:id')),
+    frozenset(('collapse', 'filter', 'visible')),
+    frozenset(('table:default-cell-style-name', 'table:number-columns-repeated', 'table:style-name', 'table:visibility', 'xml:id')),
+    frozenset(('table:table-column', 'table:table-column-group', 'table:table-columns', 'table:table-header-columns')),
+    frozenset(('table:display',)),
+    frozenset(('table:table-column',)),
+    frozenset(('table:table-row', 'text:soft-page-break')),
+    frozenset(('table:covered-table-cell', 'table:table-cell')),
+    frozenset(('table:default-cell-style-name', 'table:number-rows-repeated', 'table:style-name', 'table:visibility', 'xml:id')),
+    frozenset(('table:table-header-rows', 'table:table-row', 'table:table-row-group', 'table:table-rows', 'text:soft-page-break')),
+    frozenset(('copy-all', 'copy-results-only')),
+    frozenset(('table:filter-name', 'table:filter-options', 'table:mode', 'table:refresh-delay', 'table:table-name', 'xlink:actuate', 'xlink:href', 'xlink:type')),
+    frozenset(('table:background', 'table:body', 'table:even-columns', 'table:even-rows', 'table:first-column', 'table:first-row', 'table:last-column', 'table:last-row', 'table:odd-columns', 'table:odd-rows')),
+    frozenset(('table:first-row-end-column', 'table:first-row-start-column', 'table:last-row-end-column', 'table:last-row-start-column', 'table:name')),
+    frozenset(('table:cell-content-change', 'table:deletion', 'table:insertion', 'table:movement')),
+    frozenset(('table:track-changes',)),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:annotation', 'office:annotation-end', 'office:event-listeners', 'presentation:date-time', 'presentation:footer', 'presentation:header', 'text:alphabetical-index-mark', 'text:alphabetical-index-mark-end', 'text:alphabetical-index-mark-start', 'text:author-initials', 'text:author-name', 'text:bibliography-mark', 'text:bookmark', 'text:bookmark-end', 'text:bookmark-ref', 'text:bookmark-start', 'text:change', 'text:change-end', 'text:change-start', 'text:chapter', 'text:character-count', 'text:conditional-text', 'text:creation-date', 'text:creation-time', 'text:creator', 'text:database-display', 'text:database-name', 'text:database-next', 'text:database-row-number', 'text:database-row-select', 'text:date', 'text:dde-connection', 'text:description', 'text:editing-cycles', 'text:editing-duration', 'text:execute-macro', 'text:expression', 'text:file-name', 'text:hidden-paragraph', 'text:hidden-text', 'text:image-count', 'text:initial-creator', 'text:keywords', 'text:line-break', 'text:measure', 'text:meta', 'text:meta-field', 'text:modification-date', 'text:modification-time', 'text:note', 'text:note-ref', 'text:object-count', 'text:page-continuation', 'text:page-count', 'text:page-number', 'text:page-variable-get', 'text:page-variable-set', 'text:paragraph-count', 'text:placeholder', 'text:print-date', 'text:print-time', 'text:printed-by', 'text:reference-mark', 'text:reference-mark-end', 'text:reference-mark-start', 'text:reference-ref', 'text:ruby', 'text:s', 'text:script', 'text:sender-city', 'text:sender-company', 'text:sender-country', 'text:sender-email', 'text:sender-fax', 'text:sender-firstname', 'text:sender-initials', 'text:sender-lastname', 'text:sender-phone-private', 'text:sender-phone-work', 'text:sender-position', 'text:sender-postal-code', 'text:sender-state-or-province', 'text:sender-street', 'text:sender-title', 'text:sequence', 'text:sequence-ref', 'text:sheet-name', 'text:soft-page-break', 'text:span', 'text:subject', 'text:tab', 'text:table-count', 'text:table-formula', 'text:template-name', 'text:text-input', 'text:time', 'text:title', 'text:toc-mark', 'text:toc-mark-end', 'text:toc-mark-start', 'text:user-defined', 'text:user-field-get', 'text:user-field-input', 'text:user-index-mark', 'text:user-index-mark-end', 'text:user-index-mark-start', 'text:variable-get', 'text:variable-input', 'text:variable-set', 'text:word-count')),
+    frozenset(('office:name', 'office:target-frame-name', 'office:title', 'text:style-name', 'text:visited-style-name', 'xlink:actuate', 'xlink:href', 'xlink:show', 'xlink:type')),
+    frozenset(('text:alphabetical-index-source', 'text:index-body')),
+    frozenset(('text:name', 'text:protected', 'text:protection-key', 'text:protection-key-digest-algorithm', 'text:style-name', 'xml:id')),
+    frozenset(('text:name',)),
+    frozenset(('1', '2', '3', 'separator')),
+    frozenset(('text:index-entry-chapter', 'text:index-entry-page-number', 'text:index-entry-span', 'text:index-entry-tab-stop', 'text:index-entry-text')),
+    frozenset(('text:outline-level', 'text:style-name')),
+    frozenset(('text:key1', 'text:key1-phonetic', 'text:key2', 'text:key2-phonetic', 'text:main-entry', 'text:string-value', 'text:string-value-phonetic')),
+    frozenset(('text:string-value',)),
+    frozenset(('text:id',)),
+    frozenset(('text:id', 'text:key1', 'text:key1-phonetic', 'text:key2', 'text:key2-phonetic', 'text:main-entry', 'text:string-value-phonetic')),
+    frozenset(('chapter', 'document')),
+    frozenset(('text:alphabetical-index-entry-template', 'text:index-title-template')),
+    frozenset(('fo:country', 'fo:language', 'fo:script', 'style:rfc-language-tag', 'text:alphabetical-separators', 'text:capitalize-entries', 'text:combine-entries', 'text:combine-entries-with-dash', 'text:combine-entries-with-pp', 'text:comma-separated', 'text:ignore-case', 'text:index-scope', 'text:main-entry-style-name', 'text:relative-tab-stop-position', 'text:sort-algorithm', 'text:use-keys-as-entries')),
+    frozenset(('text:fixed',)),
+    frozenset(('text:bibliography-source', 'text:index-body')),
+    frozenset(('text:sort-key',)),
+    frozenset(('fo:country', 'fo:language', 'fo:script', 'style:rfc-language-tag', 'text:numbered-entries', 'text:prefix', 'text:sort-algorithm', 'text:sort-by-position', 'text:suffix')),
+    frozenset(('article', 'book', 'booklet', 'conference', 'custom1', 'custom2', 'custom3', 'custom4', 'custom5', 'email', 'inbook', 'incollection', 'inproceedings', 'journal', 'manual', 'mastersthesis', 'misc', 'phdthesis', 'proceedings', 'techreport', 'unpublished', 'www')),
+    frozenset(('text:index-entry-bibliography', 'text:index-entry-span', 'text:index-entry-tab-stop')),
+    frozenset(('text:bibliography-type', 'text:style-name')),
+    frozenset(('text:address', 'text:annote', 'text:author', 'text:bibliography-type', 'text:booktitle', 'text:chapter', 'text:custom1', 'text:custom2', 'text:custom3', 'text:custom4', 'text:custom5', 'text:edition', 'text:editor', 'text:howpublished', 'text:identifier', 'text:institution', 'text:isbn', 'text:issn', 'text:journal', 'text:month', 'text:note', 'text:number', 'text:organizations', 'text:pages', 'text:publisher', 'text:report-type', 'text:school', 'text:series', 'text:title', 'text:url', 'text:volume', 'text:year')),
+    frozenset(('text:bibliography-type',)),
+    frozenset(('text:bibliography-entry-template', 'text:index-title-template')),
+    frozenset(('text:name', 'xml:id')),
+    frozenset(('chapter', 'direction', 'number', 'number-all-superior', 'number-no-superior', 'page', 'text')),
+    frozenset(('text:ref-name', 'text:reference-format')),
+    frozenset(('text:name', 'xhtml:about', 'xhtml:content', 'xhtml:datatype', 'xhtml:property', 'xml:id')),
+    frozenset(('text:change-id',)),
+    frozenset(('text:deletion', 'text:format-change', 'text:insertion')),
+    frozenset(('text:id', 'xml:id')),
+    frozenset(('name', 'number', 'number-and-name', 'plain-number', 'plain-number-and-name')),
+    frozenset(('text:display', 'text:outline-level')),
+    frozenset(('style:num-format', 'style:num-letter-sync')),
+    frozenset(('text:condition', 'text:current-value', 'text:string-value-if-false', 'text:string-value-if-true')),
+    frozenset(('text:condition', 'text:string-value-if-false', 'text:string-value-if-true')),
+    frozenset(('style:data-style-name', 'text:date-value', 'text:fixed')),
+    frozenset(('style:data-style-name', 'text:fixed', 'text:time-value')),
+    frozenset(('command', 'query', 'table')),
+    frozenset(('form:connection-resource',)),
+    frozenset(('style:data-style-name', 'text:column-name', 'text:database-name', 'text:table-name', 'text:table-type')),
+    frozenset(('text:column-name', 'text:table-name')),
+    frozenset(('text:database-name', 'text:table-name', 'text:table-type')),
+    frozenset(('text:table-name',)),
+    frozenset(('text:condition', 'text:database-name', 'text:table-name', 'text:table-type')),
+    frozenset(('style:num-format', 'style:num-letter-sync', 'text:database-name', 'text:table-name', 'text:table-type', 'text:value')),
+    frozenset(('text:condition', 'text:database-name', 'text:row-number', 'text:table-name', 'text:table-type')),
+    frozenset(('style:data-style-name', 'text:date-adjust', 'text:date-value', 'text:fixed')),
+    frozenset(('text:connection-name',)),
+    frozenset(('office:automatic-update', 'office:dde-application', 'office:dde-item', 'office:dde-topic', 'office:name')),
+    frozenset(('office:dde-application', 'office:dde-item', 'office:dde-topic', 'office:name')),
+    frozenset(('text:dde-connection-decl',)),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:change-info', 'table:table', 'text:alphabetical-index', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:h', 'text:illustration-index', 'text:list', 'text:numbered-paragraph', 'text:object-index', 'text:p', 'text:section', 'text:soft-page-break', 'text:table-index', 'text:table-of-content', 'text:user-index')),
+    frozenset(('style:data-style-name', 'text:duration', 'text:fixed')),
+    frozenset(('office:event-listeners',)),
+    frozenset(('formula', 'value')),
+    frozenset(('office:boolean-value', 'office:currency', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'office:value-type', 'style:data-style-name', 'text:display', 'text:formula')),
+    frozenset(('full', 'name', 'name-and-extension', 'path')),
+    frozenset(('text:display', 'text:fixed')),
+    frozenset(('office:change-info',)),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:annotation', 'office:annotation-end', 'presentation:date-time', 'presentation:footer', 'presentation:header', 'text:a', 'text:alphabetical-index-mark', 'text:alphabetical-index-mark-end', 'text:alphabetical-index-mark-start', 'text:author-initials', 'text:author-name', 'text:bibliography-mark', 'text:bookmark', 'text:bookmark-end', 'text:bookmark-ref', 'text:bookmark-start', 'text:change', 'text:change-end', 'text:change-start', 'text:chapter', 'text:character-count', 'text:conditional-text', 'text:creation-date', 'text:creation-time', 'text:creator', 'text:database-display', 'text:database-name', 'text:database-next', 'text:database-row-number', 'text:database-row-select', 'text:date', 'text:dde-connection', 'text:description', 'text:editing-cycles', 'text:editing-duration', 'text:execute-macro', 'text:expression', 'text:file-name', 'text:hidden-paragraph', 'text:hidden-text', 'text:image-count', 'text:initial-creator', 'text:keywords', 'text:line-break', 'text:measure', 'text:meta', 'text:meta-field', 'text:modification-date', 'text:modification-time', 'text:note', 'text:note-ref', 'text:number', 'text:object-count', 'text:page-continuation', 'text:page-count', 'text:page-number', 'text:page-variable-get', 'text:page-variable-set', 'text:paragraph-count', 'text:placeholder', 'text:print-date', 'text:print-time', 'text:printed-by', 'text:reference-mark', 'text:reference-mark-end', 'text:reference-mark-start', 'text:reference-ref', 'text:ruby', 'text:s', 'text:script', 'text:sender-city', 'text:sender-company', 'text:sender-country', 'text:sender-email', 'text:sender-fax', 'text:sender-firstname', 'text:sender-initials', 'text:sender-lastname', 'text:sender-phone-private', 'text:sender-phone-work', 'text:sender-position', 'text:sender-postal-code', 'text:sender-state-or-province', 'text:sender-street', 'text:sender-title', 'text:sequence', 'text:sequence-ref', 'text:sheet-name', 'text:soft-page-break', 'text:span', 'text:subject', 'text:tab', 'text:table-count', 'text:table-formula', 'text:template-name', 'text:text-input', 'text:time', 'text:title', 'text:toc-mark', 'text:toc-mark-end', 'text:toc-mark-start', 'text:user-defined', 'text:user-field-get', 'text:user-field-input', 'text:user-index-mark', 'text:user-index-mark-end', 'text:user-index-mark-start', 'text:variable-get', 'text:variable-input', 'text:variable-set', 'text:word-count')),
+    frozenset(('text:class-names', 'text:cond-style-name', 'text:id', 'text:is-list-header', 'text:outline-level', 'text:restart-numbering', 'text:start-value', 'text:style-name', 'xhtml:about', 'xhtml:content', 'xhtml:datatype', 'xhtml:property', 'xml:id')),
+    frozenset(('text:outline-level',)),
+    frozenset(('text:condition', 'text:is-hidden')),
+    frozenset(('text:condition',)),
+    frozenset(('text:condition', 'text:is-hidden', 'text:string-value')),
+    frozenset(('text:condition', 'text:string-value')),
+    frozenset(('text:illustration-index-source', 'text:index-body')),
+    frozenset(('text:style-name',)),
+    frozenset(('caption', 'category-and-value', 'text')),
+    frozenset(('text:illustration-index-entry-template', 'text:index-title-template')),
+    frozenset(('text:caption-sequence-format', 'text:caption-sequence-name', 'text:index-scope', 'text:relative-tab-stop-position', 'text:use-caption')),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'table:table', 'text:alphabetical-index', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:h', 'text:illustration-index', 'text:index-title', 'text:list', 'text:numbered-paragraph', 'text:object-index', 'text:p', 'text:section', 'text:soft-page-break', 'text:table-index', 'text:table-of-content', 'text:user-index')),
+    frozenset(('address', 'annote', 'author', 'bibliography-type', 'booktitle', 'chapter', 'custom1', 'custom2', 'custom3', 'custom4', 'custom5', 'edition', 'editor', 'howpublished', 'identifier', 'institution', 'isbn', 'issn', 'journal', 'month', 'note', 'number', 'organizations', 'pages', 'publisher', 'report-type', 'school', 'series', 'title', 'url', 'volume', 'year')),
+    frozenset(('text:bibliography-data-field', 'text:style-name')),
+    frozenset(('text:bibliography-data-field',)),
+    frozenset(('text:display', 'text:outline-level', 'text:style-name')),
+    frozenset(('left', 'right')),
+    frozenset(('style:leader-char', 'style:position', 'style:type', 'text:style-name')),
+    frozenset(('style:type',)),
+    frozenset(('text:index-source-style',)),
+    frozenset(('inner', 'left', 'outer', 'right')),
+    frozenset(('text:linenumbering-separator',)),
+    frozenset(('style:num-format', 'style:num-letter-sync', 'text:count-empty-lines', 'text:count-in-text-boxes', 'text:increment', 'text:number-lines', 'text:number-position', 'text:offset', 'text:restart-on-page', 'text:style-name')),
+    frozenset(('text:increment',)),
+    frozenset(('text:list-header', 'text:list-item')),
+    frozenset(('text:continue-list', 'text:continue-numbering', 'text:style-name', 'xml:id')),
+    frozenset(('text:h', 'text:list', 'text:number', 'text:p', 'text:soft-page-break')),
+    frozenset(('xml:id',)),
+    frozenset(('text:start-value', 'text:style-override', 'xml:id')),
+    frozenset(('style:list-level-properties', 'style:text-properties')),
+    frozenset(('style:num-prefix', 'style:num-suffix', 'text:bullet-char', 'text:bullet-relative-size', 'text:level', 'text:style-name')),
+    frozenset(('text:bullet-char', 'text:level')),
+    frozenset(('office:binary-data', 'style:list-level-properties')),
+    frozenset(('text:level', 'xlink:actuate', 'xlink:href', 'xlink:show', 'xlink:type')),
+    frozenset(('text:level',)),
+    frozenset(('style:num-format', 'style:num-letter-sync', 'style:num-prefix', 'style:num-suffix', 'text:display-levels', 'text:level', 'text:start-value', 'text:style-name')),
+    frozenset(('text:list-level-style-bullet', 'text:list-level-style-image', 'text:list-level-style-number')),
+    frozenset(('style:display-name', 'style:name', 'text:consecutive-numbering')),
+    frozenset(('gap', 'unit', 'value')),
+    frozenset(('text:kind',)),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:annotation', 'office:annotation-end', 'presentation:date-time', 'presentation:footer', 'presentation:header', 'text:a', 'text:alphabetical-index-mark', 'text:alphabetical-index-mark-end', 'text:alphabetical-index-mark-start', 'text:author-initials', 'text:author-name', 'text:bibliography-mark', 'text:bookmark', 'text:bookmark-end', 'text:bookmark-ref', 'text:bookmark-start', 'text:change', 'text:change-end', 'text:change-start', 'text:chapter', 'text:character-count', 'text:conditional-text', 'text:creation-date', 'text:creation-time', 'text:creator', 'text:database-display', 'text:database-name', 'text:database-next', 'text:database-row-number', 'text:database-row-select', 'text:date', 'text:dde-connection', 'text:description', 'text:editing-cycles', 'text:editing-duration', 'text:execute-macro', 'text:expression', 'text:file-name', 'text:hidden-paragraph', 'text:hidden-text', 'text:image-count', 'text:initial-creator', 'text:keywords', 'text:line-break', 'text:measure', 'text:meta', 'text:meta-field', 'text:modification-date', 'text:modification-time', 'text:note', 'text:note-ref', 'text:object-count', 'text:page-continuation', 'text:page-count', 'text:page-number', 'text:page-variable-get', 'text:page-variable-set', 'text:paragraph-count', 'text:placeholder', 'text:print-date', 'text:print-time', 'text:printed-by', 'text:reference-mark', 'text:reference-mark-end', 'text:reference-mark-start', 'text:reference-ref', 'text:ruby', 'text:s', 'text:script', 'text:sender-city', 'text:sender-company', 'text:sender-country', 'text:sender-email', 'text:sender-fax', 'text:sender-firstname', 'text:sender-initials', 'text:sender-lastname', 'text:sender-phone-private', 'text:sender-phone-work', 'text:sender-position', 'text:sender-postal-code', 'text:sender-state-or-province', 'text:sender-street', 'text:sender-title', 'text:sequence', 'text:sequence-ref', 'text:sheet-name', 'text:soft-page-break', 'text:span', 'text:subject', 'text:tab', 'text:table-count', 'text:table-formula', 'text:template-name', 'text:text-input', 'text:time', 'text:title', 'text:toc-mark', 'text:toc-mark-end', 'text:toc-mark-start', 'text:user-defined', 'text:user-field-get', 'text:user-field-input', 'text:user-index-mark', 'text:user-index-mark-end', 'text:user-index-mark-start', 'text:variable-get', 'text:variable-input', 'text:variable-set', 'text:word-count')),
+    frozenset(('xhtml:about', 'xhtml:content', 'xhtml:datatype', 'xhtml:property', 'xml:id')),
+    frozenset(('style:data-style-name', 'xml:id')),
+    frozenset(('endnote', 'footnote')),
+    frozenset(('text:note-body', 'text:note-citation')),
+    frozenset(('text:id', 'text:note-class')),
+    frozenset(('text:note-class',)),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'table:table', 'text:alphabetical-index', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:h', 'text:illustration-index', 'text:list', 'text:numbered-paragraph', 'text:object-index', 'text:p', 'text:section', 'text:soft-page-break', 'text:table-index', 'text:table-of-content', 'text:user-index')),
+    frozenset(('text:label',)),
+    frozenset(('chapter', 'direction', 'page', 'text')),
+    frozenset(('text:note-class', 'text:ref-name', 'text:reference-format')),
+    frozenset(('document', 'page', 'section', 'text')),
+    frozenset(('chapter', 'document', 'page')),
+    frozenset(('text:note-continuation-notice-backward', 'text:note-continuation-notice-forward')),
+    frozenset(('style:num-format', 'style:num-letter-sync', 'style:num-prefix', 'style:num-suffix', 'text:citation-body-style-name', 'text:citation-style-name', 'text:default-style-name', 'text:footnotes-position', 'text:master-page-name', 'text:note-class', 'text:start-numbering-at', 'text:start-value')),
+    frozenset(('text:h', 'text:number', 'text:p')),
+    frozenset(('text:continue-numbering', 'text:level', 'text:list-id', 'text:start-value', 'text:style-name', 'xml:id')),
+    frozenset(('text:list-id',)),
+    frozenset(('text:index-body', 'text:object-index-source')),
+    frozenset(('text:index-title-template', 'text:object-index-entry-template')),
+    frozenset(('text:index-scope', 'text:relative-tab-stop-position', 'text:use-chart-objects', 'text:use-draw-objects', 'text:use-math-objects', 'text:use-other-objects', 'text:use-spreadsheet-objects')),
+    frozenset(('text:outline-level-style',)),
+    frozenset(('text:class-names', 'text:cond-style-name', 'text:id', 'text:style-name', 'xhtml:about', 'xhtml:content', 'xhtml:datatype', 'xhtml:property', 'xml:id')),
+    frozenset(('text:master-page-name',)),
+    frozenset(('next', 'previous')),
+    frozenset(('text:select-page', 'text:string-value')),
+    frozenset(('text:select-page',)),
+    frozenset(('current', 'next', 'previous')),
+    frozenset(('style:num-format', 'style:num-letter-sync', 'text:fixed', 'text:page-adjust', 'text:select-page')),
+    frozenset(('text:page',)),
+    frozenset(('text:active', 'text:page-adjust')),
+    frozenset(('image', 'object', 'table', 'text', 'text-box')),
+    frozenset(('text:description', 'text:placeholder-type')),
+    frozenset(('text:placeholder-type',)),
+    frozenset(('text:ruby-base', 'text:ruby-text')),
+    frozenset(('text:c',)),
+    frozenset(('script:language', 'xlink:href', 'xlink:type')),
+    frozenset(('dr3d:scene', 'draw:a', 'draw:caption', 'draw:circle', 'draw:connector', 'draw:control', 'draw:custom-shape', 'draw:ellipse', 'draw:frame', 'draw:g', 'draw:line', 'draw:measure', 'draw:page-thumbnail', 'draw:path', 'draw:polygon', 'draw:polyline', 'draw:rect', 'draw:regular-polygon', 'office:dde-source', 'table:table', 'text:alphabetical-index', 'text:bibliography', 'text:change', 'text:change-end', 'text:change-start', 'text:h', 'text:illustration-index', 'text:list', 'text:numbered-paragraph', 'text:object-index', 'text:p', 'text:section', 'text:section-source', 'text:soft-page-break', 'text:table-index', 'text:table-of-content', 'text:user-index')),
+    frozenset(('text:condition', 'text:display', 'text:name', 'text:protected', 'text:protection-key', 'text:protection-key-digest-algorithm', 'text:style-name', 'xml:id')),
+    frozenset(('text:filter-name', 'text:section-name', 'xlink:href', 'xlink:show', 'xlink:type')),
+    frozenset(('style:num-format', 'style:num-letter-sync', 'text:formula', 'text:name', 'text:ref-name')),
+    frozenset(('text:display-outline-level', 'text:name', 'text:separation-character')),
+    frozenset(('text:display-outline-level', 'text:name')),
+    frozenset(('text:sequence-decl',)),
+    frozenset(('caption', 'category-and-value', 'chapter', 'direction', 'page', 'text', 'value')),
+    frozenset(('text:key', 'text:sort-ascending')),
+    frozenset(('text:key',)),
+    frozenset(('text:class-names', 'text:style-name')),
+    frozenset(('text:tab-ref',)),
+    frozenset(('style:data-style-name', 'text:display', 'text:formula')),
+    frozenset(('text:index-body', 'text:table-index-source')),
+    frozenset(('text:index-title-template', 'text:table-index-entry-template')),
+    frozenset(('text:index-body', 'text:table-of-content-source')),
+    frozenset(('text:index-entry-chapter', 'text:index-entry-link-end', 'text:index-entry-link-start', 'text:index-entry-page-number', 'text:index-entry-span', 'text:index-entry-tab-stop', 'text:index-entry-text')),
+    frozenset(('text:index-source-styles', 'text:index-title-template', 'text:table-of-content-entry-template')),
+    frozenset(('text:index-scope', 'text:outline-level', 'text:relative-tab-stop-position', 'text:use-index-marks', 'text:use-index-source-styles', 'text:use-outline-level')),
+    frozenset(('area', 'full', 'name', 'name-and-extension', 'path', 'title')),
+    frozenset(('text:display',)),
+    frozenset(('text:description',)),
+    frozenset(('style:data-style-name', 'text:fixed', 'text:time-adjust', 'text:time-value')),
+    frozenset(('text:outline-level', 'text:string-value')),
+    frozenset(('text:id', 'text:outline-level')),
+    frozenset(('text:changed-region',)),
+    frozenset(('text:track-changes',)),
+    frozenset(('office:boolean-value', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'style:data-style-name', 'text:fixed', 'text:name')),
+    frozenset(('office:boolean-value', 'office:currency', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'office:value-type', 'text:formula', 'text:name')),
+    frozenset(('office:value-type', 'text:name')),
+    frozenset(('text:user-field-decl',)),
+    frozenset(('formula', 'none', 'value')),
+    frozenset(('style:data-style-name', 'text:display', 'text:name')),
+    frozenset(('style:data-style-name', 'text:description', 'text:name')),
+    frozenset(('text:index-body', 'text:user-index-source')),
+    frozenset(('text:index-name', 'text:outline-level', 'text:string-value')),
+    frozenset(('text:index-name', 'text:string-value')),
+    frozenset(('text:id', 'text:index-name', 'text:outline-level')),
+    frozenset(('text:id', 'text:index-name')),
+    frozenset(('text:index-source-styles', 'text:index-title-template', 'text:user-index-entry-template')),
+    frozenset(('text:copy-outline-levels', 'text:index-name', 'text:index-scope', 'text:relative-tab-stop-position', 'text:use-floating-frames', 'text:use-graphics', 'text:use-index-marks', 'text:use-index-source-styles', 'text:use-objects', 'text:use-tables')),
+    frozenset(('text:index-name',)),
+    frozenset(('text:variable-decl',)),
+    frozenset(('none', 'value')),
+    frozenset(('office:value-type', 'style:data-style-name', 'text:description', 'text:display', 'text:name')),
+    frozenset(('office:boolean-value', 'office:currency', 'office:date-value', 'office:string-value', 'office:time-value', 'office:value', 'office:value-type', 'style:data-style-name', 'text:display', 'text:formula', 'text:name')),
+]
+
+_NO_VALUES = {}
+
+# Element name: (child elements, attributes, required attributes, text allowed,
+# attribute values). A set of names that's None allows any name.
+ELEMENTS = {
+    'meta:auto-reload': (
+        _SETS[3],
+        _SETS[4],
+        _SETS[3],
+        False,
+        {'xlink:actuate': _SETS[0], 'xlink:show': _SETS[1], 'xlink:type': _SETS[2]},
+    ),
+    'meta:creation-date': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:date-string': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:document-statistic': (
+        _SETS[3],
+        _SETS[5],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'meta:editing-cycles': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:editing-duration': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:generator': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:hyperlink-behaviour': (
+        _SETS[3],
+        _SETS[7],
+        _SETS[3],
+        False,
+        {'xlink:show': _SETS[6]},
+    ),
+    'meta:initial-creator': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:keyword': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:print-date': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:printed-by': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'meta:template': (
+        _SETS[3],
+        _SETS[9],
+        _SETS[10],
+        False,
+        {'xlink:actuate': _SETS[8], 'xlink:type': _SETS[2]},
+    ),
+    'meta:user-defined': (
+        _SETS[3],
+        _SETS[12],
+        _SETS[13],
+        True,
+        {'meta:value-type': _SETS[11]},
+    ),
+    'number:am-pm': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'number:boolean': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'number:boolean-style': (
+        _SETS[16],
+        _SETS[17],
+        _SETS[18],
+        False,
+        {'number:transliteration-style': _SETS[14], 'style:volatile': _SETS[15]},
+    ),
+    'number:currency-style': (
+        _SETS[19],
+        _SETS[20],
+        _SETS[18],
+        False,
+        {'number:automatic-order': _SETS[15], 'number:transliteration-style': _SETS[14], 'style:volatile': _SETS[15]},
+    ),
+    'number:currency-symbol': (
+        _SETS[3],
+        _SETS[21],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'number:date-style': (
+        _SETS[23],
+        _SETS[24],
+        _SETS[18],
+        False,
+        {'number:automatic-order': _SETS[15], 'number:format-source': _SETS[22], 'number:transliteration-style': _SETS[14], 'style:volatile': _SETS[15]},
+    ),
+    'number:day': (
+        _SETS[3],
+        _SETS[26],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:day-of-week': (
+        _SETS[3],
+        _SETS[26],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:embedded-text': (
+        _SETS[3],
+        _SETS[27],
+        _SETS[27],
+        True,
+        _NO_VALUES,
+    ),
+    'number:era': (
+        _SETS[3],
+        _SETS[26],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:fraction': (
+        _SETS[3],
+        _SETS[28],
+        _SETS[3],
+        False,
+        {'number:grouping': _SETS[15]},
+    ),
+    'number:hours': (
+        _SETS[3],
+        _SETS[29],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:minutes': (
+        _SETS[3],
+        _SETS[29],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:month': (
+        _SETS[3],
+        _SETS[30],
+        _SETS[3],
+        False,
+        {'number:possessive-form': _SETS[15], 'number:style': _SETS[25], 'number:textual': _SETS[15]},
+    ),
+    'number:number': (
+        _SETS[31],
+        _SETS[32],
+        _SETS[3],
+        False,
+        {'number:grouping': _SETS[15]},
+    ),
+    'number:number-style': (
+        _SETS[33],
+        _SETS[17],
+        _SETS[18],
+        False,
+        {'number:transliteration-style': _SETS[14], 'style:volatile': _SETS[15]},
+    ),
+    'number:percentage-style': (
+        _SETS[34],
+        _SETS[17],
+        _SETS[18],
+        False,
+        {'number:transliteration-style': _SETS[14], 'style:volatile': _SETS[15]},
+    ),
+    'number:quarter': (
+        _SETS[3],
+        _SETS[26],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:scientific-number': (
+        _SETS[3],
+        _SETS[35],
+        _SETS[3],
+        False,
+        {'number:grouping': _SETS[15]},
+    ),
+    'number:seconds': (
+        _SETS[3],
+        _SETS[36],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'number:text': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'number:text-content': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'number:text-style': (
+        _SETS[37],
+        _SETS[17],
+        _SETS[18],
+        False,
+        {'number:transliteration-style': _SETS[14], 'style:volatile': _SETS[15]},
+    ),
+    'number:time-style': (
+        _SETS[38],
+        _SETS[39],
+        _SETS[18],
+        False,
+        {'number:format-source': _SETS[22], 'number:transliteration-style': _SETS[14], 'number:truncate-on-overflow': _SETS[15], 'style:volatile': _SETS[15]},
+    ),
+    'number:week-of-year': (
+        _SETS[3],
+        _SETS[40],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'number:year': (
+        _SETS[3],
+        _SETS[26],
+        _SETS[3],
+        False,
+        {'number:style': _SETS[25]},
+    ),
+    'office:annotation': (
+        _SETS[42],
+        _SETS[43],
+        _SETS[3],
+        False,
+        {'office:display': _SETS[15], 'table:table-background': _SETS[15], 'text:anchor-type': _SETS[41]},
+    ),
+    'office:annotation-end': (
+        _SETS[3],
+        _SETS[44],
+        _SETS[44],
+        False,
+        _NO_VALUES,
+    ),
+    'office:automatic-styles': (
+        _SETS[45],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:binary-data': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'office:body': (
+        _SETS[46],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:change-info': (
+        _SETS[47],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:chart': (
+        _SETS[48],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:database': (
+        _SETS[49],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:dde-source': (
+        _SETS[3],
+        _SETS[51],
+        _SETS[52],
+        False,
+        {'office:automatic-update': _SETS[15], 'office:conversion-mode': _SETS[50]},
+    ),
+    'office:document': (
+        _SETS[54],
+        _SETS[55],
+        _SETS[56],
+        False,
+        {'office:version': _SETS[53]},
+    ),
+    'office:document-content': (
+        _SETS[57],
+        _SETS[58],
+        _SETS[59],
+        False,
+        {'office:version': _SETS[53]},
+    ),
+    'office:document-meta': (
+        _SETS[60],
+        _SETS[58],
+        _SETS[59],
+        False,
+        {'office:version': _SETS[53]},
+    ),
+    'office:document-settings': (
+        _SETS[61],
+        _SETS[58],
+        _SETS[59],
+        False,
+        {'office:version': _SETS[53]},
+    ),
+    'office:document-styles': (
+        _SETS[62],
+        _SETS[58],
+        _SETS[59],
+        False,
+        {'office:version': _SETS[53]},
+    ),
+    'office:drawing': (
+        _SETS[63],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:event-listeners': (
+        _SETS[64],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:font-face-decls': (
+        _SETS[65],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:forms': (
+        _SETS[66],
+        _SETS[67],
+        _SETS[3],
+        False,
+        {'form:apply-design-mode': _SETS[15], 'form:automatic-focus': _SETS[15]},
+    ),
+    'office:image': (
+        _SETS[68],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:master-styles': (
+        _SETS[69],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:meta': (
+        _SETS[70],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:presentation': (
+        _SETS[71],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:script': (
+        None,
+        _SETS[72],
+        _SETS[72],
+        True,
+        _NO_VALUES,
+    ),
+    'office:scripts': (
+        _SETS[73],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:settings': (
+        _SETS[74],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:spreadsheet': (
+        _SETS[75],
+        _SETS[76],
+        _SETS[3],
+        False,
+        {'table:structure-protected': _SETS[15]},
+    ),
+    'office:styles': (
+        _SETS[77],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'office:text': (
+        _SETS[78],
+        _SETS[79],
+        _SETS[3],
+        False,
+        {'text:global': _SETS[15], 'text:use-soft-page-breaks': _SETS[15]},
+    ),
+    'style:background-image': (
+        _SETS[82],
+        _SETS[83],
+        _SETS[3],
+        False,
+        {'style:repeat': _SETS[80], 'xlink:actuate': _SETS[0], 'xlink:show': _SETS[81], 'xlink:type': _SETS[2]},
+    ),
+    'style:chart-properties': (
+        _SETS[98],
+        _SETS[99],
+        _SETS[3],
+        False,
+        {'chart:auto-position': _SETS[15], 'chart:auto-size': _SETS[15], 'chart:axis-label-position': _SETS[84], 'chart:connect-bars': _SETS[15], 'chart:data-label-number': _SETS[85], 'chart:data-label-symbol': _SETS[15], 'chart:data-label-text': _SETS[15], 'chart:deep': _SETS[15], 'chart:display-label': _SETS[15], 'chart:error-category': _SETS[86], 'chart:error-lower-indicator': _SETS[15], 'chart:error-upper-indicator': _SETS[15], 'chart:group-bars-per-axis': _SETS[15], 'chart:include-hidden-cells': _SETS[15], 'chart:interpolation': _SETS[87], 'chart:japanese-candle-stick': _SETS[15], 'chart:label-arrangement': _SETS[88], 'chart:label-position': _SETS[89], 'chart:label-position-negative': _SETS[89], 'chart:lines': _SETS[15], 'chart:link-data-style-to-source': _SETS[15], 'chart:logarithmic': _SETS[15], 'chart:mean-value': _SETS[15], 'chart:percentage': _SETS[15], 'chart:regression-type': _SETS[90], 'chart:reverse-direction': _SETS[15], 'chart:right-angled-axes': _SETS[15], 'chart:scale-text': _SETS[15], 'chart:series-source': _SETS[91], 'chart:solid-type': _SETS[92], 'chart:sort-by-x-values': _SETS[15], 'chart:stacked': _SETS[15], 'chart:symbol-name': _SETS[93], 'chart:symbol-type': _SETS[94], 'chart:text-overlap': _SETS[15], 'chart:three-dimensional': _SETS[15], 'chart:tick-mark-position': _SETS[95], 'chart:tick-marks-major-inner': _SETS[15], 'chart:tick-marks-major-outer': _SETS[15], 'chart:tick-marks-minor-inner': _SETS[15], 'chart:tick-marks-minor-outer': _SETS[15], 'chart:treat-empty-cells': _SETS[96], 'chart:vertical': _SETS[15], 'chart:visible': _SETS[15], 'style:direction': _SETS[97], 'text:line-break': _SETS[15]},
+    ),
+    'style:column': (
+        _SETS[3],
+        _SETS[100],
+        _SETS[101],
+        False,
+        _NO_VALUES,
+    ),
+    'style:column-sep': (
+        _SETS[3],
+        _SETS[104],
+        _SETS[105],
+        False,
+        {'style:style': _SETS[102], 'style:vertical-align': _SETS[103]},
+    ),
+    'style:columns': (
+        _SETS[106],
+        _SETS[107],
+        _SETS[108],
+        False,
+        _NO_VALUES,
+    ),
+    'style:default-page-layout': (
+        _SETS[109],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:default-style': (
+        _SETS[111],
+        _SETS[112],
+        _SETS[112],
+        False,
+        {'style:family': _SETS[110]},
+    ),
+    'style:drawing-page-properties': (
+        _SETS[122],
+        _SETS[123],
+        _SETS[3],
+        False,
+        {'draw:background-size': _SETS[113], 'draw:fill': _SETS[114], 'draw:fill-hatch-solid': _SETS[15], 'draw:fill-image-ref-point': _SETS[115], 'presentation:background-objects-visible': _SETS[15], 'presentation:background-visible': _SETS[15], 'presentation:display-date-time': _SETS[15], 'presentation:display-footer': _SETS[15], 'presentation:display-header': _SETS[15], 'presentation:display-page-number': _SETS[15], 'presentation:transition-speed': _SETS[116], 'presentation:transition-style': _SETS[117], 'presentation:transition-type': _SETS[118], 'presentation:visibility': _SETS[119], 'smil:direction': _SETS[120], 'style:repeat': _SETS[80], 'svg:fill-rule': _SETS[121]},
+    ),
+    'style:drop-cap': (
+        _SETS[3],
+        _SETS[124],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:font-face': (
+        _SETS[131],
+        _SETS[132],
+        _SETS[18],
+        False,
+        {'style:font-family-generic': _SETS[125], 'style:font-pitch': _SETS[126], 'svg:font-stretch': _SETS[127], 'svg:font-style': _SETS[128], 'svg:font-variant': _SETS[129], 'svg:font-weight': _SETS[130]},
+    ),
+    'style:footer': (
+        _SETS[133],
+        _SETS[134],
+        _SETS[3],
+        False,
+        {'style:display': _SETS[15]},
+    ),
+    'style:footer-left': (
+        _SETS[133],
+        _SETS[134],
+        _SETS[3],
+        False,
+        {'style:display': _SETS[15]},
+    ),
+    'style:footer-style': (
+        _SETS[135],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:footnote-sep': (
+        _SETS[3],
+        _SETS[138],
+        _SETS[3],
+        False,
+        {'style:adjustment': _SETS[136], 'style:line-style': _SETS[137]},
+    ),
+    'style:graphic-properties': (
+        _SETS[174],
+        _SETS[175],
+        _SETS[3],
+        False,
+        {'dr3d:backface-culling': _SETS[139], 'dr3d:close-back': _SETS[15], 'dr3d:close-front': _SETS[15], 'dr3d:edge-rounding-mode': _SETS[140], 'dr3d:lighting-mode': _SETS[141], 'dr3d:normals-direction': _SETS[142], 'dr3d:normals-kind': _SETS[143], 'dr3d:shadow': _SETS[119], 'dr3d:texture-filter': _SETS[139], 'dr3d:texture-generation-mode-x': _SETS[144], 'dr3d:texture-generation-mode-y': _SETS[144], 'dr3d:texture-kind': _SETS[145], 'dr3d:texture-mode': _SETS[146], 'draw:auto-grow-height': _SETS[15], 'draw:auto-grow-width': _SETS[15], 'draw:caption-angle-type': _SETS[147], 'draw:caption-escape-direction': _SETS[148], 'draw:caption-fit-line-length': _SETS[15], 'draw:caption-type': _SETS[149], 'draw:color-inversion': _SETS[15], 'draw:color-mode': _SETS[150], 'draw:draw-aspect': _SETS[151], 'draw:fill': _SETS[114], 'draw:fill-hatch-solid': _SETS[15], 'draw:fill-image-ref-point': _SETS[115], 'draw:fit-to-contour': _SETS[15], 'draw:fit-to-size': _SETS[15], 'draw:frame-display-border': _SETS[15], 'draw:frame-display-scrollbar': _SETS[15], 'draw:marker-end-center': _SETS[15], 'draw:marker-start-center': _SETS[15], 'draw:measure-align': _SETS[152], 'draw:measure-vertical-align': _SETS[153], 'draw:parallel': _SETS[15], 'draw:placing': _SETS[154], 'draw:shadow': _SETS[119], 'draw:show-unit': _SETS[15], 'draw:stroke': _SETS[155], 'draw:stroke-linejoin': _SETS[156], 'draw:textarea-horizontal-align': _SETS[157], 'draw:textarea-vertical-align': _SETS[158], 'draw:unit': _SETS[159], 'draw:wrap-influence-on-position': _SETS[160], 'fo:wrap-option': _SETS[161], 'style:editable': _SETS[15], 'style:flow-with-text': _SETS[15], 'style:horizontal-pos': _SETS[162], 'style:horizontal-rel': _SETS[163], 'style:overflow-behavior': _SETS[164], 'style:print-content': _SETS[15], 'style:repeat': _SETS[80], 'style:run-through': _SETS[165], 'style:shrink-to-fit': _SETS[15], 'style:vertical-pos': _SETS[166], 'style:vertical-rel': _SETS[167], 'style:wrap': _SETS[168], 'style:wrap-contour': _SETS[15], 'style:wrap-contour-mode': _SETS[169], 'style:writing-mode': _SETS[170], 'svg:fill-rule': _SETS[121], 'svg:stroke-linecap': _SETS[171], 'text:anchor-type': _SETS[41], 'text:animation': _SETS[172], 'text:animation-direction': _SETS[173], 'text:animation-start-inside': _SETS[15], 'text:animation-stop-inside': _SETS[15]},
+    ),
+    'style:handout-master': (
+        _SETS[176],
+        _SETS[177],
+        _SETS[178],
+        False,
+        _NO_VALUES,
+    ),
+    'style:header': (
+        _SETS[133],
+        _SETS[134],
+        _SETS[3],
+        False,
+        {'style:display': _SETS[15]},
+    ),
+    'style:header-footer-properties': (
+        _SETS[179],
+        _SETS[180],
+        _SETS[3],
+        False,
+        {'style:dynamic-spacing': _SETS[15]},
+    ),
+    'style:header-left': (
+        _SETS[133],
+        _SETS[134],
+        _SETS[3],
+        False,
+        {'style:display': _SETS[15]},
+    ),
+    'style:header-style': (
+        _SETS[135],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:list-level-label-alignment': (
+        _SETS[3],
+        _SETS[182],
+        _SETS[183],
+        False,
+        {'text:label-followed-by': _SETS[181]},
+    ),
+    'style:list-level-properties': (
+        _SETS[186],
+        _SETS[187],
+        _SETS[3],
+        False,
+        {'fo:text-align': _SETS[184], 'style:vertical-pos': _SETS[166], 'style:vertical-rel': _SETS[167], 'text:list-level-position-and-space-mode': _SETS[185]},
+    ),
+    'style:map': (
+        _SETS[3],
+        _SETS[188],
+        _SETS[189],
+        False,
+        _NO_VALUES,
+    ),
+    'style:master-page': (
+        _SETS[190],
+        _SETS[191],
+        _SETS[192],
+        False,
+        _NO_VALUES,
+    ),
+    'style:page-layout': (
+        _SETS[109],
+        _SETS[194],
+        _SETS[18],
+        False,
+        {'style:page-usage': _SETS[193]},
+    ),
+    'style:page-layout-properties': (
+        _SETS[198],
+        _SETS[199],
+        _SETS[3],
+        False,
+        {'style:layout-grid-display': _SETS[15], 'style:layout-grid-mode': _SETS[195], 'style:layout-grid-print': _SETS[15], 'style:layout-grid-ruby-below': _SETS[15], 'style:layout-grid-snap-to': _SETS[15], 'style:layout-grid-standard-mode': _SETS[15], 'style:num-letter-sync': _SETS[15], 'style:print-orientation': _SETS[196], 'style:print-page-order': _SETS[97], 'style:table-centering': _SETS[197], 'style:writing-mode': _SETS[170]},
+    ),
+    'style:paragraph-properties': (
+        _SETS[208],
+        _SETS[209],
+        _SETS[3],
+        False,
+        {'fo:break-after': _SETS[200], 'fo:break-before': _SETS[200], 'fo:hyphenation-keep': _SETS[201], 'fo:keep-together': _SETS[202], 'fo:keep-with-next': _SETS[202], 'fo:text-align': _SETS[184], 'fo:text-align-last': _SETS[203], 'style:auto-text-indent': _SETS[15], 'style:font-independent-line-spacing': _SETS[15], 'style:join-border': _SETS[15], 'style:justify-single-word': _SETS[15], 'style:line-break': _SETS[204], 'style:punctuation-wrap': _SETS[205], 'style:register-true': _SETS[15], 'style:snap-to-layout-grid': _SETS[15], 'style:text-autospace': _SETS[206], 'style:vertical-align': _SETS[207], 'style:writing-mode': _SETS[170], 'style:writing-mode-automatic': _SETS[15], 'text:number-lines': _SETS[15]},
+    ),
+    'style:presentation-page-layout': (
+        _SETS[210],
+        _SETS[211],
+        _SETS[18],
+        False,
+        _NO_VALUES,
+    ),
+    'style:region-center': (
+        _SETS[212],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:region-left': (
+        _SETS[212],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:region-right': (
+        _SETS[212],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:ruby-properties': (
+        _SETS[3],
+        _SETS[214],
+        _SETS[3],
+        False,
+        {'style:ruby-align': _SETS[213], 'style:ruby-position': _SETS[154]},
+    ),
+    'style:section-properties': (
+        _SETS[215],
+        _SETS[216],
+        _SETS[3],
+        False,
+        {'style:editable': _SETS[15], 'style:protect': _SETS[15], 'style:writing-mode': _SETS[170], 'text:dont-balance-text-columns': _SETS[15]},
+    ),
+    'style:style': (
+        _SETS[217],
+        _SETS[218],
+        _SETS[219],
+        False,
+        {'style:auto-update': _SETS[15], 'style:family': _SETS[110]},
+    ),
+    'style:tab-stop': (
+        _SETS[3],
+        _SETS[222],
+        _SETS[223],
+        False,
+        {'style:leader-style': _SETS[137], 'style:leader-type': _SETS[220], 'style:type': _SETS[221]},
+    ),
+    'style:tab-stops': (
+        _SETS[224],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'style:table-cell-properties': (
+        _SETS[179],
+        _SETS[229],
+        _SETS[3],
+        False,
+        {'fo:wrap-option': _SETS[161], 'style:direction': _SETS[97], 'style:glyph-orientation-vertical': _SETS[225], 'style:print-content': _SETS[15], 'style:repeat-content': _SETS[15], 'style:rotation-align': _SETS[226], 'style:shrink-to-fit': _SETS[15], 'style:text-align-source': _SETS[227], 'style:vertical-align': _SETS[228], 'style:writing-mode': _SETS[170]},
+    ),
+    'style:table-column-properties': (
+        _SETS[3],
+        _SETS[230],
+        _SETS[3],
+        False,
+        {'fo:break-after': _SETS[200], 'fo:break-before': _SETS[200], 'style:use-optimal-column-width': _SETS[15]},
+    ),
+    'style:table-properties': (
+        _SETS[179],
+        _SETS[233],
+        _SETS[3],
+        False,
+        {'fo:break-after': _SETS[200], 'fo:break-before': _SETS[200], 'fo:keep-with-next': _SETS[202], 'style:may-break-between-rows': _SETS[15], 'style:writing-mode': _SETS[170], 'table:align': _SETS[231], 'table:border-model': _SETS[232], 'table:display': _SETS[15]},
+    ),
+    'style:table-row-properties': (
+        _SETS[179],
+        _SETS[234],
+        _SETS[3],
+        False,
+        {'fo:break-after': _SETS[200], 'fo:break-before': _SETS[200], 'fo:keep-together': _SETS[202], 'style:use-optimal-row-height': _SETS[15]},
+    ),
+    'style:text-properties': (
+        _SETS[3],
+        _SETS[243],
+        _SETS[3],
+        False,
+        {'fo:font-style': _SETS[128], 'fo:font-variant': _SETS[129], 'fo:font-weight': _SETS[130], 'fo:hyphenate': _SETS[15], 'fo:text-transform': _SETS[235], 'style:font-family-generic': _SETS[125], 'style:font-family-generic-asian': _SETS[125], 'style:font-family-generic-complex': _SETS[125], 'style:font-pitch': _SETS[126], 'style:font-pitch-asian': _SETS[126], 'style:font-pitch-complex': _SETS[126], 'style:font-relief': _SETS[236], 'style:font-style-asian': _SETS[128], 'style:font-style-complex': _SETS[128], 'style:font-weight-asian': _SETS[130], 'style:font-weight-complex': _SETS[130], 'style:letter-kerning': _SETS[15], 'style:script-type': _SETS[237], 'style:text-blinking': _SETS[15], 'style:text-combine': _SETS[238], 'style:text-line-through-mode': _SETS[239], 'style:text-line-through-style': _SETS[137], 'style:text-line-through-type': _SETS[220], 'style:text-outline': _SETS[15], 'style:text-overline-mode': _SETS[239], 'style:text-overline-style': _SETS[137], 'style:text-overline-type': _SETS[220], 'style:text-rotation-scale': _SETS[240], 'style:text-underline-mode': _SETS[239], 'style:text-underline-style': _SETS[137], 'style:text-underline-type': _SETS[220], 'style:use-window-font-color': _SETS[15], 'text:condition': _SETS[241], 'text:display': _SETS[242]},
+    ),
+    'table:background': (
+        _SETS[3],
+        _SETS[244],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:body': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:calculation-settings': (
+        _SETS[246],
+        _SETS[247],
+        _SETS[3],
+        False,
+        {'table:automatic-find-labels': _SETS[15], 'table:case-sensitive': _SETS[15], 'table:precision-as-shown': _SETS[15], 'table:search-criteria-must-apply-to-whole-cell': _SETS[15], 'table:use-regular-expressions': _SETS[15], 'table:use-wildcards': _SETS[15]},
+    ),
+    'table:cell-address': (
+        _SETS[3],
+        _SETS[248],
+        _SETS[248],
+        False,
+        _NO_VALUES,
+    ),
+    'table:cell-content-change': (
+        _SETS[250],
+        _SETS[251],
+        _SETS[252],
+        False,
+        {'table:acceptance-state': _SETS[249]},
+    ),
+    'table:cell-content-deletion': (
+        _SETS[253],
+        _SETS[252],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:cell-range-source': (
+        _SETS[3],
+        _SETS[254],
+        _SETS[255],
+        False,
+        {'xlink:actuate': _SETS[8], 'xlink:type': _SETS[2]},
+    ),
+    'table:change-deletion': (
+        _SETS[3],
+        _SETS[252],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:change-track-table-cell': (
+        _SETS[212],
+        _SETS[257],
+        _SETS[3],
+        False,
+        {'office:boolean-value': _SETS[15], 'office:value-type': _SETS[256], 'table:matrix-covered': _SETS[15]},
+    ),
+    'table:consolidation': (
+        _SETS[3],
+        _SETS[259],
+        _SETS[260],
+        False,
+        {'table:link-to-source-data': _SETS[15], 'table:use-labels': _SETS[258]},
+    ),
+    'table:content-validation': (
+        _SETS[262],
+        _SETS[263],
+        _SETS[264],
+        False,
+        {'table:allow-empty-cell': _SETS[15], 'table:display-list': _SETS[261]},
+    ),
+    'table:content-validations': (
+        _SETS[265],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:covered-table-cell': (
+        _SETS[266],
+        _SETS[267],
+        _SETS[3],
+        False,
+        {'office:boolean-value': _SETS[15], 'office:value-type': _SETS[256], 'table:protect': _SETS[15], 'table:protected': _SETS[15]},
+    ),
+    'table:cut-offs': (
+        _SETS[268],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:data-pilot-display-info': (
+        _SETS[3],
+        _SETS[270],
+        _SETS[270],
+        False,
+        {'table:display-member-mode': _SETS[269], 'table:enabled': _SETS[15]},
+    ),
+    'table:data-pilot-field': (
+        _SETS[272],
+        _SETS[273],
+        _SETS[274],
+        False,
+        {'table:orientation': _SETS[271]},
+    ),
+    'table:data-pilot-field-reference': (
+        _SETS[3],
+        _SETS[277],
+        _SETS[278],
+        False,
+        {'table:member-type': _SETS[275], 'table:type': _SETS[276]},
+    ),
+    'table:data-pilot-group': (
+        _SETS[279],
+        _SETS[264],
+        _SETS[264],
+        False,
+        _NO_VALUES,
+    ),
+    'table:data-pilot-group-member': (
+        _SETS[3],
+        _SETS[264],
+        _SETS[264],
+        False,
+        _NO_VALUES,
+    ),
+    'table:data-pilot-groups': (
+        _SETS[281],
+        _SETS[282],
+        _SETS[283],
+        False,
+        {'table:grouped-by': _SETS[280]},
+    ),
+    'table:data-pilot-layout-info': (
+        _SETS[3],
+        _SETS[285],
+        _SETS[285],
+        False,
+        {'table:add-empty-lines': _SETS[15], 'table:layout-mode': _SETS[284]},
+    ),
+    'table:data-pilot-level': (
+        _SETS[286],
+        _SETS[287],
+        _SETS[3],
+        False,
+        {'table:show-empty': _SETS[15]},
+    ),
+    'table:data-pilot-member': (
+        _SETS[3],
+        _SETS[288],
+        _SETS[264],
+        False,
+        {'table:display': _SETS[15], 'table:show-details': _SETS[15]},
+    ),
+    'table:data-pilot-members': (
+        _SETS[289],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:data-pilot-sort-info': (
+        _SETS[3],
+        _SETS[292],
+        _SETS[293],
+        False,
+        {'table:order': _SETS[290], 'table:sort-mode': _SETS[291]},
+    ),
+    'table:data-pilot-subtotal': (
+        _SETS[3],
+        _SETS[294],
+        _SETS[294],
+        False,
+        _NO_VALUES,
+    ),
+    'table:data-pilot-subtotals': (
+        _SETS[295],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:data-pilot-table': (
+        _SETS[296],
+        _SETS[297],
+        _SETS[298],
+        False,
+        {'table:drill-down-on-double-click': _SETS[15], 'table:grand-total': _SETS[258], 'table:identify-categories': _SETS[15], 'table:ignore-empty-rows': _SETS[15], 'table:show-filter-button': _SETS[15]},
+    ),
+    'table:data-pilot-tables': (
+        _SETS[299],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:database-range': (
+        _SETS[301],
+        _SETS[302],
+        _SETS[303],
+        False,
+        {'table:contains-header': _SETS[15], 'table:display-filter-buttons': _SETS[15], 'table:has-persistent-data': _SETS[15], 'table:is-selection': _SETS[15], 'table:on-update-keep-size': _SETS[15], 'table:on-update-keep-styles': _SETS[15], 'table:orientation': _SETS[300], 'table:refresh-delay': _SETS[15]},
+    ),
+    'table:database-ranges': (
+        _SETS[304],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:database-source-query': (
+        _SETS[3],
+        _SETS[305],
+        _SETS[305],
+        False,
+        _NO_VALUES,
+    ),
+    'table:database-source-sql': (
+        _SETS[3],
+        _SETS[306],
+        _SETS[307],
+        False,
+        {'table:parse-sql-statement': _SETS[15]},
+    ),
+    'table:database-source-table': (
+        _SETS[3],
+        _SETS[308],
+        _SETS[308],
+        False,
+        _NO_VALUES,
+    ),
+    'table:dde-link': (
+        _SETS[309],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:dde-links': (
+        _SETS[310],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:deletion': (
+        _SETS[312],
+        _SETS[313],
+        _SETS[314],
+        False,
+        {'table:acceptance-state': _SETS[249], 'table:type': _SETS[311]},
+    ),
+    'table:deletions': (
+        _SETS[315],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:dependencies': (
+        _SETS[316],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:dependency': (
+        _SETS[3],
+        _SETS[252],
+        _SETS[252],
+        False,
+        _NO_VALUES,
+    ),
+    'table:desc': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'table:detective': (
+        _SETS[317],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:error-macro': (
+        _SETS[3],
+        _SETS[318],
+        _SETS[3],
+        False,
+        {'table:execute': _SETS[15]},
+    ),
+    'table:error-message': (
+        _SETS[212],
+        _SETS[320],
+        _SETS[3],
+        False,
+        {'table:display': _SETS[15], 'table:message-type': _SETS[319]},
+    ),
+    'table:even-columns': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:even-rows': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:filter': (
+        _SETS[322],
+        _SETS[323],
+        _SETS[3],
+        False,
+        {'table:condition-source': _SETS[321], 'table:display-duplicates': _SETS[15]},
+    ),
+    'table:filter-and': (
+        _SETS[324],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:filter-condition': (
+        _SETS[326],
+        _SETS[327],
+        _SETS[328],
+        False,
+        {'table:data-type': _SETS[325]},
+    ),
+    'table:filter-or': (
+        _SETS[329],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:filter-set-item': (
+        _SETS[3],
+        _SETS[330],
+        _SETS[330],
+        False,
+        _NO_VALUES,
+    ),
+    'table:first-column': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:first-row': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:help-message': (
+        _SETS[212],
+        _SETS[331],
+        _SETS[3],
+        False,
+        {'table:display': _SETS[15]},
+    ),
+    'table:highlighted-range': (
+        _SETS[3],
+        _SETS[333],
+        _SETS[3],
+        False,
+        {'table:contains-error': _SETS[15], 'table:direction': _SETS[332], 'table:marked-invalid': _SETS[15]},
+    ),
+    'table:insertion': (
+        _SETS[334],
+        _SETS[335],
+        _SETS[314],
+        False,
+        {'table:acceptance-state': _SETS[249], 'table:type': _SETS[311]},
+    ),
+    'table:insertion-cut-off': (
+        _SETS[3],
+        _SETS[336],
+        _SETS[336],
+        False,
+        _NO_VALUES,
+    ),
+    'table:iteration': (
+        _SETS[3],
+        _SETS[338],
+        _SETS[3],
+        False,
+        {'table:status': _SETS[337]},
+    ),
+    'table:label-range': (
+        _SETS[3],
+        _SETS[339],
+        _SETS[339],
+        False,
+        {'table:orientation': _SETS[300]},
+    ),
+    'table:label-ranges': (
+        _SETS[340],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:last-column': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:last-row': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:movement': (
+        _SETS[341],
+        _SETS[251],
+        _SETS[252],
+        False,
+        {'table:acceptance-state': _SETS[249]},
+    ),
+    'table:movement-cut-off': (
+        _SETS[3],
+        _SETS[342],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:named-expression': (
+        _SETS[3],
+        _SETS[343],
+        _SETS[344],
+        False,
+        _NO_VALUES,
+    ),
+    'table:named-expressions': (
+        _SETS[345],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:named-range': (
+        _SETS[3],
+        _SETS[346],
+        _SETS[347],
+        False,
+        _NO_VALUES,
+    ),
+    'table:null-date': (
+        _SETS[3],
+        _SETS[349],
+        _SETS[3],
+        False,
+        {'table:value-type': _SETS[348]},
+    ),
+    'table:odd-columns': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:odd-rows': (
+        _SETS[3],
+        _SETS[245],
+        _SETS[244],
+        False,
+        _NO_VALUES,
+    ),
+    'table:operation': (
+        _SETS[3],
+        _SETS[351],
+        _SETS[351],
+        False,
+        {'table:name': _SETS[350]},
+    ),
+    'table:previous': (
+        _SETS[352],
+        _SETS[252],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:scenario': (
+        _SETS[3],
+        _SETS[353],
+        _SETS[354],
+        False,
+        {'table:copy-back': _SETS[15], 'table:copy-formulas': _SETS[15], 'table:copy-styles': _SETS[15], 'table:display-border': _SETS[15], 'table:is-active': _SETS[15], 'table:protected': _SETS[15]},
+    ),
+    'table:shapes': (
+        _SETS[176],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:sort': (
+        _SETS[356],
+        _SETS[357],
+        _SETS[3],
+        False,
+        {'table:bind-styles-to-content': _SETS[15], 'table:case-sensitive': _SETS[15], 'table:embedded-number-behavior': _SETS[355]},
+    ),
+    'table:sort-by': (
+        _SETS[3],
+        _SETS[358],
+        _SETS[359],
+        False,
+        {'table:order': _SETS[290]},
+    ),
+    'table:sort-groups': (
+        _SETS[3],
+        _SETS[360],
+        _SETS[3],
+        False,
+        {'table:order': _SETS[290]},
+    ),
+    'table:source-cell-range': (
+        _SETS[361],
+        _SETS[362],
+        _SETS[362],
+        False,
+        _NO_VALUES,
+    ),
+    'table:source-range-address': (
+        _SETS[3],
+        _SETS[363],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:source-service': (
+        _SETS[3],
+        _SETS[364],
+        _SETS[365],
+        False,
+        _NO_VALUES,
+    ),
+    'table:subtotal-field': (
+        _SETS[3],
+        _SETS[366],
+        _SETS[366],
+        False,
+        _NO_VALUES,
+    ),
+    'table:subtotal-rule': (
+        _SETS[367],
+        _SETS[368],
+        _SETS[368],
+        False,
+        _NO_VALUES,
+    ),
+    'table:subtotal-rules': (
+        _SETS[369],
+        _SETS[370],
+        _SETS[3],
+        False,
+        {'table:bind-styles-to-content': _SETS[15], 'table:case-sensitive': _SETS[15], 'table:page-breaks-on-group-change': _SETS[15]},
+    ),
+    'table:table': (
+        _SETS[371],
+        _SETS[372],
+        _SETS[3],
+        False,
+        {'table:is-sub-table': _SETS[15], 'table:print': _SETS[15], 'table:protected': _SETS[15], 'table:use-banding-columns-styles': _SETS[15], 'table:use-banding-rows-styles': _SETS[15], 'table:use-first-column-styles': _SETS[15], 'table:use-first-row-styles': _SETS[15], 'table:use-last-column-styles': _SETS[15], 'table:use-last-row-styles': _SETS[15]},
+    ),
+    'table:table-cell': (
+        _SETS[266],
+        _SETS[373],
+        _SETS[3],
+        False,
+        {'office:boolean-value': _SETS[15], 'office:value-type': _SETS[256], 'table:protect': _SETS[15], 'table:protected': _SETS[15]},
+    ),
+    'table:table-column': (
+        _SETS[3],
+        _SETS[375],
+        _SETS[3],
+        False,
+        {'table:visibility': _SETS[374]},
+    ),
+    'table:table-column-group': (
+        _SETS[376],
+        _SETS[377],
+        _SETS[3],
+        False,
+        {'table:display': _SETS[15]},
+    ),
+    'table:table-columns': (
+        _SETS[378],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:table-header-columns': (
+        _SETS[378],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:table-header-rows': (
+        _SETS[379],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:table-row': (
+        _SETS[380],
+        _SETS[381],
+        _SETS[3],
+        False,
+        {'table:visibility': _SETS[374]},
+    ),
+    'table:table-row-group': (
+        _SETS[382],
+        _SETS[377],
+        _SETS[3],
+        False,
+        {'table:display': _SETS[15]},
+    ),
+    'table:table-rows': (
+        _SETS[379],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:table-source': (
+        _SETS[3],
+        _SETS[384],
+        _SETS[10],
+        False,
+        {'table:mode': _SETS[383], 'xlink:actuate': _SETS[8], 'xlink:type': _SETS[2]},
+    ),
+    'table:table-template': (
+        _SETS[385],
+        _SETS[386],
+        _SETS[386],
+        False,
+        {'table:first-row-end-column': _SETS[300], 'table:first-row-start-column': _SETS[300], 'table:last-row-end-column': _SETS[300], 'table:last-row-start-column': _SETS[300]},
+    ),
+    'table:target-range-address': (
+        _SETS[3],
+        _SETS[363],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'table:title': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'table:tracked-changes': (
+        _SETS[387],
+        _SETS[388],
+        _SETS[3],
+        False,
+        {'table:track-changes': _SETS[15]},
+    ),
+    'text:a': (
+        _SETS[389],
+        _SETS[390],
+        _SETS[10],
+        True,
+        {'xlink:actuate': _SETS[8], 'xlink:show': _SETS[6], 'xlink:type': _SETS[2]},
+    ),
+    'text:alphabetical-index': (
+        _SETS[391],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:alphabetical-index-auto-mark-file': (
+        _SETS[3],
+        _SETS[10],
+        _SETS[10],
+        False,
+        {'xlink:type': _SETS[2]},
+    ),
+    'text:alphabetical-index-entry-template': (
+        _SETS[395],
+        _SETS[396],
+        _SETS[396],
+        False,
+        {'text:outline-level': _SETS[394]},
+    ),
+    'text:alphabetical-index-mark': (
+        _SETS[3],
+        _SETS[397],
+        _SETS[398],
+        False,
+        {'text:main-entry': _SETS[15]},
+    ),
+    'text:alphabetical-index-mark-end': (
+        _SETS[3],
+        _SETS[399],
+        _SETS[399],
+        False,
+        _NO_VALUES,
+    ),
+    'text:alphabetical-index-mark-start': (
+        _SETS[3],
+        _SETS[400],
+        _SETS[399],
+        False,
+        {'text:main-entry': _SETS[15]},
+    ),
+    'text:alphabetical-index-source': (
+        _SETS[402],
+        _SETS[403],
+        _SETS[3],
+        False,
+        {'text:alphabetical-separators': _SETS[15], 'text:capitalize-entries': _SETS[15], 'text:combine-entries': _SETS[15], 'text:combine-entries-with-dash': _SETS[15], 'text:combine-entries-with-pp': _SETS[15], 'text:comma-separated': _SETS[15], 'text:ignore-case': _SETS[15], 'text:index-scope': _SETS[401], 'text:relative-tab-stop-position': _SETS[15], 'text:use-keys-as-entries': _SETS[15]},
+    ),
+    'text:author-initials': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:author-name': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:bibliography': (
+        _SETS[405],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:bibliography-configuration': (
+        _SETS[406],
+        _SETS[407],
+        _SETS[3],
+        False,
+        {'text:numbered-entries': _SETS[15], 'text:sort-by-position': _SETS[15]},
+    ),
+    'text:bibliography-entry-template': (
+        _SETS[409],
+        _SETS[410],
+        _SETS[410],
+        False,
+        {'text:bibliography-type': _SETS[408]},
+    ),
+    'text:bibliography-mark': (
+        _SETS[3],
+        _SETS[411],
+        _SETS[412],
+        True,
+        {'text:bibliography-type': _SETS[408]},
+    ),
+    'text:bibliography-source': (
+        _SETS[413],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:bookmark': (
+        _SETS[3],
+        _SETS[414],
+        _SETS[393],
+        False,
+        _NO_VALUES,
+    ),
+    'text:bookmark-end': (
+        _SETS[3],
+        _SETS[393],
+        _SETS[393],
+        False,
+        _NO_VALUES,
+    ),
+    'text:bookmark-ref': (
+        _SETS[3],
+        _SETS[416],
+        _SETS[3],
+        True,
+        {'text:reference-format': _SETS[415]},
+    ),
+    'text:bookmark-start': (
+        _SETS[3],
+        _SETS[417],
+        _SETS[393],
+        False,
+        _NO_VALUES,
+    ),
+    'text:change': (
+        _SETS[3],
+        _SETS[418],
+        _SETS[418],
+        False,
+        _NO_VALUES,
+    ),
+    'text:change-end': (
+        _SETS[3],
+        _SETS[418],
+        _SETS[418],
+        False,
+        _NO_VALUES,
+    ),
+    'text:change-start': (
+        _SETS[3],
+        _SETS[418],
+        _SETS[418],
+        False,
+        _NO_VALUES,
+    ),
+    'text:changed-region': (
+        _SETS[419],
+        _SETS[420],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:chapter': (
+        _SETS[3],
+        _SETS[422],
+        _SETS[422],
+        True,
+        {'text:display': _SETS[421]},
+    ),
+    'text:character-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:conditional-text': (
+        _SETS[3],
+        _SETS[424],
+        _SETS[425],
+        True,
+        {'text:current-value': _SETS[15]},
+    ),
+    'text:creation-date': (
+        _SETS[3],
+        _SETS[426],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:creation-time': (
+        _SETS[3],
+        _SETS[427],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:creator': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:database-display': (
+        _SETS[429],
+        _SETS[430],
+        _SETS[431],
+        True,
+        {'text:table-type': _SETS[428]},
+    ),
+    'text:database-name': (
+        _SETS[429],
+        _SETS[432],
+        _SETS[433],
+        True,
+        {'text:table-type': _SETS[428]},
+    ),
+    'text:database-next': (
+        _SETS[429],
+        _SETS[434],
+        _SETS[433],
+        False,
+        {'text:table-type': _SETS[428]},
+    ),
+    'text:database-row-number': (
+        _SETS[429],
+        _SETS[435],
+        _SETS[433],
+        True,
+        {'style:num-letter-sync': _SETS[15], 'text:table-type': _SETS[428]},
+    ),
+    'text:database-row-select': (
+        _SETS[429],
+        _SETS[436],
+        _SETS[433],
+        False,
+        {'text:table-type': _SETS[428]},
+    ),
+    'text:date': (
+        _SETS[3],
+        _SETS[437],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:dde-connection': (
+        _SETS[3],
+        _SETS[438],
+        _SETS[438],
+        True,
+        _NO_VALUES,
+    ),
+    'text:dde-connection-decl': (
+        _SETS[3],
+        _SETS[439],
+        _SETS[440],
+        False,
+        {'office:automatic-update': _SETS[15]},
+    ),
+    'text:dde-connection-decls': (
+        _SETS[441],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:deletion': (
+        _SETS[442],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:description': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:editing-cycles': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:editing-duration': (
+        _SETS[3],
+        _SETS[443],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:execute-macro': (
+        _SETS[444],
+        _SETS[393],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:expression': (
+        _SETS[3],
+        _SETS[446],
+        _SETS[3],
+        True,
+        {'office:boolean-value': _SETS[15], 'office:value-type': _SETS[256], 'text:display': _SETS[445]},
+    ),
+    'text:file-name': (
+        _SETS[3],
+        _SETS[448],
+        _SETS[3],
+        True,
+        {'text:display': _SETS[447], 'text:fixed': _SETS[15]},
+    ),
+    'text:format-change': (
+        _SETS[449],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:h': (
+        _SETS[450],
+        _SETS[451],
+        _SETS[452],
+        True,
+        {'text:is-list-header': _SETS[15], 'text:restart-numbering': _SETS[15]},
+    ),
+    'text:hidden-paragraph': (
+        _SETS[3],
+        _SETS[453],
+        _SETS[454],
+        True,
+        {'text:is-hidden': _SETS[15]},
+    ),
+    'text:hidden-text': (
+        _SETS[3],
+        _SETS[455],
+        _SETS[456],
+        True,
+        {'text:is-hidden': _SETS[15]},
+    ),
+    'text:illustration-index': (
+        _SETS[457],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:illustration-index-entry-template': (
+        _SETS[395],
+        _SETS[458],
+        _SETS[458],
+        False,
+        _NO_VALUES,
+    ),
+    'text:illustration-index-source': (
+        _SETS[460],
+        _SETS[461],
+        _SETS[3],
+        False,
+        {'text:caption-sequence-format': _SETS[459], 'text:index-scope': _SETS[401], 'text:relative-tab-stop-position': _SETS[15], 'text:use-caption': _SETS[15]},
+    ),
+    'text:image-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:index-body': (
+        _SETS[462],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-entry-bibliography': (
+        _SETS[3],
+        _SETS[464],
+        _SETS[465],
+        False,
+        {'text:bibliography-data-field': _SETS[463]},
+    ),
+    'text:index-entry-chapter': (
+        _SETS[3],
+        _SETS[466],
+        _SETS[3],
+        False,
+        {'text:display': _SETS[421]},
+    ),
+    'text:index-entry-link-end': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-entry-link-start': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-entry-page-number': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-entry-span': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:index-entry-tab-stop': (
+        _SETS[3],
+        _SETS[468],
+        _SETS[469],
+        False,
+        {'style:type': _SETS[467]},
+    ),
+    'text:index-entry-text': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-source-style': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[458],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-source-styles': (
+        _SETS[470],
+        _SETS[452],
+        _SETS[452],
+        False,
+        _NO_VALUES,
+    ),
+    'text:index-title': (
+        _SETS[462],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:index-title-template': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:initial-creator': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:insertion': (
+        _SETS[449],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:keywords': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:line-break': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:linenumbering-configuration': (
+        _SETS[472],
+        _SETS[473],
+        _SETS[3],
+        False,
+        {'style:num-letter-sync': _SETS[15], 'text:count-empty-lines': _SETS[15], 'text:count-in-text-boxes': _SETS[15], 'text:number-lines': _SETS[15], 'text:number-position': _SETS[471], 'text:restart-on-page': _SETS[15]},
+    ),
+    'text:linenumbering-separator': (
+        _SETS[3],
+        _SETS[474],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:list': (
+        _SETS[475],
+        _SETS[476],
+        _SETS[3],
+        False,
+        {'text:continue-numbering': _SETS[15]},
+    ),
+    'text:list-header': (
+        _SETS[477],
+        _SETS[478],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:list-item': (
+        _SETS[477],
+        _SETS[479],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:list-level-style-bullet': (
+        _SETS[480],
+        _SETS[481],
+        _SETS[482],
+        False,
+        _NO_VALUES,
+    ),
+    'text:list-level-style-image': (
+        _SETS[483],
+        _SETS[484],
+        _SETS[485],
+        False,
+        {'xlink:actuate': _SETS[0], 'xlink:show': _SETS[81], 'xlink:type': _SETS[2]},
+    ),
+    'text:list-level-style-number': (
+        _SETS[480],
+        _SETS[486],
+        _SETS[485],
+        False,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:list-style': (
+        _SETS[487],
+        _SETS[488],
+        _SETS[18],
+        False,
+        {'text:consecutive-numbering': _SETS[15]},
+    ),
+    'text:measure': (
+        _SETS[3],
+        _SETS[490],
+        _SETS[490],
+        True,
+        {'text:kind': _SETS[489]},
+    ),
+    'text:meta': (
+        _SETS[491],
+        _SETS[492],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:meta-field': (
+        _SETS[491],
+        _SETS[493],
+        _SETS[478],
+        True,
+        _NO_VALUES,
+    ),
+    'text:modification-date': (
+        _SETS[3],
+        _SETS[426],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:modification-time': (
+        _SETS[3],
+        _SETS[427],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:note': (
+        _SETS[495],
+        _SETS[496],
+        _SETS[497],
+        False,
+        {'text:note-class': _SETS[494]},
+    ),
+    'text:note-body': (
+        _SETS[498],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:note-citation': (
+        _SETS[3],
+        _SETS[499],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:note-continuation-notice-backward': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:note-continuation-notice-forward': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:note-ref': (
+        _SETS[3],
+        _SETS[501],
+        _SETS[497],
+        True,
+        {'text:note-class': _SETS[494], 'text:reference-format': _SETS[500]},
+    ),
+    'text:notes-configuration': (
+        _SETS[504],
+        _SETS[505],
+        _SETS[497],
+        False,
+        {'style:num-letter-sync': _SETS[15], 'text:footnotes-position': _SETS[502], 'text:note-class': _SETS[494], 'text:start-numbering-at': _SETS[503]},
+    ),
+    'text:number': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:numbered-paragraph': (
+        _SETS[506],
+        _SETS[507],
+        _SETS[508],
+        False,
+        {'text:continue-numbering': _SETS[15]},
+    ),
+    'text:object-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:object-index': (
+        _SETS[509],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:object-index-entry-template': (
+        _SETS[395],
+        _SETS[458],
+        _SETS[458],
+        False,
+        _NO_VALUES,
+    ),
+    'text:object-index-source': (
+        _SETS[510],
+        _SETS[511],
+        _SETS[3],
+        False,
+        {'text:index-scope': _SETS[401], 'text:relative-tab-stop-position': _SETS[15], 'text:use-chart-objects': _SETS[15], 'text:use-draw-objects': _SETS[15], 'text:use-math-objects': _SETS[15], 'text:use-other-objects': _SETS[15], 'text:use-spreadsheet-objects': _SETS[15]},
+    ),
+    'text:outline-level-style': (
+        _SETS[480],
+        _SETS[486],
+        _SETS[485],
+        False,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:outline-style': (
+        _SETS[512],
+        _SETS[18],
+        _SETS[18],
+        False,
+        _NO_VALUES,
+    ),
+    'text:p': (
+        _SETS[491],
+        _SETS[513],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:page': (
+        _SETS[3],
+        _SETS[514],
+        _SETS[514],
+        False,
+        _NO_VALUES,
+    ),
+    'text:page-continuation': (
+        _SETS[3],
+        _SETS[516],
+        _SETS[517],
+        True,
+        {'text:select-page': _SETS[515]},
+    ),
+    'text:page-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:page-number': (
+        _SETS[3],
+        _SETS[519],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15], 'text:fixed': _SETS[15], 'text:select-page': _SETS[518]},
+    ),
+    'text:page-sequence': (
+        _SETS[520],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:page-variable-get': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:page-variable-set': (
+        _SETS[3],
+        _SETS[521],
+        _SETS[3],
+        True,
+        {'text:active': _SETS[15]},
+    ),
+    'text:paragraph-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:placeholder': (
+        _SETS[3],
+        _SETS[523],
+        _SETS[524],
+        True,
+        {'text:placeholder-type': _SETS[522]},
+    ),
+    'text:print-date': (
+        _SETS[3],
+        _SETS[426],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:print-time': (
+        _SETS[3],
+        _SETS[427],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:printed-by': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:reference-mark': (
+        _SETS[3],
+        _SETS[393],
+        _SETS[393],
+        False,
+        _NO_VALUES,
+    ),
+    'text:reference-mark-end': (
+        _SETS[3],
+        _SETS[393],
+        _SETS[393],
+        False,
+        _NO_VALUES,
+    ),
+    'text:reference-mark-start': (
+        _SETS[3],
+        _SETS[393],
+        _SETS[393],
+        False,
+        _NO_VALUES,
+    ),
+    'text:reference-ref': (
+        _SETS[3],
+        _SETS[416],
+        _SETS[3],
+        True,
+        {'text:reference-format': _SETS[415]},
+    ),
+    'text:ruby': (
+        _SETS[525],
+        _SETS[458],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:ruby-base': (
+        _SETS[491],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:ruby-text': (
+        _SETS[3],
+        _SETS[458],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:s': (
+        _SETS[3],
+        _SETS[526],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:script': (
+        _SETS[3],
+        _SETS[527],
+        _SETS[3],
+        True,
+        {'xlink:type': _SETS[2]},
+    ),
+    'text:section': (
+        _SETS[528],
+        _SETS[529],
+        _SETS[393],
+        False,
+        {'text:display': _SETS[242], 'text:protected': _SETS[15]},
+    ),
+    'text:section-source': (
+        _SETS[3],
+        _SETS[530],
+        _SETS[3],
+        False,
+        {'xlink:show': _SETS[81], 'xlink:type': _SETS[2]},
+    ),
+    'text:sender-city': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-company': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-country': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-email': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-fax': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-firstname': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-initials': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-lastname': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-phone-private': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-phone-work': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-position': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-postal-code': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-state-or-province': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-street': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sender-title': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:sequence': (
+        _SETS[3],
+        _SETS[531],
+        _SETS[393],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:sequence-decl': (
+        _SETS[3],
+        _SETS[532],
+        _SETS[533],
+        False,
+        _NO_VALUES,
+    ),
+    'text:sequence-decls': (
+        _SETS[534],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:sequence-ref': (
+        _SETS[3],
+        _SETS[416],
+        _SETS[3],
+        True,
+        {'text:reference-format': _SETS[535]},
+    ),
+    'text:sheet-name': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:soft-page-break': (
+        _SETS[3],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:sort-key': (
+        _SETS[3],
+        _SETS[536],
+        _SETS[537],
+        False,
+        {'text:key': _SETS[463], 'text:sort-ascending': _SETS[15]},
+    ),
+    'text:span': (
+        _SETS[491],
+        _SETS[538],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:subject': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:tab': (
+        _SETS[3],
+        _SETS[539],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:table-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+    'text:table-formula': (
+        _SETS[3],
+        _SETS[540],
+        _SETS[3],
+        True,
+        {'text:display': _SETS[445]},
+    ),
+    'text:table-index': (
+        _SETS[541],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:table-index-entry-template': (
+        _SETS[395],
+        _SETS[458],
+        _SETS[458],
+        False,
+        _NO_VALUES,
+    ),
+    'text:table-index-source': (
+        _SETS[542],
+        _SETS[461],
+        _SETS[3],
+        False,
+        {'text:caption-sequence-format': _SETS[459], 'text:index-scope': _SETS[401], 'text:relative-tab-stop-position': _SETS[15], 'text:use-caption': _SETS[15]},
+    ),
+    'text:table-of-content': (
+        _SETS[543],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:table-of-content-entry-template': (
+        _SETS[544],
+        _SETS[396],
+        _SETS[396],
+        False,
+        _NO_VALUES,
+    ),
+    'text:table-of-content-source': (
+        _SETS[545],
+        _SETS[546],
+        _SETS[3],
+        False,
+        {'text:index-scope': _SETS[401], 'text:relative-tab-stop-position': _SETS[15], 'text:use-index-marks': _SETS[15], 'text:use-index-source-styles': _SETS[15], 'text:use-outline-level': _SETS[15]},
+    ),
+    'text:template-name': (
+        _SETS[3],
+        _SETS[548],
+        _SETS[3],
+        True,
+        {'text:display': _SETS[547]},
+    ),
+    'text:text-input': (
+        _SETS[3],
+        _SETS[549],
+        _SETS[3],
+        True,
+        _NO_VALUES,
+    ),
+    'text:time': (
+        _SETS[3],
+        _SETS[550],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:title': (
+        _SETS[3],
+        _SETS[404],
+        _SETS[3],
+        True,
+        {'text:fixed': _SETS[15]},
+    ),
+    'text:toc-mark': (
+        _SETS[3],
+        _SETS[551],
+        _SETS[398],
+        False,
+        _NO_VALUES,
+    ),
+    'text:toc-mark-end': (
+        _SETS[3],
+        _SETS[399],
+        _SETS[399],
+        False,
+        _NO_VALUES,
+    ),
+    'text:toc-mark-start': (
+        _SETS[3],
+        _SETS[552],
+        _SETS[399],
+        False,
+        _NO_VALUES,
+    ),
+    'text:tracked-changes': (
+        _SETS[553],
+        _SETS[554],
+        _SETS[3],
+        False,
+        {'text:track-changes': _SETS[15]},
+    ),
+    'text:user-defined': (
+        _SETS[3],
+        _SETS[555],
+        _SETS[393],
+        True,
+        {'office:boolean-value': _SETS[15], 'text:fixed': _SETS[15]},
+    ),
+    'text:user-field-decl': (
+        _SETS[3],
+        _SETS[556],
+        _SETS[557],
+        False,
+        {'office:boolean-value': _SETS[15], 'office:value-type': _SETS[256]},
+    ),
+    'text:user-field-decls': (
+        _SETS[558],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:user-field-get': (
+        _SETS[3],
+        _SETS[560],
+        _SETS[393],
+        True,
+        {'text:display': _SETS[559]},
+    ),
+    'text:user-field-input': (
+        _SETS[3],
+        _SETS[561],
+        _SETS[393],
+        True,
+        _NO_VALUES,
+    ),
+    'text:user-index': (
+        _SETS[562],
+        _SETS[392],
+        _SETS[393],
+        False,
+        {'text:protected': _SETS[15]},
+    ),
+    'text:user-index-entry-template': (
+        _SETS[395],
+        _SETS[396],
+        _SETS[396],
+        False,
+        _NO_VALUES,
+    ),
+    'text:user-index-mark': (
+        _SETS[3],
+        _SETS[563],
+        _SETS[564],
+        False,
+        _NO_VALUES,
+    ),
+    'text:user-index-mark-end': (
+        _SETS[3],
+        _SETS[399],
+        _SETS[399],
+        False,
+        _NO_VALUES,
+    ),
+    'text:user-index-mark-start': (
+        _SETS[3],
+        _SETS[565],
+        _SETS[566],
+        False,
+        _NO_VALUES,
+    ),
+    'text:user-index-source': (
+        _SETS[567],
+        _SETS[568],
+        _SETS[569],
+        False,
+        {'text:copy-outline-levels': _SETS[15], 'text:index-scope': _SETS[401], 'text:relative-tab-stop-position': _SETS[15], 'text:use-floating-frames': _SETS[15], 'text:use-graphics': _SETS[15], 'text:use-index-marks': _SETS[15], 'text:use-index-source-styles': _SETS[15], 'text:use-objects': _SETS[15], 'text:use-tables': _SETS[15]},
+    ),
+    'text:variable-decl': (
+        _SETS[3],
+        _SETS[557],
+        _SETS[557],
+        False,
+        {'office:value-type': _SETS[256]},
+    ),
+    'text:variable-decls': (
+        _SETS[570],
+        _SETS[3],
+        _SETS[3],
+        False,
+        _NO_VALUES,
+    ),
+    'text:variable-get': (
+        _SETS[3],
+        _SETS[560],
+        _SETS[393],
+        True,
+        {'text:display': _SETS[445]},
+    ),
+    'text:variable-input': (
+        _SETS[3],
+        _SETS[572],
+        _SETS[557],
+        True,
+        {'office:value-type': _SETS[256], 'text:display': _SETS[571]},
+    ),
+    'text:variable-set': (
+        _SETS[3],
+        _SETS[573],
+        _SETS[557],
+        True,
+        {'office:boolean-value': _SETS[15], 'office:value-type': _SETS[256], 'text:display': _SETS[571]},
+    ),
+    'text:word-count': (
+        _SETS[3],
+        _SETS[423],
+        _SETS[3],
+        True,
+        {'style:num-letter-sync': _SETS[15]},
+    ),
+}
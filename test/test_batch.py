@@ -0,0 +1,96 @@
+import io
+import multiprocessing
+import os
+import pickle
+
+import pytest
+
+import odio
+import odio.batch
+
+
+def make_spreadsheet(value):
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", [["veni", value]])
+    return f.getvalue()
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many(tmpdir, ordered):
+    path = tmpdir.join("plan.ods")
+    path.write_binary(make_spreadsheet(0))
+    sources = [str(path), b"not a spreadsheet"] + [
+        io.BytesIO(make_spreadsheet(i)) for i in range(1, 6)
+    ]
+
+    results = list(odio.parse_many(sources, workers=2, chunk_size=2, ordered=ordered))
+    if ordered:
+        assert [r.index for r in results] == list(range(7))
+    results.sort(key=lambda r: r.index)
+
+    assert results[0].source == str(path)
+    assert results[0].value == [("Plan", [("veni", 0.0)])]
+    assert results[1].value is None
+    assert results[1].error.startswith("ExpatError: ")
+    for i in range(1, 6):
+        assert results[i + 1].error is None
+        assert results[i + 1].value == [("Plan", [("veni", float(i))])]
+
+
+def _parse_or_die(f, limits):
+    data = f.read()
+    if data == b"die":
+        os._exit(1)
+    return data.decode("utf8")
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="The workers only see the patched parsers if they're forked",
+)
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many_worker_dies(monkeypatch, ordered):
+    # A worker that dies only fails the chunks that were running at the time
+    monkeypatch.setitem(odio.batch.PARSERS, "die", _parse_or_die)
+    sources = [b"0", b"1", b"die", b"3", b"4", b"5", b"6", b"7", b"8"]
+    results = list(odio.parse_many(sources, kind="die", workers=2, ordered=ordered))
+    if ordered:
+        assert [r.index for r in results] == list(range(9))
+    failed = [r.index for r in results if r.error is not None]
+    assert 2 in failed and len(failed) <= 2
+    for result in results:
+        if result.error is None:
+            assert result.value == str(result.index)
+        else:
+            assert result.error.startswith("BrokenProcessPool: ")
+
+
+def test_parse_many_text():
+    nodes = [odio.H("Book One"), odio.P("veni", odio.S(text_c="2"), "vidi")]
+    f = io.BytesIO()
+    with odio.create_text(f) as txt:
+        txt.append(*nodes)
+
+    # Text nodes share their default attributes, so they have their own pickling
+    assert pickle.loads(pickle.dumps(nodes)) == nodes
+
+    results = list(odio.parse_many([f.getvalue()] * 3, kind="text", workers=2))
+    assert [r.value for r in results] == [nodes] * 3
+
+    with pytest.raises(Exception, match="The kind 'sheet' isn't recognized"):
+        list(odio.parse_many([], kind="sheet"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_limits(workers):
+    small = make_spreadsheet(0)
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", [["veni", i] for i in range(100)])
+    big = f.getvalue()
+
+    limits = odio.Limits(max_rows=10)
+    results = list(odio.parse_many([small, big], workers=workers, limits=limits))
+    assert results[0].value == [("Plan", [("veni", 0.0)])]
+    assert results[1].error == "LimitExceeded: The document has more than 10 rows."
@@ -0,0 +1,79 @@
+import multiprocessing
+import os
+
+import pytest
+
+import odio
+import odio.cli
+from odio.cli import convert, main
+
+
+def test_csv_ods_round_trip(tmpdir):
+    for name in ("plan", "keats"):
+        tmpdir.join(f"{name}.csv").write("veni,,0.3\nvidi,5,\n")
+    tmpdir.join("bad.ods").write("not a zip file")
+    csv_files = [str(tmpdir.join(n)) for n in ("plan.csv", "keats.csv")]
+
+    assert main(["csv2ods", "--numbers", "--jobs", "2"] + csv_files) == 0
+    with open(str(tmpdir.join("plan.ods")), "rb") as f:
+        sheet = odio.parse_spreadsheet(f)
+    assert sheet.tables[0].name == "plan"
+    assert sheet.tables[0].rows == [["veni", None, 0.3], ["vidi", 5.0, None]]
+
+    out_dir = tmpdir.mkdir("out")
+    ods_files = [str(tmpdir.join(n)) for n in ("plan.ods", "bad.ods", "keats.ods")]
+    assert main(["ods2csv", "-j", "2", "-o", str(out_dir)] + ods_files) == 1
+    assert out_dir.join("plan.csv").read() == "veni,,0.3\nvidi,5\n"
+    assert out_dir.join("keats.csv").read() == "veni,,0.3\nvidi,5\n"
+    assert not out_dir.join("bad.csv").exists()
+
+
+def test_failure_keeps_existing_output(tmpdir):
+    tmpdir.join("plan.csv").write("veni,vidi\n")
+    assert main(["csv2ods", str(tmpdir.join("plan.csv"))]) == 0
+    tmpdir.join("plan.csv").write("existing\n")
+
+    args = ["ods2csv", "--table", "Missing", str(tmpdir.join("plan.ods"))]
+    assert main(args) == 1
+    assert tmpdir.join("plan.csv").read() == "existing\n"
+    assert sorted(p.basename for p in tmpdir.listdir()) == ["plan.csv", "plan.ods"]
+
+
+def test_same_output(tmpdir, capsys):
+    # Inputs that would write the same output file are errors, and aren't converted
+    for name in ("a", "b"):
+        tmpdir.mkdir(name).join("x.csv").write("veni,vidi\n")
+    tmpdir.join("y.csv").write("veni,vidi\n")
+    out_dir = tmpdir.mkdir("out")
+    files = [str(tmpdir.join(p)) for p in ("a/x.csv", "b/x.csv", "y.csv")]
+
+    assert main(["csv2ods", "-j", "2", "-o", str(out_dir)] + files) == 1
+    _, err = capsys.readouterr()
+    assert f"{files[0]}: The output file " in err
+    assert f"{files[1]}: The output file " in err
+    assert sorted(p.basename for p in out_dir.listdir()) == ["y.ods"]
+
+
+def _convert_or_die(mode, src, dst, options):
+    if src.endswith("die.csv"):
+        os._exit(1)
+    return convert(mode, src, dst, options)
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="The workers only see the patched conversion if they're forked",
+)
+def test_worker_dies(tmpdir, monkeypatch, capsys):
+    # A worker that dies fails files rather than main(), and the summary is printed
+    monkeypatch.setattr(odio.cli, "convert", _convert_or_die)
+    names = ["plan", "die", "keats"]
+    for name in names:
+        tmpdir.join(f"{name}.csv").write("veni,vidi\n")
+    csv_files = [str(tmpdir.join(f"{name}.csv")) for name in names]
+
+    assert main(["csv2ods", "--jobs", "2"] + csv_files) == 1
+    out, err = capsys.readouterr()
+    assert f"{csv_files[1]}: BrokenProcessPool: " in err
+    assert out.startswith("Converted ")
+    assert out.split()[3] == "3"
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+
+def import_times(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("imported package"):
+            modules.add(line.split("|")[-1].strip())
+    return modules
+
+
+# -X importtime doesn't report modules loaded through importlib.import_module, so the
+# on-demand imports are checked with sys.modules.
+def imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy():
+    modules = import_times("import odio")
+    assert "odio" in modules
+    for name in (
+        "decimal",
+        "odio.v1_1",
+        "odio.v1_2",
+        "odio.text",
+        "tempfile",
+        "xml.dom.minidom",
+        "zipfile",
+    ):
+        assert name not in modules
+
+
+def test_version_module_on_demand():
+    modules = imported_modules("import odio; odio.v1_2")
+    assert "odio.v1_2" in modules
+    assert "odio.v1_1" not in modules
+
+
+def test_submodule_on_demand():
+    modules = imported_modules("import odio; odio.batch; odio.common")
+    assert "odio.batch" in modules
+    assert "odio.text" not in modules
+
+
+def test_unknown_attribute():
+    modules = imported_modules("import odio; assert not hasattr(odio, 'x')")
+    assert "odio.text" not in modules
+    modules = imported_modules("import odio; assert not hasattr(odio, 'X')")
+    assert "odio.v1_2" not in modules
+
+
+def test_version_module_is_lazy():
+    modules = import_times("import odio.v1_2")
+    assert "odio.v1_2" in modules
+    for name in (
+        "difflib",
+        "hashlib",
+        "heapq",
+        "json",
+        "odio.text",
+        "pickle",
+        "queue",
+        "xml.dom.expatbuilder",
+        "xml.dom.minidom",
+    ):
+        assert name not in modules
@@ -1,8 +1,14 @@
 import datetime
+import decimal
+import io
 import os
+import threading
 import zipfile
+import zlib
 from xml.dom.minidom import parseString
 
+import pytest
+
 import odio
 
 
@@ -94,3 +100,1063 @@ def test_get_text():
 
     val = odio.v1_2._get_text(dom)
     assert val == ""
+
+
+def test_iter_text(tmpdir):
+    fname = str(tmpdir.join("test.odt"))
+    with open(fname, "wb") as f, odio.create_text(f, "1.2") as txt:
+        txt.append(
+            odio.H("Book One"),
+            odio.P("From my grandfather ", odio.Span("Verus"), " I learned."),
+            odio.P("Dombey & Son", text_style_name="Title"),
+        )
+
+    with open(fname, "rb") as f:
+        nodes = list(odio.iter_text(f))
+
+    expected = odio.parse_text(open(fname, "rb")).nodes
+    assert repr(nodes) == repr(expected)
+
+
+def test_iter_text_deep(tmpdir):
+    depth = 5000
+    content = (
+        '<office:document-content xmlns:office="office" xmlns:text="text">'
+        "<office:body><office:text>"
+        + "<text:span>" * depth
+        + "deep"
+        + "</text:span>" * depth
+        + "<text:p>shallow</text:p>"
+        + "</office:text></office:body></office:document-content>"
+    )
+    fname = str(tmpdir.join("deep.odt"))
+    with zipfile.ZipFile(fname, "w") as z:
+        z.writestr("content.xml", content)
+
+    with open(fname, "rb") as f:
+        span, p = odio.iter_text(f)
+
+    for i in range(depth - 1):
+        (span,) = span.nodes
+    assert span.nodes == ["deep"]
+    assert repr(p) == "odio.P('shallow')"
+
+
+def test_iter_text_unknown_elements(tmpdir):
+    # Elements without a text element class are skipped along with their contents
+    content = (
+        '<office:document-content xmlns:office="office" xmlns:text="text" '
+        'xmlns:draw="draw" xmlns:table="table" office:version="1.2">'
+        "<office:body><office:text>"
+        "<office:forms/>"
+        "<text:p>a<draw:frame><draw:text-box><text:p>in frame</text:p>"
+        "</draw:text-box></draw:frame>b</text:p>"
+        "<table:table><table:table-row><table:table-cell><text:p>in table</text:p>"
+        "</table:table-cell></table:table-row></table:table>"
+        "<text:p>c</text:p>"
+        "</office:text></office:body></office:document-content>"
+    )
+    nodes = list(odio.iter_text(io.BytesIO(content.encode("utf8"))))
+    assert repr(nodes) == "[odio.P('a', 'b'), odio.P('c')]"
+
+    fname = str(tmpdir.join("unknown.odt"))
+    with zipfile.ZipFile(fname, "w") as z:
+        z.writestr("content.xml", content)
+    with open(fname, "rb") as f:
+        assert odio.parse_text(f).nodes == nodes
+
+
+def test_extract_text(tmpdir):
+    content = """<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content xmlns:office="office" xmlns:text="text">
+  <office:body>
+    <office:text>
+      <text:h>
+        Book   One
+      </text:h>
+      <text:p>Verus<text:s text:c="3"/>said:<text:tab/>"be <text:span>good</text:span>
+        <text:line-break/>always"</text:p>
+      <text:p> Caf\u00e9\u00a0  au lait </text:p>
+    </office:text>
+  </office:body>
+</office:document-content>"""
+    fname = str(tmpdir.join("test.odt"))
+    with zipfile.ZipFile(fname, "w") as z:
+        z.writestr("content.xml", content)
+
+    with open(fname, "rb") as f:
+        assert odio.extract_text(f) == (
+            'Book One\nVerus   said:\t"be good \nalways"\nCaf\u00e9\u00a0 au lait\n'
+        )
+
+
+def test_extract_text_nested():
+    # Footnotes and text boxes come after the paragraph they're in, without the
+    # note citation
+    content = (
+        '<office:document-content xmlns:office="office" xmlns:text="text" '
+        'xmlns:draw="draw"><office:body><office:text>'
+        "<text:p>before<text:note><text:note-citation>1</text:note-citation>"
+        "<text:note-body><text:p>note <text:span>text</text:span></text:p>"
+        "</text:note-body></text:note> after</text:p>"
+        "<text:p>a <draw:frame><draw:text-box><text:p>boxed</text:p>"
+        "<text:p>twice</text:p></draw:text-box></draw:frame>b</text:p>"
+        "</office:text></office:body></office:document-content>"
+    )
+    assert odio.extract_text(io.BytesIO(content.encode("utf8"))) == (
+        "before after\nnote text\na b\nboxed\ntwice\n"
+    )
+
+
+def test_extract_text_spreadsheet(tmpdir):
+    fname = str(tmpdir.join("test.ods"))
+    with open(fname, "wb") as f, odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", [["veni, vidi", 0.3, "Dombey & Son"], ["vici"]])
+
+    with open(fname, "rb") as f:
+        assert list(odio.iter_text_chunks(f)) == ["veni, vidi\nDombey & Son\nvici\n"]
+
+
+def test_create_parse_text(tmpdir):
+    nodes = [
+        odio.H("Book One"),
+        odio.P("From my grandfather ", odio.Span("Verus"), " I learned."),
+        odio.P("Dombey & Son", text_style_name="Title"),
+        odio.P(),
+    ]
+    fname = str(tmpdir.join("test.odt"))
+    with open(fname, "wb") as f, odio.create_text(f, "1.2") as txt:
+        txt.append(*nodes)
+
+    with zipfile.ZipFile(fname) as z:
+        content = z.read("content.xml").decode("utf8")
+    assert '<text:p text:style-name="Title">Dombey &amp; Son</text:p>\n' in content
+    assert odio.parse_text(open(fname, "rb")).nodes == nodes
+
+
+def test_node_default_attrs():
+    p = odio.P("veni")
+    assert p.default_attrs is odio.P("vidi").default_attrs
+    assert p.to_xml() == '<text:p text:style-name="Text Body">veni</text:p>'
+
+    p.attributes["text_style_name"] = "Title"
+    assert odio.P().attributes["text_style_name"] == "Text Body"
+    assert repr(p) == "odio.P('veni', text_style_name='Title')"
+
+
+def test_attribute_names_bounded():
+    # Attribute names from documents don't fill the name caches without limit
+    from odio.common import NAMES_CACHE_SIZE, python_name
+
+    names = "".join(f' text:a{i}="x"' for i in range(NAMES_CACHE_SIZE * 2))
+    content = (
+        '<office:document-content xmlns:office="office" xmlns:text="text" '
+        'office:version="1.2"><office:body><office:text>'
+        f"<text:p{names}>veni</text:p>"
+        "</office:text></office:body></office:document-content>"
+    )
+    (p,) = odio.iter_text(io.BytesIO(content.encode("utf8")))
+    assert p.attributes["text_a0"] == "x"
+    assert python_name.cache_info().currsize <= NAMES_CACHE_SIZE
+
+
+def test_inspect_spreadsheet(tmpdir):
+    content = """<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content
+    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+    xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+    xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+    office:version="1.2">
+  <office:body>
+    <office:spreadsheet>
+      <table:table table:name="Plan">
+        <table:table-column table:number-columns-repeated="1024"/>
+        <table:table-row table:number-rows-repeated="2">
+          <table:table-cell office:value-type="float" office:value="1"
+              table:number-columns-repeated="3"/>
+          <table:table-cell office:value-type="string">
+            <text:p>veni</text:p>
+          </table:table-cell>
+          <table:table-cell table:number-columns-repeated="1020"/>
+        </table:table-row>
+        <table:table-row>
+          <table:table-cell table:number-columns-repeated="5"/>
+          <table:table-cell table:formula="of:=[.A1]"/>
+        </table:table-row>
+        <table:table-row table:number-rows-repeated="1048573">
+          <table:table-cell table:number-columns-repeated="1024"/>
+        </table:table-row>
+      </table:table>
+      <table:table table:name="Empty">
+        <table:table-row>
+          <table:table-cell/>
+        </table:table-row>
+      </table:table>
+    </office:spreadsheet>
+  </office:body>
+</office:document-content>"""
+    meta = """<?xml version="1.0" encoding="UTF-8"?>
+<office:document-meta
+    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0"
+    office:version="1.2">
+  <office:meta>
+    <meta:generator>Odio</meta:generator>
+    <dc:title>Plan</dc:title>
+    <meta:document-statistic meta:table-count="2" meta:cell-count="9"/>
+    <meta:user-defined meta:name="Author">Keats</meta:user-defined>
+  </office:meta>
+</office:document-meta>"""
+    fname = str(tmpdir.join("test.ods"))
+    with zipfile.ZipFile(fname, "w") as z:
+        z.writestr("content.xml", content)
+        z.writestr("meta.xml", meta)
+
+    with open(fname, "rb") as f:
+        info = odio.inspect_spreadsheet(f)
+
+    assert info.version == "1.2"
+    plan, empty = info.tables
+    assert plan.name == "Plan"
+    assert plan.row_count == 3
+    assert plan.column_count == 6
+    assert plan.value_types == {"float": 6, "string": 2, "formula": 1}
+    assert (empty.name, empty.row_count, empty.column_count) == ("Empty", 0, 0)
+    assert info.meta == {
+        "meta:generator": "Odio",
+        "dc:title": "Plan",
+        "meta:table-count": "2",
+        "meta:cell-count": "9",
+    }
+    assert info.user_defined == {"Author": "Keats"}
+
+
+def test_styles(tmpdir):
+    bold = odio.Style(bold=True)
+    pounds = odio.Style(currency="GBP", currency_symbol="£", grouping=True)
+    rows = [[odio.Cell("Name", bold), odio.Cell("Price", bold)]] + [
+        ["veni", odio.Cell(i, pounds)] for i in range(100)
+    ]
+    rows.append(
+        [
+            odio.Cell(0.3, odio.Style(percentage=True, bold=True)),
+            odio.Cell(datetime.datetime(2015, 6, 30, 16, 38), bold),
+        ]
+    )
+    fname = str(tmpdir.join("test.ods"))
+    with open(fname, "wb") as f, odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", rows)
+
+    with zipfile.ZipFile(fname) as z:
+        dom = parseString(z.read("content.xml"))
+    styles = {
+        e.getAttribute("style:name"): e for e in dom.getElementsByTagName("style:style")
+    }
+    assert sorted(styles) == ["ce1", "ce2", "ce3", "ce4", "cell_date"]
+    cells = dom.getElementsByTagName("table:table-cell")
+    assert cells[0].getAttribute("table:number-columns-repeated") == ""
+    assert cells[0].getAttribute("table:style-name") == "ce1"
+    price = styles[cells[3].getAttribute("table:style-name")]
+    assert cells[3].getAttribute("office:value-type") == "currency"
+    assert cells[3].getAttribute("office:currency") == "GBP"
+    (currency_style,) = dom.getElementsByTagName("number:currency-style")
+    assert price.getAttribute("style:data-style-name") == currency_style.getAttribute(
+        "style:name"
+    )
+    assert cells[-2].getAttribute("office:value-type") == "percentage"
+    date_style = styles[cells[-1].getAttribute("table:style-name")]
+    assert date_style.getAttribute("style:data-style-name") == "date"
+    assert len(date_style.getElementsByTagName("style:text-properties")) == 1
+
+    # Currency and percentage values are read back with their data styles
+    price = odio.Style(
+        currency="GBP", currency_symbol="£", grouping=True, decimal_places=2
+    )
+    percent = odio.Style(percentage=True, decimal_places=0)
+    with open(fname, "rb") as f:
+        ((_, rows),) = [(n, list(rows)) for n, rows in odio.iter_spreadsheet(f)]
+    assert rows[2] == ("veni", odio.Cell(decimal.Decimal("1"), price))
+    assert rows[-1][0] == odio.Cell(0.3, percent)
+    with open(fname, "rb") as f:
+        sheet = odio.parse_spreadsheet(f)
+    assert sheet.tables[0].rows[2] == ["veni", odio.Cell(decimal.Decimal("1"), price)]
+
+
+STYLES_XML = """<?xml version="1.0" encoding="utf-8"?>
+<office:document-styles {namespaces} office:version="1.2">
+  {styles}
+</office:document-styles>
+"""
+
+CONTENT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<{root} {namespaces} office:version="1.2"{mimetype}>
+  {styles}
+  <office:automatic-styles>
+    <number:date-style style:name="N1">
+      <number:day/><number:text>/</number:text><number:month/>
+    </number:date-style>
+    <number:time-style style:name="N2">
+      <number:hours/><number:text>:</number:text><number:minutes/>
+    </number:time-style>
+    <style:style style:name="ce1" style:family="table-cell"
+        style:data-style-name="N1"/>
+    <style:style style:name="ce2" style:family="table-cell"
+        style:data-style-name="N2"/>
+    <style:style style:name="ce3" style:family="table-cell"
+        style:parent-style-name="Money"/>
+  </office:automatic-styles>
+  <office:body>
+    <office:spreadsheet>
+      <table:table table:name="Plan">
+        <table:table-row>
+          <table:table-cell office:value-type="date" office:date-value="2015-06-30"/>
+          <table:table-cell table:style-name="ce1" office:value-type="date"
+              office:date-value="2015-06-30T00:00:00"/>
+          <table:table-cell office:value-type="date"
+              office:date-value="2015-06-30T16:38:00.5"/>
+          <table:table-cell table:style-name="ce2" office:value-type="time"
+              office:time-value="PT16H38M00S"/>
+          <table:table-cell table:style-name="Duration" office:value-type="time"
+              office:time-value="PT02H30M00S"/>
+          <table:table-cell office:value-type="time" office:time-value="PT36H"/>
+          <table:table-cell table:style-name="ce3" office:value-type="currency"
+              office:currency="EUR" office:value="-12.50"/>
+          <table:table-cell office:value-type="percentage" office:value="0.25"/>
+        </table:table-row>
+      </table:table>
+    </office:spreadsheet>
+  </office:body>
+</{root}>
+"""
+
+COMMON_STYLES = """<office:styles>
+    <number:time-style style:name="N3" number:truncate-on-overflow="false">
+      <number:hours/><number:text>:</number:text><number:minutes/>
+    </number:time-style>
+    <number:currency-style style:name="N4">
+      <number:number number:decimal-places="2" number:grouping="true"/>
+      <number:currency-symbol number:language="de">€</number:currency-symbol>
+    </number:currency-style>
+    <style:style style:name="Duration" style:family="table-cell"
+        style:data-style-name="N3"/>
+    <style:style style:name="Money" style:family="table-cell"
+        style:data-style-name="N4"/>
+  </office:styles>"""
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_read_styles(flat):
+    namespaces = " ".join(
+        f'xmlns:{k}="urn:oasis:names:tc:opendocument:xmlns:{v}:1.0"'
+        for k, v in [
+            ("office", "office"),
+            ("style", "style"),
+            ("table", "table"),
+            ("number", "datastyle"),
+        ]
+    )
+    if flat:
+        data = CONTENT_XML.format(
+            root="office:document",
+            namespaces=namespaces,
+            mimetype=(
+                ' office:mimetype="application/vnd.oasis.opendocument.spreadsheet"'
+            ),
+            styles=COMMON_STYLES,
+        ).encode("utf8")
+    else:
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w") as z:
+            z.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet")
+            z.writestr(
+                "styles.xml",
+                STYLES_XML.format(namespaces=namespaces, styles=COMMON_STYLES),
+            )
+            z.writestr(
+                "content.xml",
+                CONTENT_XML.format(
+                    root="office:document-content",
+                    namespaces=namespaces,
+                    mimetype="",
+                    styles="",
+                ),
+            )
+        data = f.getvalue()
+
+    money = odio.Style(
+        currency="EUR", currency_symbol="€", grouping=True, decimal_places=2
+    )
+    expected = [
+        datetime.date(2015, 6, 30),
+        datetime.date(2015, 6, 30),
+        datetime.datetime(2015, 6, 30, 16, 38, 0, 500000),
+        datetime.time(16, 38),
+        datetime.timedelta(hours=2, minutes=30),
+        datetime.timedelta(hours=36),
+        odio.Cell(decimal.Decimal("-12.50"), money),
+        odio.Cell(0.25, odio.Style(percentage=True)),
+    ]
+    ((_, rows),) = [
+        (n, list(rows)) for n, rows in odio.iter_spreadsheet(io.BytesIO(data))
+    ]
+    assert rows == [tuple(expected)]
+    sheet = odio.parse_spreadsheet(io.BytesIO(data))
+    assert sheet.tables[0].rows == [expected]
+
+
+def test_crc32_combine():
+    a, b = b"veni, vidi, ", b"vici"
+    assert odio.v1_2.crc32_combine(zlib.crc32(a), zlib.crc32(b), len(b)) == (
+        zlib.crc32(a + b)
+    )
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_package_parts(compressed):
+    # The static parts are compressed once and shared by all the packages
+    packages = []
+    for _ in range(2):
+        f = io.BytesIO()
+        with odio.create_spreadsheet(f, compressed=compressed) as sheet:
+            sheet.append_table("Plan", [["veni"]])
+        packages.append(f)
+    parts = odio.v1_2.PACKAGE_PARTS[(odio.v1_2.SPREADSHEET_MIMETYPE, compressed)]
+
+    for f in packages:
+        with zipfile.ZipFile(f) as z:
+            assert z.testzip() is None
+            for (name, text), (part_name, part) in zip(
+                odio.v1_2.package_parts(odio.v1_2.SPREADSHEET_MIMETYPE), parts
+            ):
+                assert name == part_name
+                assert z.read(name) == text.encode("utf8")
+                assert z.getinfo(name).CRC == part.crc
+
+
+def test_append_after_close():
+    sheet = odio.create_spreadsheet(io.BytesIO())
+    table = sheet.open_table("Plan")
+    table.append_row([1])
+    sheet.close()
+    with pytest.raises(Exception, match="The table 'Plan' has already been closed."):
+        table.append_row([2])
+    with pytest.raises(Exception, match="The spreadsheet has already been closed."):
+        sheet.open_table("Keats")
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_open_table_threads(tmpdir, compressed):
+    fname = str(tmpdir.join("test.ods"))
+    with open(fname, "wb") as f, odio.create_spreadsheet(f, compressed=compressed) as s:
+        tables = [s.open_table(name) for name in ("Plan", "Keats", "Dombey")]
+
+        def write(table, count):
+            with table:
+                for i in range(count):
+                    table.append_row([table is tables[0], i, f"row {i}"])
+
+        threads = [
+            threading.Thread(target=write, args=(table, 1000 - i * 300))
+            for i, table in enumerate(tables)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        s.append_table("Last", [["vici"]])
+
+    with zipfile.ZipFile(fname) as z:
+        assert z.testzip() is None
+    with open(fname, "rb") as f:
+        sheet = odio.parse_spreadsheet(f)
+    assert [t.name for t in sheet.tables] == ["Plan", "Keats", "Dombey", "Last"]
+    assert [len(t.rows) for t in sheet.tables] == [1000, 700, 400, 1]
+    assert sheet.tables[1].rows[699] == [False, 699.0, "row 699"]
+
+
+def test_append_table_schema():
+    style = odio.Style(bold=True)
+    rows = [
+        [1.5, "veni", datetime.datetime(2015, 6, 30, 16, 38), 3, True],
+        [1.5, "veni", None, 3, False],
+        [0.0, "a & b\nc", datetime.datetime(2015, 6, 30), 3, True, "extra"],
+        [-0.0, "", odio.Cell(2.5, style), 7, None],
+        [None, None, None, None, None],
+        [2, 2.0, odio.Formula("=A1"), True, 1],
+        [decimal.Decimal("1.0"), "x", "x", 4],
+    ]
+    schema = [float, str, datetime.datetime, int, bool]
+    outputs = []
+    for table_schema in (None, schema):
+        f = io.BytesIO()
+        with odio.create_spreadsheet(f, compressed=False) as sheet:
+            sheet.append_table("Plan", rows, table_schema)
+            sheet.append_table("Repeats", [[0.5] * 5 + ["v"] * 3], table_schema)
+        with zipfile.ZipFile(f) as z:
+            outputs.append(z.read("content.xml"))
+    assert outputs[0] == outputs[1]
+
+    with pytest.raises(Exception, match="column type"):
+        with odio.create_spreadsheet(io.BytesIO()) as sheet:
+            sheet.append_table("Plan", [], [list])
+
+
+@pytest.mark.parametrize("sort_buffer", [2, 1000])
+def test_append_sparse_table(tmpdir, sort_buffer):
+    cells = {
+        (10000, 499): "corner",
+        (3, 2): 0.5,
+        (0, 0): "origin",
+        (3, 3): 0.5,
+        (3, 0): "veni",
+        (5000, 250): True,
+    }
+    fname = str(tmpdir.join("test.ods"))
+    with open(fname, "wb") as f, odio.create_spreadsheet(f) as sheet:
+        sheet.append_sparse_table("Sparse", cells, sort_buffer=sort_buffer)
+        sheet.append_sparse_table("Triples", [(1, 1, "vidi")])
+
+    with zipfile.ZipFile(fname) as z:
+        content = z.read("content.xml").decode("utf8")
+    assert 'table:number-rows-repeated="4999"' in content
+    assert 'table:number-columns-repeated="499"' in content
+    assert content.count("<table:table-cell") < 30
+
+    with open(fname, "rb") as f:
+        tables = [(name, list(rows)) for name, rows in odio.iter_spreadsheet(f)]
+    (sparse_name, sparse), triples = tables
+    assert len(sparse) == 10001
+    assert sparse[0] == ("origin",)
+    assert sparse[3] == ("veni", None, 0.5, 0.5)
+    assert sparse[5000] == (None,) * 250 + (True,)
+    assert sparse[10000][499] == "corner"
+    assert triples == ("Triples", [(), (None, "vidi")])
+
+
+def test_append_sparse_table_duplicate(tmpdir):
+    with pytest.raises(Exception, match="appears more than once"):
+        with odio.create_spreadsheet(io.BytesIO()) as sheet:
+            sheet.append_sparse_table("Sparse", [(1, 1, "veni"), (1, 1, "vidi")])
+
+
+def test_diff_spreadsheets(tmpdir):
+    old_rows = [[i, f"row {i}"] for i in range(100)]
+    new_rows = [list(r) for r in old_rows]
+    new_rows[10][1] = "changed"
+    del new_rows[50:53]
+    new_rows[80:80] = [["new", 1], ["new", 2]]
+
+    old_name = str(tmpdir.join("old.ods"))
+    new_name = str(tmpdir.join("new.ods"))
+    with open(old_name, "wb") as f, odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Supplies", old_rows)
+        sheet.append_table("Gone", [[1]])
+    with open(new_name, "wb") as f, odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Supplies", new_rows + [[None, None]] * 3)
+        sheet.append_table("Added", [[1], [2]])
+
+    # Saving the hashes of the old version means it doesn't have to be read again
+    with open(old_name, "rb") as f:
+        hashes = odio.hash_spreadsheet(f)
+    manifest = io.StringIO()
+    hashes.save(manifest)
+    manifest.seek(0)
+    old = odio.load_row_hashes(manifest)
+
+    with open(new_name, "rb") as f:
+        diff = odio.diff_spreadsheets(old, f)
+
+    supplies, added, gone = diff.tables
+    assert supplies.name == "Supplies"
+    assert supplies.changed == [(10, 11)]
+    assert supplies.deleted == [(50, 53)]
+    assert supplies.inserted == [(80, 82)]
+    assert (added.name, added.inserted, added.deleted) == ("Added", [(0, 2)], [])
+    assert (gone.name, gone.inserted, gone.deleted) == ("Gone", [], [(0, 1)])
+
+    with open(new_name, "rb") as f1, open(new_name, "rb") as f2:
+        diff = odio.diff_spreadsheets(f1, f2)
+    assert all(t.inserted == t.deleted == t.changed == [] for t in diff.tables)
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_date_time_round_trip(flat):
+    row = [
+        datetime.date(2015, 6, 30),
+        datetime.time(16, 38),
+        datetime.time(1, 2, 3, 500000),
+        datetime.timedelta(days=1, hours=12),
+        datetime.timedelta(hours=2, minutes=30),
+        -datetime.timedelta(minutes=5),
+        datetime.datetime(2015, 6, 30, 16, 38),
+        odio.Cell(datetime.date(2015, 7, 1), odio.Style(bold=True)),
+    ]
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f, flat=flat, validate=True) as sheet:
+        sheet.append_table("Plan", [row])
+    data = f.getvalue()
+
+    # Only percentage and currency values are read as an odio.Cell
+    expected = row[:-1] + [datetime.date(2015, 7, 1)]
+    tables = [(n, list(rows)) for n, rows in odio.iter_spreadsheet(io.BytesIO(data))]
+    assert tables == [("Plan", [tuple(expected)])]
+    sheet = odio.parse_spreadsheet(io.BytesIO(data))
+    assert sheet.tables[0].rows == [expected]
+
+
+def test_hash_tables_repeats():
+    # The same row hashes the same whether or not its cells are written as repeats
+    content = (
+        '<office:document-content xmlns:office="o" xmlns:table="t" xmlns:text="x">'
+        "<table:table table:name='T'>"
+        "<table:table-row>"
+        "<table:table-cell office:value-type='float' office:value='1'/>"
+        "<table:table-cell office:value-type='float' office:value='1'/>"
+        "<table:table-cell table:number-columns-repeated='100'/>"
+        "</table:table-row>"
+        "<table:table-row table:number-rows-repeated='2'>"
+        "<table:table-cell office:value-type='float' office:value='1' "
+        "table:number-columns-repeated='2'/>"
+        "</table:table-row>"
+        "<table:table-row table:number-rows-repeated='1000'>"
+        "<table:table-cell/>"
+        "</table:table-row>"
+        "</table:table>"
+        "</office:document-content>"
+    )
+    hashes = odio.v1_2.hash_tables(io.BytesIO(content.encode("utf8")))
+    ((name, rows),) = hashes.tables
+    assert name == "T"
+    assert len(rows) == 3
+    assert rows[0] == rows[1] == rows[2]
+
+
+def test_hash_tables_styles():
+    # A document saved again with its automatic styles renumbered has the same rows
+    def content(style):
+        return (
+            '<office:document-content xmlns:office="o" xmlns:table="t" '
+            'xmlns:text="x"><table:table table:name="T"><table:table-row>'
+            f'<table:table-cell table:style-name="{style}" office:value-type="float" '
+            'office:value="1.5"><text:p>1.5</text:p></table:table-cell>'
+            f'<table:table-cell table:style-name="{style}"/>'
+            '<table:table-cell office:value-type="string"><text:p>veni</text:p>'
+            "</table:table-cell></table:table-row></table:table>"
+            "</office:document-content>"
+        ).encode("utf8")
+
+    old = odio.v1_2.hash_tables(io.BytesIO(content("ce1")))
+    new = odio.v1_2.hash_tables(io.BytesIO(content("ce3")))
+    (diff,) = odio.v1_2.diff_row_hashes(old, new).tables
+    assert diff.inserted == diff.deleted == diff.changed == []
+
+
+def test_hash_tables_layout():
+    # Cells with the same characters laid out differently hash differently, and a
+    # cell with an empty paragraph is empty
+    cells = (
+        "<text:p>ab</text:p>",
+        "<text:p>a</text:p><text:p>b</text:p>",
+        "<text:p>a<text:s/>b</text:p>",
+        "<text:p>a<text:s text:c='2'/>b</text:p>",
+        "<text:p>a<text:tab/>b</text:p>",
+        "<text:p>a<text:line-break/>b</text:p>",
+        "<text:p>a</text:p><text:p>tb</text:p>",
+        "<text:p/>",
+    )
+    content = (
+        '<office:document-content xmlns:office="o" xmlns:table="t" xmlns:text="x">'
+        "<table:table table:name='T'>"
+        + "".join(
+            f"<table:table-row><table:table-cell>{c}</table:table-cell>"
+            f"<table:table-cell office:value-type='float' office:value='1'/>"
+            f"</table:table-row>"
+            for c in cells
+        )
+        + "<table:table-row><table:table-cell/>"
+        "<table:table-cell office:value-type='float' office:value='1'/>"
+        "</table:table-row>"
+        "</table:table>"
+        "</office:document-content>"
+    )
+    hashes = odio.v1_2.hash_tables(io.BytesIO(content.encode("utf8")))
+    ((name, rows),) = hashes.tables
+    assert len(set(rows[:-2])) == len(cells) - 1
+    assert rows[-2] == rows[-1]
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.data.readinto(b)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_batches(prefetch):
+    rows = [[i, f"row {i}"] if i % 3 else [i] for i in range(25)]
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Other", [["other"]])
+        sheet.append_table("Plan", rows)
+    data = f.getvalue()
+
+    batches = list(odio.iter_batches(io.BytesIO(data), "Plan", 10, prefetch=prefetch))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[0][:2] == [(0.0,), (1.0, "row 1")]
+
+    batches = odio.iter_batches(
+        io.BytesIO(data), "Plan", 4, columns=True, prefetch=prefetch
+    )
+    assert next(batches) == [(0.0, 1.0, 2.0, 3.0), (None, "row 1", "row 2", None)]
+    batches.close()
+
+    with pytest.raises(Exception, match="Missing"):
+        list(odio.iter_batches(io.BytesIO(data), "Missing", prefetch=prefetch))
+
+
+def test_prefetch_error():
+    def items():
+        yield 1
+        raise ValueError("broken")
+
+    batches = odio.v1_2.prefetch(items(), 1)
+    assert next(batches) == 1
+    with pytest.raises(ValueError, match="broken"):
+        next(batches)
+
+
+def test_limits():
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", [[i, "veni, vidi, vici"] for i in range(2_000)])
+    data = f.getvalue()
+
+    def iter_spreadsheet(data, limits):
+        for _, rows in odio.iter_spreadsheet(io.BytesIO(data), limits=limits):
+            list(rows)
+
+    def parse_spreadsheet(data, limits):
+        odio.parse_spreadsheet(io.BytesIO(data), limits)
+
+    def iter_batches(data, limits):
+        list(odio.iter_batches(io.BytesIO(data), "Plan", 100, limits=limits))
+
+    def aggregate_spreadsheet(data, limits):
+        specs = {"Plan": {0: ["sum"]}}
+        odio.aggregate_spreadsheet(io.BytesIO(data), specs, limits=limits)
+
+    readers = (iter_spreadsheet, parse_spreadsheet, iter_batches, aggregate_spreadsheet)
+    for read in readers:
+        read(data, odio.Limits(max_bytes=10_000_000, max_cells=4_000, max_rows=2_000))
+        for limits, match in [
+            (odio.Limits(max_bytes=100_000), "bytes"),
+            (odio.Limits(max_cells=3_999), "cells"),
+            (odio.Limits(max_rows=1_999), "rows"),
+            (odio.Limits(max_depth=5), "nested"),
+            (odio.Limits(timeout=0), "seconds"),
+        ]:
+            with pytest.raises(odio.LimitExceeded, match=match):
+                read(data, limits)
+
+    # Huge repeats are stopped before they're expanded
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f, flat=True) as sheet:
+        sheet.append_table("Plan", [[None, "veni"], [None], ["vidi"]])
+    flat_data = f.getvalue()
+    limits = odio.Limits(max_cells=1000, max_rows=1000)
+    data = flat_data.replace(
+        b"<table:table-cell/>",
+        b'<table:table-cell table:number-columns-repeated="1000000000"/>',
+    )
+    for read in readers:
+        with pytest.raises(odio.LimitExceeded, match="cells"):
+            read(data, limits)
+
+    data = flat_data.replace(
+        b"<table:table-row>",
+        b'<table:table-row table:number-rows-repeated="1000000000">',
+    )
+    for read in (iter_spreadsheet, iter_batches, aggregate_spreadsheet):
+        with pytest.raises(odio.LimitExceeded, match="rows"):
+            read(data, limits)
+
+    # Counting cells also checks the time, for a row with a great many cells
+    budget = odio.v1_2.Budget(odio.Limits(timeout=-1))
+    with pytest.raises(odio.LimitExceeded, match="seconds"):
+        budget.add_cells(1)
+
+
+def test_limits_zip_bomb():
+    # A small package that inflates to a great deal of XML is stopped a chunk at a
+    # time, whichever reader it's given to
+    row = b"<table:table-row><table:table-cell/></table:table-row>"
+    content = (
+        b'<office:document-content xmlns:office="o" xmlns:table="t" xmlns:text="x" '
+        b'office:version="1.2"><office:body><office:spreadsheet>'
+        b"<table:table table:name='Bomb'>"
+        + row * 100_000
+        + b"</table:table></office:spreadsheet></office:body>"
+        b"</office:document-content>"
+    )
+    f = io.BytesIO()
+    with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("content.xml", content)
+        z.writestr("meta.xml", b"<office:document-meta/>")
+    data = f.getvalue()
+    assert len(data) < len(content) // 100
+
+    limits = odio.Limits(max_bytes=1_000_000)
+    for read in (
+        odio.inspect_spreadsheet,
+        odio.hash_spreadsheet,
+        odio.extract_text,
+        lambda f, limits: list(odio.iter_text_chunks(f, limits)),
+    ):
+        with pytest.raises(odio.LimitExceeded, match="bytes"):
+            read(io.BytesIO(data), limits)
+    info = odio.inspect_spreadsheet(io.BytesIO(data), odio.Limits(max_bytes=10_000_000))
+    assert repr(info.tables) == (
+        "[odio.v1_2.TableInfo('Bomb', row_count=0, column_count=0, value_types={})]"
+    )
+
+    # Repeats are counted without being expanded
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", [["veni", 1.0]])
+    data = f.getvalue()
+    f = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as z_in, zipfile.ZipFile(f, "w") as z_out:
+        for item in z_in.infolist():
+            part = z_in.read(item.filename)
+            if item.filename == "content.xml":
+                part = part.replace(
+                    b"<table:table-row>",
+                    b'<table:table-row table:number-rows-repeated="1000000000">',
+                )
+            z_out.writestr(item, part)
+    data = f.getvalue()
+    limits = odio.Limits(max_rows=1000)
+    for read in (odio.inspect_spreadsheet, odio.hash_spreadsheet):
+        with pytest.raises(odio.LimitExceeded, match="rows"):
+            read(io.BytesIO(data), limits)
+    with pytest.raises(odio.LimitExceeded, match="nested"):
+        odio.extract_text(io.BytesIO(data), odio.Limits(max_depth=3))
+
+
+def test_limits_text():
+    nested = odio.P("veni")
+    for _ in range(50):
+        nested = odio.Span(nested)
+    f = io.BytesIO()
+    with odio.create_text(f) as txt:
+        txt.append(odio.P("vidi"), odio.P(nested))
+    data = f.getvalue()
+
+    limits = odio.Limits(max_depth=20)
+    with pytest.raises(odio.LimitExceeded, match="nested more than 20"):
+        list(odio.iter_text(io.BytesIO(data), limits=limits))
+    with pytest.raises(odio.LimitExceeded, match="nested more than 20"):
+        odio.parse_text(io.BytesIO(data), limits)
+    assert (
+        len(list(odio.iter_text(io.BytesIO(data), limits=odio.Limits(max_depth=100))))
+        == 2
+    )
+
+
+def test_aggregate_spreadsheet():
+    rows = [
+        ["Amount", "Account", "Amount"],
+        [1.5, "a", 1.5],
+        [2.0, "b", None, None, 7.0],
+        [-4.0, "a", "x"],
+        [1.5, None, 1.5],
+    ]
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f, flat=True) as sheet:
+        sheet.append_table("Ledger", rows)
+        sheet.append_sparse_table("Sparse", {(0, 0): 2.5, (10, 3): 2.5})
+        sheet.append_table("Other", [[1.0]])
+    # Repeat every row, and check that the repeats are counted
+    data = f.getvalue().replace(
+        b"<table:table-row>", b'<table:table-row table:number-rows-repeated="3">'
+    )
+
+    specs = {
+        "Ledger": {0: ["sum", "count", "min", "max", "distinct"], 1: ["distinct"]},
+        "Sparse": {0: ["sum"], 1: ["count"], 2: ["count", "sum"], 3: ["max"]},
+        "Missing": {0: ["count"]},
+    }
+    aggregates = odio.aggregate_spreadsheet(io.BytesIO(data), specs)
+    ledger = aggregates["Ledger"]
+    assert ledger[0].count == 15
+    assert ledger[0].sum == 3 * (1.5 + 2.0 - 4.0 + 1.5)
+    assert (ledger[0].min, ledger[0].max, ledger[0].distinct) == (-4.0, 2.0, 4)
+    assert (ledger[1].count, ledger[1].distinct) == (None, 3)
+    assert repr(ledger[1]) == "odio.v1_2.ColumnAggregate(distinct=3)"
+    sparse = aggregates["Sparse"]
+    assert sparse[0].sum == 7.5
+    assert sparse[1].count == 0
+    assert (sparse[2].count, sparse[2].sum) == (0, 0.0)
+    assert sparse[3].max == 2.5
+    assert aggregates["Missing"][0].count == 0
+
+    with pytest.raises(Exception, match="median"):
+        odio.aggregate_spreadsheet(io.BytesIO(data), {"Ledger": {0: ["median"]}})
+
+
+def test_aggregate_formulas():
+    # Formulas are counted, and distinct ones told apart, but they aren't numbers
+    rows = [[odio.Formula("=1+1")], [odio.Formula("=1+1")], [odio.Formula("=2")], [3.0]]
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Plan", rows)
+
+    specs = {"Plan": {0: ["count", "sum", "distinct"]}}
+    column = odio.aggregate_spreadsheet(io.BytesIO(f.getvalue()), specs)["Plan"][0]
+    assert (column.count, column.sum, column.distinct) == (4, 3.0, 3)
+
+
+def test_aggregate_decimal_sum():
+    # A column of currency values sums to an exact Decimal
+    money = odio.Style(currency="GBP", decimal_places=2)
+    rows = [[odio.Cell(decimal.Decimal("0.10"), money), 0.1] for _ in range(10)]
+    rows.append([None, odio.Cell(decimal.Decimal("0.10"), money)])
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f) as sheet:
+        sheet.append_table("Ledger", rows)
+
+    specs = {"Ledger": {0: ["sum", "min"], 1: ["sum"]}}
+    ledger = odio.aggregate_spreadsheet(io.BytesIO(f.getvalue()), specs)["Ledger"]
+    assert ledger[0].sum == decimal.Decimal("1.00")
+    assert isinstance(ledger[0].sum, decimal.Decimal)
+    assert ledger[0].min == decimal.Decimal("0.10")
+    assert ledger[1].sum == pytest.approx(1.1)
+    assert isinstance(ledger[1].sum, float)
+
+
+def test_flat_spreadsheet(tmpdir):
+    style = odio.Style(bold=True)
+    row = ["veni, vidi, vici", 0.3, odio.Cell(5, style), True]
+    fname = str(tmpdir.join("actual.fods"))
+    with open(fname, "wb") as f, odio.create_spreadsheet(f, flat=True) as sheet:
+        sheet.append_table("Plan", [row])
+
+    with open(fname, "rb") as f:
+        data = f.read()
+    dom = parseString(data)
+    root = dom.documentElement
+    assert root.tagName == "office:document"
+    assert root.getAttribute("office:mimetype") == (
+        "application/vnd.oasis.opendocument.spreadsheet"
+    )
+    styles = dom.getElementsByTagName("style:style")
+    assert {e.getAttribute("style:name") for e in styles} == {"cell_date", "ce1"}
+
+    with open(fname, "rb") as f:
+        sheet = odio.parse_spreadsheet(f)
+    assert sheet.tables[0].rows == [["veni, vidi, vici", 0.3, 5.0, True]]
+
+    # Flat documents can be read from a pipe, as they don't need to seek
+    tables = [(n, list(rows)) for n, rows in odio.iter_spreadsheet(Unseekable(data))]
+    assert tables == [("Plan", [("veni, vidi, vici", 0.3, 5.0, True)])]
+
+    info = odio.inspect_spreadsheet(Unseekable(data))
+    assert info.version == "1.2"
+    assert info.meta == {"meta:generator": "Odio"}
+    assert info.tables[0].value_types == {"string": 1, "float": 2, "boolean": 1}
+
+
+def test_flat_text(tmpdir):
+    nodes = [
+        odio.H("Book One"),
+        odio.P("From my grandfather ", odio.Span("Verus"), " I learned."),
+    ]
+    fname = str(tmpdir.join("actual.fodt"))
+    with open(fname, "wb") as f, odio.create_text(f, flat=True) as txt:
+        txt.append(*nodes)
+
+    with open(fname, "rb") as f:
+        assert odio.parse_text(f).nodes == nodes
+    with open(fname, "rb") as f:
+        data = f.read()
+    assert odio.extract_text(Unseekable(data)) == (
+        "Book One\nFrom my grandfather Verus I learned.\n"
+    )
+
+    with pytest.raises(Exception, match="Flat documents"):
+        odio.create_text(io.BytesIO(), "1.1", flat=True)
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_validate(flat):
+    f = io.BytesIO()
+    with odio.create_spreadsheet(f, flat=flat, validate=True) as sheet:
+        sheet.append_table(
+            "Plan",
+            [["veni", 0.3, odio.Cell(5, odio.Style(bold=True, currency="GBP"))]],
+        )
+    f.seek(0)
+    tables = [(n, list(rows)) for n, rows in odio.iter_spreadsheet(f, validate=True)]
+    assert tables[0][0] == "Plan"
+
+    f = io.BytesIO()
+    with odio.create_text(f, flat=flat, validate=True) as txt:
+        txt.append(odio.P("From my grandfather ", odio.Span("Verus")))
+        with pytest.raises(odio.ValidationError, match="'text:h' isn't allowed"):
+            txt.append(odio.P(odio.H("Book One")))
+
+
+def test_validate_read():
+    content = (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<office:document-content office:version="1.2">\n'
+        "<office:body><office:spreadsheet><table:table>\n"
+        "<table:table-row><table:table-cell office:value-type='bogus'/>"
+        "</table:table-row>\n"
+        "</table:table></office:spreadsheet></office:body>\n"
+        "</office:document-content>"
+    )
+    f = io.BytesIO(content.encode("utf8"))
+    assert len(list(odio.iter_spreadsheet(f))) == 1
+
+    f = io.BytesIO(content.encode("utf8"))
+    with pytest.raises(odio.ValidationError, match="Line 4: The value 'bogus'"):
+        for name, rows in odio.iter_spreadsheet(f, validate=True):
+            list(rows)
+
+
+def test_text_elements(tmpdir):
+    nodes = [
+        odio.List(
+            odio.ListItem(
+                odio.P("veni", odio.S(text_c="2"), "vidi", odio.Tab(), "vici")
+            ),
+            odio.ListItem(odio.P(odio.A("Rome", xlink_href="https://example.com"))),
+            text_style_name="L1",
+        ),
+        odio.P("Line one", odio.LineBreak(), "line two"),
+    ]
+    assert nodes[0].to_xml() == (
+        '<text:list text:style-name="L1"><text:list-item>'
+        '<text:p text:style-name="Text Body">veni<text:s text:c="2"/>vidi<text:tab/>'
+        "vici</text:p></text:list-item><text:list-item>"
+        '<text:p text:style-name="Text Body">'
+        '<text:a xlink:type="simple" xlink:href="https://example.com">Rome</text:a>'
+        "</text:p>"
+        "</text:list-item></text:list>"
+    )
+
+    fname = str(tmpdir.join("actual.odt"))
+    with open(fname, "wb") as f, odio.create_text(f, validate=True) as txt:
+        txt.append(*nodes)
+    with open(fname, "rb") as f:
+        assert odio.parse_text(f).nodes == nodes
+    with open(fname, "rb") as f:
+        assert list(odio.iter_text(f)) == nodes
+    assert repr(nodes[1]) == "odio.P('Line one', odio.LineBreak(), 'line two')"